@@ -188,6 +188,8 @@ def decompile_ncs(file_path: str | io.BufferedIOBase, actions: ActionsData) -> s
         cleanpass = None
         mainpass = None
         destroytree = None
+        from pykotor.resource.formats.ncs.dencs.node.token import Token
+        Token.clear_pools()
         import gc
         gc.collect()
 
@@ -97,19 +97,19 @@ class DoTypes(PrunedDepthFirstAdapter):
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         if not self.protoskipping and not self.skipdeadcode:
             self.stack.remove(2)
-            self.stack.push(Type(3))
+            self.stack.push(Type.get(3))
 
     def out_a_binary_command(self, node):
         from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         if not self.protoskipping and not self.skipdeadcode:
             if NodeUtils.is_equality_op(node):
-                if NodeUtils.get_type(node).equals(36):
+                if NodeUtils.get_type(node).type == 36:
                     sizep3 = sizep2 = NodeUtils.stack_size_to_pos(node.get_size())
                 else:
                     sizep3 = sizep2 = 1
                 sizeresult = 1
-                resulttype = Type(3)
+                resulttype = Type.get(3)
             elif NodeUtils.is_vector_allowed_op(node):
                 sizep3 = NodeUtils.get_param1_size(node)
                 sizep2 = NodeUtils.get_param2_size(node)
@@ -119,7 +119,7 @@ class DoTypes(PrunedDepthFirstAdapter):
                 sizep3 = 1
                 sizep2 = 1
                 sizeresult = 1
-                resulttype = Type(3)
+                resulttype = Type.get(3)
             self.stack.remove(sizep3 + sizep2)
             for i in range(sizeresult):
                 self.stack.push(resulttype)
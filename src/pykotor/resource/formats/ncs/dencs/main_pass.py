@@ -3,24 +3,25 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.analysis.pruned_depth_first_adapter import PrunedDepthFirstAdapter
+from pykotor.resource.formats.ncs.dencs.actions_data import ActionsData  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptutils.sub_script_state import SubScriptState  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.local_var_stack import LocalVarStack  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.node_analysis_data import NodeAnalysisData  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.subroutine_analysis_data import SubroutineAnalysisData  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.subroutine_state import SubroutineState  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_sub import ASub  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.scriptutils.sub_script_state import SubScriptState  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.stack.local_var_stack import LocalVarStack  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry
 
 class MainPass(PrunedDepthFirstAdapter):
     def __init__(self, state_or_nodedata=None, nodedata=None, subdata=None, actions=None):
         # MainPass extends PrunedDepthFirstAdapter in Java
         super().__init__()
-        from pykotor.resource.formats.ncs.dencs.actions_data import ActionsData  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptutils.sub_script_state import SubScriptState  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.stack.local_var_stack import LocalVarStack  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_analysis_data import NodeAnalysisData  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.subroutine_analysis_data import SubroutineAnalysisData  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.subroutine_state import SubroutineState  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         self.stack: LocalVarStack = LocalVarStack()
         self.skipdeadcode: bool = False
         self.backupstack: LocalVarStack | None = None
@@ -43,7 +44,7 @@ class MainPass(PrunedDepthFirstAdapter):
             self.actions: ActionsData | None = None
             self.state = SubScriptState(self.nodedata, self.subdata, self.stack)
             self.globals: bool = True
-            self.type: Type = Type(-1)
+            self.type: Type = Type.get(-1)
 
     def done(self):
         self.stack = None
@@ -74,15 +75,12 @@ class MainPass(PrunedDepthFirstAdapter):
 
     def default_in(self, node):
         """Called when entering any node during traversal."""
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         self.restore_stack_state(node)
         self.check_origins(node)
         if NodeUtils.is_command_node(node):
             self.skipdeadcode = not self.nodedata.process_code(node)
 
     def out_a_rsadd_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             var = Variable(NodeUtils.get_type(node))
             self.stack.push(var)
@@ -92,7 +90,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_copy_down_sp_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             copy = NodeUtils.stack_size_to_pos(node.get_size())
             loc = NodeUtils.stack_offset_to_pos(node.get_offset())
@@ -103,7 +100,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_copy_top_sp_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             varstruct = None
             copy = NodeUtils.stack_size_to_pos(node.get_size())
@@ -122,8 +118,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_const_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             aconst = Const.new_const(NodeUtils.get_type(node), NodeUtils.get_const_value(node))
             self.stack.push(aconst)
@@ -132,8 +126,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_action_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             entry = None
             remove = NodeUtils.action_remove_element_count(node, self.actions)
@@ -142,12 +134,12 @@ class MainPass(PrunedDepthFirstAdapter):
                 entry = self.remove_from_stack()
                 i += entry.size()
             type_val = NodeUtils.get_return_type(node, self.actions)
-            if type_val.equals(-16):
+            if type_val.type == -16:
                 for j in range(3):
                     var = Variable(4)
                     self.stack.push(var)
                 self.stack.structify(1, 3, self.subdata)
-            elif not type_val.equals(0):
+            elif type_val.type != 0:
                 var = Variable(type_val)
                 self.stack.push(var)
             var = None
@@ -157,7 +149,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_logii_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             self.remove_from_stack()
             self.remove_from_stack()
@@ -169,17 +160,14 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_binary_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             if NodeUtils.is_equality_op(node):
-                if NodeUtils.get_type(node).equals(36):
+                if NodeUtils.get_type(node).type == 36:
                     sizep3 = sizep2 = NodeUtils.stack_size_to_pos(node.get_size())
                 else:
                     sizep3 = sizep2 = 1
                 sizeresult = 1
-                resulttype = Type(3)
+                resulttype = Type.get(3)
             elif NodeUtils.is_vector_allowed_op(node):
                 sizep3 = NodeUtils.get_param1_size(node)
                 sizep2 = NodeUtils.get_param2_size(node)
@@ -189,7 +177,7 @@ class MainPass(PrunedDepthFirstAdapter):
                 sizep3 = 1
                 sizep2 = 1
                 sizeresult = 1
-                resulttype = Type(3)
+                resulttype = Type.get(3)
             # Industry standard solution: Defensive programming - store working copy before critical operation
             # This prevents stack restoration from interfering with the operation
             required_size = sizep3 + sizep2
@@ -197,12 +185,12 @@ class MainPass(PrunedDepthFirstAdapter):
             if stack_snapshot_size < required_size:
                 raise RuntimeError(
                     f"Stack underflow in binary command: need {required_size} items, but stack has {stack_snapshot_size} items. "
-                    f"Stack contents: {[str(entry) for entry in self.stack.stack]}, "
+                    f"Stack contents: {[str(entry) for entry in reversed(self.stack.stack)]}, "
                     f"backupstack size: {self.backupstack.size() if self.backupstack else 0}"
                 )
             # Store a working copy of stack entries to prevent restoration from clearing them
             # This is a defensive programming pattern used in critical sections
-            working_stack_entries = list(self.stack.stack[:required_size])
+            working_stack_entries = self.stack.stack[:-required_size - 1:-1]
             # Remove items from stack using the working copy to ensure consistency
             for i in range(required_size):
                 if i < len(working_stack_entries):
@@ -210,10 +198,9 @@ class MainPass(PrunedDepthFirstAdapter):
                     # This prevents stack restoration from interfering
                     entry = working_stack_entries[i]
                     # Remove from actual stack to maintain state
-                    if i < len(self.stack.stack) and self.stack.stack[0] == entry:
-                        self.stack.stack.pop(0)
+                    if i < len(self.stack.stack) and self.stack.stack[-1] == entry:
+                        self.stack.drop()
                     # Handle placeholder variables after removal
-                    from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
                     if isinstance(entry, Variable) and entry.is_placeholder(self.stack):
                         self.state.transform_placeholder_variable_removed(entry)
                 else:
@@ -224,7 +211,6 @@ class MainPass(PrunedDepthFirstAdapter):
                             f"Stack was checked to have {stack_snapshot_size} items initially."
                         )
                     entry = self.stack.remove()
-                    from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
                     if isinstance(entry, Variable) and entry.is_placeholder(self.stack):
                         self.state.transform_placeholder_variable_removed(entry)
             for j in range(sizeresult):
@@ -243,8 +229,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_move_sp_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             self.state.transform_move_sp(node)
             self.backupstack = self.stack.clone()
@@ -297,7 +281,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_destruct_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             self.state.transform_destruct(node)
             removesize = NodeUtils.stack_size_to_pos(node.get_size_rem())
@@ -308,7 +291,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_copy_top_bp_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             varstruct = None
             copy = NodeUtils.stack_size_to_pos(node.get_size())
@@ -329,7 +311,6 @@ class MainPass(PrunedDepthFirstAdapter):
             self.state.transform_dead_code(node)
 
     def out_a_copy_down_bp_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if not self.skipdeadcode:
             copy = NodeUtils.stack_size_to_pos(node.get_size())
             loc = NodeUtils.stack_offset_to_pos(node.get_offset())
@@ -366,7 +347,6 @@ class MainPass(PrunedDepthFirstAdapter):
 
     def remove_from_stack(self):
         """Helper method to remove an entry from the stack and handle placeholder variables."""
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
         if not self.stack.stack:
             # Stack is empty - this shouldn't happen, but let's provide better error info
             raise RuntimeError(f"Cannot remove from empty stack. Stack size: {self.stack.size()}, skipdeadcode: {self.skipdeadcode}")
@@ -377,7 +357,6 @@ class MainPass(PrunedDepthFirstAdapter):
 
     def store_stack_state(self, node, isdead: bool):
         """Store the current stack state for the given node."""
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if NodeUtils.is_store_stack_node(node):
             self.nodedata.set_stack(node, self.stack.clone(), False)
 
@@ -15,7 +15,7 @@ class AActionCmd(PCmd):
         self._action_command: PActionCommand | None = None
 
     def clone(self):
-        return AActionCmd(self.clone_node(self._action_command))
+        return AActionCmd(self.clone_maybe(self._action_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_action_cmd(self)
@@ -24,13 +24,7 @@ class AActionCmd(PCmd):
         return self._action_command
 
     def set_action_command(self, node: PActionCommand | None):
-        if self._action_command is not None:
-            self._action_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._action_command = node
+        self._action_command = self._reparent(self._action_command, node)
 
     def remove_child(self, child: Node):
         if self._action_command == child:
@@ -39,9 +33,3 @@ class AActionCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._action_command == old_child:
             self.set_action_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
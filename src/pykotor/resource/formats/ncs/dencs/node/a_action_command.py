@@ -23,12 +23,12 @@ class AActionCommand(PActionCommand):
 
     def clone(self):
         return AActionCommand(
-            self.clone_node(self._action),
-            self.clone_node(self._pos),
-            self.clone_node(self._type),
-            self.clone_node(self._id),
-            self.clone_node(self._arg_count),
-            self.clone_node(self._semi)
+            self.clone_maybe(self._action),
+            self.clone_maybe(self._pos),
+            self.clone_maybe(self._type),
+            self.clone_maybe(self._id),
+            self.clone_maybe(self._arg_count),
+            self.clone_maybe(self._semi)
         )
 
     def apply(self, sw: Analysis):
@@ -38,73 +38,37 @@ class AActionCommand(PActionCommand):
         return self._action
 
     def set_action(self, node: TAction | None):
-        if self._action is not None:
-            self._action.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._action = node
+        self._action = self._reparent(self._action, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_id(self) -> TIntegerConstant | None:
         return self._id
 
     def set_id(self, node: TIntegerConstant | None):
-        if self._id is not None:
-            self._id.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._id = node
+        self._id = self._reparent(self._id, node)
 
     def get_arg_count(self) -> TIntegerConstant | None:
         return self._arg_count
 
     def set_arg_count(self, node: TIntegerConstant | None):
-        if self._arg_count is not None:
-            self._arg_count.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._arg_count = node
+        self._arg_count = self._reparent(self._arg_count, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._action == child:
@@ -143,9 +107,3 @@ class AActionCommand(PActionCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
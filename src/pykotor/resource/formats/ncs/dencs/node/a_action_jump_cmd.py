@@ -40,10 +40,10 @@ class AActionJumpCmd(PCmd):
 
     def clone(self):
         return AActionJumpCmd(
-            self.clone_node(self._storeStateCommand),
-            self.clone_node(self._jumpCommand),
-            self.clone_node(self._commandBlock),
-            self.clone_node(self._return),
+            self.clone_maybe(self._storeStateCommand),
+            self.clone_maybe(self._jumpCommand),
+            self.clone_maybe(self._commandBlock),
+            self.clone_maybe(self._return),
         )
 
     def apply(self, sw: Analysis):
@@ -53,49 +53,25 @@ class AActionJumpCmd(PCmd):
         return self._storeStateCommand
 
     def set_storeStateCommand(self, node: PStoreStateCommand | None):
-        if self._storeStateCommand is not None:
-            self._storeStateCommand.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._storeStateCommand = node
+        self._storeStateCommand = self._reparent(self._storeStateCommand, node)
 
     def get_jumpCommand(self) -> PJumpCommand | None:
         return self._jumpCommand
 
     def set_jumpCommand(self, node: PJumpCommand | None):
-        if self._jumpCommand is not None:
-            self._jumpCommand.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._jumpCommand = node
+        self._jumpCommand = self._reparent(self._jumpCommand, node)
 
     def get_commandBlock(self) -> PCommandBlock | None:
         return self._commandBlock
 
     def set_commandBlock(self, node: PCommandBlock | None):
-        if self._commandBlock is not None:
-            self._commandBlock.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._commandBlock = node
+        self._commandBlock = self._reparent(self._commandBlock, node)
 
     def get_return(self) -> PReturn | None:
         return self._return
 
     def set_return(self, node: PReturn | None):
-        if self._return is not None:
-            self._return.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._return = node
+        self._return = self._reparent(self._return, node)
 
     def __str__(self) -> str:
         return (
@@ -133,11 +109,6 @@ class AActionJumpCmd(PCmd):
             self.set_return(new_child)  # type: ignore
             return
 
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
     def to_string(self, node):
         if node is not None:
             return str(node)
@@ -21,7 +21,7 @@ class AAddBinaryOp(PBinaryOp):
             self.set_add(add)
 
     def clone(self):
-        return AAddBinaryOp(self.clone_node(self._add))
+        return AAddBinaryOp(self.clone_maybe(self._add))
 
     def apply(self, sw: Analysis):
         sw.case_a_add_binary_op(self)
@@ -30,16 +30,10 @@ class AAddBinaryOp(PBinaryOp):
         return self._add
 
     def set_add(self, node: TAdd | None):
-        if self._add is not None:
-            self._add.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._add = node
+        self._add = self._reparent(self._add, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._add)
+        return str(self._add) if self._add is not None else ""
 
     def remove_child(self, child: Node):
         if self._add == child:
@@ -50,13 +44,3 @@ class AAddBinaryOp(PBinaryOp):
         if self._add == old_child:
             self.set_add(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AAddVarCmd(PCmd):
             self.set_rsaddCommand(rsaddCommand)
 
     def clone(self):
-        return AAddVarCmd(self.clone_node(self._rsaddCommand))
+        return AAddVarCmd(self.clone_maybe(self._rsaddCommand))
 
     def apply(self, sw: Analysis):
         sw.case_a_add_var_cmd(self)
@@ -30,16 +30,10 @@ class AAddVarCmd(PCmd):
         return self._rsaddCommand
 
     def set_rsaddCommand(self, node: PRsaddCommand | None):
-        if self._rsaddCommand is not None:
-            self._rsaddCommand.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._rsaddCommand = node
+        self._rsaddCommand = self._reparent(self._rsaddCommand, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._rsaddCommand)
+        return str(self._rsaddCommand) if self._rsaddCommand is not None else ""
 
     def remove_child(self, child: Node):
         if self._rsaddCommand == child:
@@ -50,13 +44,3 @@ class AAddVarCmd(PCmd):
         if self._rsaddCommand == old_child:
             self.set_rsaddCommand(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AAndLogiiOp(PLogiiOp):
             self.set_logandii(logandii)
 
     def clone(self):
-        return AAndLogiiOp(self.clone_node(self._logandii))
+        return AAndLogiiOp(self.clone_maybe(self._logandii))
 
     def apply(self, sw: Analysis):
         sw.case_a_and_logii_op(self)
@@ -30,16 +30,10 @@ class AAndLogiiOp(PLogiiOp):
         return self._logandii
 
     def set_logandii(self, node: TLogandii | None):
-        if self._logandii is not None:
-            self._logandii.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._logandii = node
+        self._logandii = self._reparent(self._logandii, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._logandii)
+        return str(self._logandii) if self._logandii is not None else ""
 
     def remove_child(self, child: Node):
         if self._logandii == child:
@@ -50,13 +44,3 @@ class AAndLogiiOp(PLogiiOp):
         if self._logandii == old_child:
             self.set_logandii(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
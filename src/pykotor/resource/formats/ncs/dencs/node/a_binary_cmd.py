@@ -15,7 +15,7 @@ class ABinaryCmd(PCmd):
         self._binary_command: PBinaryCommand | None = None
 
     def clone(self):
-        return ABinaryCmd(self.clone_node(self._binary_command))
+        return ABinaryCmd(self.clone_maybe(self._binary_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_binary_cmd(self)
@@ -24,13 +24,7 @@ class ABinaryCmd(PCmd):
         return self._binary_command
 
     def set_binary_command(self, node: PBinaryCommand | None):
-        if self._binary_command is not None:
-            self._binary_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._binary_command = node
+        self._binary_command = self._reparent(self._binary_command, node)
 
     def remove_child(self, child: Node):
         if self._binary_command == child:
@@ -39,8 +33,3 @@ class ABinaryCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._binary_command == old_child:
             self.set_binary_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
@@ -21,7 +21,7 @@ class ABitAndLogiiOp(PLogiiOp):
             self.set_boolandii(boolandii)
 
     def clone(self):
-        return ABitAndLogiiOp(self.clone_node(self._boolandii))
+        return ABitAndLogiiOp(self.clone_maybe(self._boolandii))
 
     def apply(self, sw: Analysis):
         sw.case_a_bit_and_logii_op(self)
@@ -30,16 +30,10 @@ class ABitAndLogiiOp(PLogiiOp):
         return self._boolandii
 
     def set_boolandii(self, node: TBoolandii | None):
-        if self._boolandii is not None:
-            self._boolandii.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._boolandii = node
+        self._boolandii = self._reparent(self._boolandii, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._boolandii)
+        return str(self._boolandii) if self._boolandii is not None else ""
 
     def remove_child(self, child: Node):
         if self._boolandii == child:
@@ -50,13 +44,3 @@ class ABitAndLogiiOp(PLogiiOp):
         if self._boolandii == old_child:
             self.set_boolandii(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -15,7 +15,7 @@ class ABpCmd(PCmd):
         self._bp_command: PBpCommand | None = None
 
     def clone(self):
-        return ABpCmd(self.clone_node(self._bp_command))
+        return ABpCmd(self.clone_maybe(self._bp_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_bp_cmd(self)
@@ -24,13 +24,7 @@ class ABpCmd(PCmd):
         return self._bp_command
 
     def set_bp_command(self, node: PBpCommand | None):
-        if self._bp_command is not None:
-            self._bp_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._bp_command = node
+        self._bp_command = self._reparent(self._bp_command, node)
 
     def remove_child(self, child: Node):
         if self._bp_command == child:
@@ -39,8 +33,3 @@ class ABpCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._bp_command == old_child:
             self.set_bp_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
@@ -21,10 +21,10 @@ class ABpCommand(PBpCommand):
 
     def clone(self):
         return ABpCommand(
-            self.clone_node(self._bp_op),  # type: ignore
-            self.clone_node(self._pos),  # type: ignore
-            self.clone_node(self._type),  # type: ignore
-            self.clone_node(self._semi)  # type: ignore
+            self.clone_maybe(self._bp_op),  # type: ignore
+            self.clone_maybe(self._pos),  # type: ignore
+            self.clone_maybe(self._type),  # type: ignore
+            self.clone_maybe(self._semi)  # type: ignore
         )
 
     def apply(self, sw: Analysis):
@@ -34,49 +34,25 @@ class ABpCommand(PBpCommand):
         return self._bp_op
 
     def set_bp_op(self, node: PBpOp | None):
-        if self._bp_op is not None:
-            self._bp_op.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._bp_op = node
+        self._bp_op = self._reparent(self._bp_op, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._bp_op == child:
@@ -103,8 +79,3 @@ class ABpCommand(PBpCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
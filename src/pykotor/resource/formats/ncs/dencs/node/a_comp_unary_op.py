@@ -21,7 +21,7 @@ class ACompUnaryOp(PUnaryOp):
             self.set_comp(comp)
 
     def clone(self):
-        return ACompUnaryOp(self.clone_node(self._comp))
+        return ACompUnaryOp(self.clone_maybe(self._comp))
 
     def apply(self, sw: Analysis):
         sw.case_a_comp_unary_op(self)
@@ -30,16 +30,10 @@ class ACompUnaryOp(PUnaryOp):
         return self._comp
 
     def set_comp(self, node: TComp | None):
-        if self._comp is not None:
-            self._comp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._comp = node
+        self._comp = self._reparent(self._comp, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._comp)
+        return str(self._comp) if self._comp is not None else ""
 
     def remove_child(self, child: Node):
         if self._comp == child:
@@ -50,13 +44,3 @@ class ACompUnaryOp(PUnaryOp):
         if self._comp == old_child:
             self.set_comp(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -15,7 +15,7 @@ class ACondJumpCmd(PCmd):
         self._conditional_jump_command: PConditionalJumpCommand | None = None
 
     def clone(self):
-        return ACondJumpCmd(self.clone_node(self._conditional_jump_command))
+        return ACondJumpCmd(self.clone_maybe(self._conditional_jump_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_cond_jump_cmd(self)
@@ -24,13 +24,7 @@ class ACondJumpCmd(PCmd):
         return self._conditional_jump_command
 
     def set_conditional_jump_command(self, node: PConditionalJumpCommand | None):
-        if self._conditional_jump_command is not None:
-            self._conditional_jump_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._conditional_jump_command = node
+        self._conditional_jump_command = self._reparent(self._conditional_jump_command, node)
 
     def remove_child(self, child: Node):
         if self._conditional_jump_command == child:
@@ -39,9 +33,3 @@ class ACondJumpCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._conditional_jump_command == old_child:
             self.set_conditional_jump_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
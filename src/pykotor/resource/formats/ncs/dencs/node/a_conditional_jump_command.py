@@ -22,11 +22,11 @@ class AConditionalJumpCommand(PConditionalJumpCommand):
 
     def clone(self):
         return AConditionalJumpCommand(
-            self.clone_node(self._jump_if),
-            self.clone_node(self._pos),
-            self.clone_node(self._type),
-            self.clone_node(self._offset),
-            self.clone_node(self._semi)
+            self.clone_maybe(self._jump_if),
+            self.clone_maybe(self._pos),
+            self.clone_maybe(self._type),
+            self.clone_maybe(self._offset),
+            self.clone_maybe(self._semi)
         )
 
     def apply(self, sw: Analysis):
@@ -36,61 +36,31 @@ class AConditionalJumpCommand(PConditionalJumpCommand):
         return self._jump_if
 
     def set_jump_if(self, node: PJumpIf | None):
-        if self._jump_if is not None:
-            self._jump_if.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._jump_if = node
+        self._jump_if = self._reparent(self._jump_if, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_offset(self) -> TIntegerConstant | None:
         return self._offset
 
     def set_offset(self, node: TIntegerConstant | None):
-        if self._offset is not None:
-            self._offset.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._offset = node
+        self._offset = self._reparent(self._offset, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._jump_if == child:
@@ -123,9 +93,3 @@ class AConditionalJumpCommand(PConditionalJumpCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
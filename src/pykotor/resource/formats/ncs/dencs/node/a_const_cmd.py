@@ -15,7 +15,7 @@ class AConstCmd(PCmd):
         self._const_command: PConstCommand | None = None
 
     def clone(self):
-        return AConstCmd(self.clone_node(self._const_command))
+        return AConstCmd(self.clone_maybe(self._const_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_const_cmd(self)
@@ -24,13 +24,7 @@ class AConstCmd(PCmd):
         return self._const_command
 
     def set_const_command(self, node: PConstCommand | None):
-        if self._const_command is not None:
-            self._const_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._const_command = node
+        self._const_command = self._reparent(self._const_command, node)
 
     def remove_child(self, child: Node):
         if self._const_command == child:
@@ -39,9 +33,3 @@ class AConstCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._const_command == old_child:
             self.set_const_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
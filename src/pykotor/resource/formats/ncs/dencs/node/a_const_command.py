@@ -23,11 +23,11 @@ class AConstCommand(PConstCommand):
 
     def clone(self):
         return AConstCommand(
-            self.clone_node(self._const),
-            self.clone_node(self._pos),
-            self.clone_node(self._type),
-            self.clone_node(self._constant),
-            self.clone_node(self._semi)
+            self.clone_maybe(self._const),
+            self.clone_maybe(self._pos),
+            self.clone_maybe(self._type),
+            self.clone_maybe(self._constant),
+            self.clone_maybe(self._semi)
         )
 
     def apply(self, sw: Analysis):
@@ -37,61 +37,31 @@ class AConstCommand(PConstCommand):
         return self._const
 
     def set_const(self, node: TConst | None):
-        if self._const is not None:
-            self._const.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._const = node
+        self._const = self._reparent(self._const, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_constant(self) -> PConstant | None:
         return self._constant
 
     def set_constant(self, node: PConstant | None):
-        if self._constant is not None:
-            self._constant.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._constant = node
+        self._constant = self._reparent(self._constant, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._const == child:
@@ -124,9 +94,3 @@ class AConstCommand(PConstCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
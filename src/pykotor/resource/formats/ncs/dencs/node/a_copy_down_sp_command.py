@@ -23,12 +23,12 @@ class ACopyDownSpCommand(PCopyDownSpCommand):
 
     def clone(self):
         return ACopyDownSpCommand(
-            self.clone_node(self._cpdownsp),
-            self.clone_node(self._pos),
-            self.clone_node(self._type),
-            self.clone_node(self._offset),
-            self.clone_node(self._size),
-            self.clone_node(self._semi)
+            self.clone_maybe(self._cpdownsp),
+            self.clone_maybe(self._pos),
+            self.clone_maybe(self._type),
+            self.clone_maybe(self._offset),
+            self.clone_maybe(self._size),
+            self.clone_maybe(self._semi)
         )
 
     def apply(self, sw: Analysis):
@@ -38,73 +38,37 @@ class ACopyDownSpCommand(PCopyDownSpCommand):
         return self._cpdownsp
 
     def set_cpdownsp(self, node: TCpdownsp | None):
-        if self._cpdownsp is not None:
-            self._cpdownsp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._cpdownsp = node
+        self._cpdownsp = self._reparent(self._cpdownsp, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_offset(self) -> TIntegerConstant | None:
         return self._offset
 
     def set_offset(self, node: TIntegerConstant | None):
-        if self._offset is not None:
-            self._offset.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._offset = node
+        self._offset = self._reparent(self._offset, node)
 
     def get_size(self) -> TIntegerConstant | None:
         return self._size
 
     def set_size(self, node: TIntegerConstant | None):
-        if self._size is not None:
-            self._size.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._size = node
+        self._size = self._reparent(self._size, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._cpdownsp == child:
@@ -143,9 +107,3 @@ class ACopyDownSpCommand(PCopyDownSpCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -23,12 +23,12 @@ class ACopyTopBpCommand(PCopyTopBpCommand):
 
     def clone(self):
         return ACopyTopBpCommand(
-            self.clone_node(self._cptopbp),  # type: ignore
-            self.clone_node(self._pos),  # type: ignore
-            self.clone_node(self._type),  # type: ignore
-            self.clone_node(self._offset),  # type: ignore
-            self.clone_node(self._size),  # type: ignore
-            self.clone_node(self._semi)  # type: ignore
+            self.clone_maybe(self._cptopbp),  # type: ignore
+            self.clone_maybe(self._pos),  # type: ignore
+            self.clone_maybe(self._type),  # type: ignore
+            self.clone_maybe(self._offset),  # type: ignore
+            self.clone_maybe(self._size),  # type: ignore
+            self.clone_maybe(self._semi)  # type: ignore
         )
 
     def apply(self, sw: Analysis):
@@ -38,73 +38,37 @@ class ACopyTopBpCommand(PCopyTopBpCommand):
         return self._cptopbp
 
     def set_cptopbp(self, node: TCptopbp | None):
-        if self._cptopbp is not None:
-            self._cptopbp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._cptopbp = node
+        self._cptopbp = self._reparent(self._cptopbp, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_offset(self) -> TIntegerConstant | None:
         return self._offset
 
     def set_offset(self, node: TIntegerConstant | None):
-        if self._offset is not None:
-            self._offset.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._offset = node
+        self._offset = self._reparent(self._offset, node)
 
     def get_size(self) -> TIntegerConstant | None:
         return self._size
 
     def set_size(self, node: TIntegerConstant | None):
-        if self._size is not None:
-            self._size.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._size = node
+        self._size = self._reparent(self._size, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._cptopbp == child:
@@ -143,9 +107,3 @@ class ACopyTopBpCommand(PCopyTopBpCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -15,7 +15,7 @@ class ACopytopbpCmd(PCmd):
         self._copy_top_bp_command: PCopyTopBpCommand | None = None
 
     def clone(self):
-        return ACopytopbpCmd(self.clone_node(self._copy_top_bp_command))
+        return ACopytopbpCmd(self.clone_maybe(self._copy_top_bp_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_copytopbp_cmd(self)
@@ -24,13 +24,7 @@ class ACopytopbpCmd(PCmd):
         return self._copy_top_bp_command
 
     def set_copy_top_bp_command(self, node: PCopyTopBpCommand | None):
-        if self._copy_top_bp_command is not None:
-            self._copy_top_bp_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._copy_top_bp_command = node
+        self._copy_top_bp_command = self._reparent(self._copy_top_bp_command, node)
 
     def remove_child(self, child: Node):
         if self._copy_top_bp_command == child:
@@ -39,9 +33,3 @@ class ACopytopbpCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._copy_top_bp_command == old_child:
             self.set_copy_top_bp_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -21,7 +21,7 @@ class ADecibpStackOp(PStackOp):
             self.set_decibp(decibp)
 
     def clone(self):
-        return ADecibpStackOp(self.clone_node(self._decibp))
+        return ADecibpStackOp(self.clone_maybe(self._decibp))
 
     def apply(self, sw: Analysis):
         sw.case_a_decibp_stack_op(self)
@@ -30,16 +30,10 @@ class ADecibpStackOp(PStackOp):
         return self._decibp
 
     def set_decibp(self, node: TDecibp | None):
-        if self._decibp is not None:
-            self._decibp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._decibp = node
+        self._decibp = self._reparent(self._decibp, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._decibp)
+        return str(self._decibp) if self._decibp is not None else ""
 
     def remove_child(self, child: Node):
         if self._decibp == child:
@@ -50,13 +44,3 @@ class ADecibpStackOp(PStackOp):
         if self._decibp == old_child:
             self.set_decibp(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
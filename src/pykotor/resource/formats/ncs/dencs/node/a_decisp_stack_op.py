@@ -21,7 +21,7 @@ class ADecispStackOp(PStackOp):
             self.set_decisp(decisp)
 
     def clone(self):
-        return ADecispStackOp(self.clone_node(self._decisp))
+        return ADecispStackOp(self.clone_maybe(self._decisp))
 
     def apply(self, sw: Analysis):
         sw.case_a_decisp_stack_op(self)
@@ -30,16 +30,10 @@ class ADecispStackOp(PStackOp):
         return self._decisp
 
     def set_decisp(self, node: TDecisp | None):
-        if self._decisp is not None:
-            self._decisp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._decisp = node
+        self._decisp = self._reparent(self._decisp, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._decisp)
+        return str(self._decisp) if self._decisp is not None else ""
 
     def remove_child(self, child: Node):
         if self._decisp == child:
@@ -50,13 +44,3 @@ class ADecispStackOp(PStackOp):
         if self._decisp == old_child:
             self.set_decisp(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
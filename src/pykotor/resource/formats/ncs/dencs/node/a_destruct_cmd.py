@@ -15,7 +15,7 @@ class ADestructCmd(PCmd):
         self._destruct_command: PDestructCommand | None = None
 
     def clone(self):
-        return ADestructCmd(self.clone_node(self._destruct_command))
+        return ADestructCmd(self.clone_maybe(self._destruct_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_destruct_cmd(self)
@@ -24,13 +24,7 @@ class ADestructCmd(PCmd):
         return self._destruct_command
 
     def set_destruct_command(self, node: PDestructCommand | None):
-        if self._destruct_command is not None:
-            self._destruct_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._destruct_command = node
+        self._destruct_command = self._reparent(self._destruct_command, node)
 
     def remove_child(self, child: Node):
         if self._destruct_command == child:
@@ -39,8 +33,3 @@ class ADestructCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._destruct_command == old_child:
             self.set_destruct_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
@@ -23,13 +23,13 @@ class ADestructCommand:
 
     def clone(self):
         return ADestructCommand(
-            self.clone_node(self._destruct),  # type: ignore
-            self.clone_node(self._pos),  # type: ignore
-            self.clone_node(self._type),  # type: ignore
-            self.clone_node(self._size_rem),  # type: ignore
-            self.clone_node(self._offset),  # type: ignore
-            self.clone_node(self._size_save),  # type: ignore
-            self.clone_node(self._semi)  # type: ignore
+            self.clone_maybe(self._destruct),  # type: ignore
+            self.clone_maybe(self._pos),  # type: ignore
+            self.clone_maybe(self._type),  # type: ignore
+            self.clone_maybe(self._size_rem),  # type: ignore
+            self.clone_maybe(self._offset),  # type: ignore
+            self.clone_maybe(self._size_save),  # type: ignore
+            self.clone_maybe(self._semi)  # type: ignore
         )
 
     def apply(self, sw: Analysis):
@@ -39,85 +39,43 @@ class ADestructCommand:
         return self._destruct
 
     def set_destruct(self, node: TDestruct | None):
-        if self._destruct is not None:
-            self._destruct.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._destruct = node
+        self._destruct = self._reparent(self._destruct, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_size_rem(self) -> TIntegerConstant | None:
         return self._size_rem
 
     def set_size_rem(self, node: TIntegerConstant | None):
-        if self._size_rem is not None:
-            self._size_rem.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._size_rem = node
+        self._size_rem = self._reparent(self._size_rem, node)
 
     def get_offset(self) -> TIntegerConstant | None:
         return self._offset
 
     def set_offset(self, node: TIntegerConstant | None):
-        if self._offset is not None:
-            self._offset.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._offset = node
+        self._offset = self._reparent(self._offset, node)
 
     def get_size_save(self) -> TIntegerConstant | None:
         return self._size_save
 
     def set_size_save(self, node: TIntegerConstant | None):
-        if self._size_save is not None:
-            self._size_save.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._size_save = node
+        self._size_save = self._reparent(self._size_save, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._destruct == child:
@@ -162,8 +120,3 @@ class ADestructCommand:
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
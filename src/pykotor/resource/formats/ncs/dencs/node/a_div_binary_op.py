@@ -21,7 +21,7 @@ class ADivBinaryOp(PBinaryOp):
             self.set_div(div)
 
     def clone(self):
-        return ADivBinaryOp(self.clone_node(self._div))
+        return ADivBinaryOp(self.clone_maybe(self._div))
 
     def apply(self, sw: Analysis):
         sw.case_a_div_binary_op(self)
@@ -30,16 +30,10 @@ class ADivBinaryOp(PBinaryOp):
         return self._div
 
     def set_div(self, node: TDiv | None):
-        if self._div is not None:
-            self._div.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._div = node
+        self._div = self._reparent(self._div, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._div)
+        return str(self._div) if self._div is not None else ""
 
     def remove_child(self, child: Node):
         if self._div == child:
@@ -50,13 +44,3 @@ class ADivBinaryOp(PBinaryOp):
         if self._div == old_child:
             self.set_div(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AEqualBinaryOp(PBinaryOp):
             self.set_equal(equal)
 
     def clone(self):
-        return AEqualBinaryOp(self.clone_node(self._equal))
+        return AEqualBinaryOp(self.clone_maybe(self._equal))
 
     def apply(self, sw: Analysis):
         sw.case_a_equal_binary_op(self)
@@ -30,16 +30,10 @@ class AEqualBinaryOp(PBinaryOp):
         return self._equal
 
     def set_equal(self, node: TEqual | None):
-        if self._equal is not None:
-            self._equal.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._equal = node
+        self._equal = self._reparent(self._equal, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._equal)
+        return str(self._equal) if self._equal is not None else ""
 
     def remove_child(self, child: Node):
         if self._equal == child:
@@ -50,13 +44,3 @@ class AEqualBinaryOp(PBinaryOp):
         if self._equal == old_child:
             self.set_equal(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AExclOrLogiiOp(PLogiiOp):
             self.set_excorii(excorii)
 
     def clone(self):
-        return AExclOrLogiiOp(self.clone_node(self._excorii))
+        return AExclOrLogiiOp(self.clone_maybe(self._excorii))
 
     def apply(self, sw: Analysis):
         sw.case_a_excl_or_logii_op(self)
@@ -30,16 +30,10 @@ class AExclOrLogiiOp(PLogiiOp):
         return self._excorii
 
     def set_excorii(self, node: TExcorii | None):
-        if self._excorii is not None:
-            self._excorii.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._excorii = node
+        self._excorii = self._reparent(self._excorii, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._excorii)
+        return str(self._excorii) if self._excorii is not None else ""
 
     def remove_child(self, child: Node):
         if self._excorii == child:
@@ -50,13 +44,3 @@ class AExclOrLogiiOp(PLogiiOp):
         if self._excorii == old_child:
             self.set_excorii(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
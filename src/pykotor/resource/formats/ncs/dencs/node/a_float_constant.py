@@ -15,7 +15,7 @@ class AFloatConstant(PConstant):
         self._float_constant: TFloatConstant | None = None
 
     def clone(self):
-        return AFloatConstant(self.clone_node(self._float_constant))
+        return AFloatConstant(self.clone_maybe(self._float_constant))
 
     def apply(self, sw: Analysis):
         sw.case_a_float_constant(self)
@@ -24,13 +24,7 @@ class AFloatConstant(PConstant):
         return self._float_constant
 
     def set_float_constant(self, node: TFloatConstant | None):
-        if self._float_constant is not None:
-            self._float_constant.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._float_constant = node
+        self._float_constant = self._reparent(self._float_constant, node)
 
     def remove_child(self, child: Node):
         if self._float_constant == child:
@@ -39,9 +33,3 @@ class AFloatConstant(PConstant):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._float_constant == old_child:
             self.set_float_constant(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -21,7 +21,7 @@ class AGeqBinaryOp(PBinaryOp):
             self.set_geq(geq)
 
     def clone(self):
-        return AGeqBinaryOp(self.clone_node(self._geq))
+        return AGeqBinaryOp(self.clone_maybe(self._geq))
 
     def apply(self, sw: Analysis):
         sw.case_a_geq_binary_op(self)
@@ -30,16 +30,10 @@ class AGeqBinaryOp(PBinaryOp):
         return self._geq
 
     def set_geq(self, node: TGeq | None):
-        if self._geq is not None:
-            self._geq.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._geq = node
+        self._geq = self._reparent(self._geq, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._geq)
+        return str(self._geq) if self._geq is not None else ""
 
     def remove_child(self, child: Node):
         if self._geq == child:
@@ -50,13 +44,3 @@ class AGeqBinaryOp(PBinaryOp):
         if self._geq == old_child:
             self.set_geq(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AGtBinaryOp(PBinaryOp):
             self.set_gt(gt)
 
     def clone(self):
-        return AGtBinaryOp(self.clone_node(self._gt))
+        return AGtBinaryOp(self.clone_maybe(self._gt))
 
     def apply(self, sw: Analysis):
         sw.case_a_gt_binary_op(self)
@@ -30,16 +30,10 @@ class AGtBinaryOp(PBinaryOp):
         return self._gt
 
     def set_gt(self, node: TGt | None):
-        if self._gt is not None:
-            self._gt.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._gt = node
+        self._gt = self._reparent(self._gt, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._gt)
+        return str(self._gt) if self._gt is not None else ""
 
     def remove_child(self, child: Node):
         if self._gt == child:
@@ -50,13 +44,3 @@ class AGtBinaryOp(PBinaryOp):
         if self._gt == old_child:
             self.set_gt(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AIncibpStackOp(PStackOp):
             self.set_incibp(incibp)
 
     def clone(self):
-        return AIncibpStackOp(self.clone_node(self._incibp))
+        return AIncibpStackOp(self.clone_maybe(self._incibp))
 
     def apply(self, sw: Analysis):
         sw.case_a_incibp_stack_op(self)
@@ -30,16 +30,10 @@ class AIncibpStackOp(PStackOp):
         return self._incibp
 
     def set_incibp(self, node: TIncibp | None):
-        if self._incibp is not None:
-            self._incibp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._incibp = node
+        self._incibp = self._reparent(self._incibp, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._incibp)
+        return str(self._incibp) if self._incibp is not None else ""
 
     def remove_child(self, child: Node):
         if self._incibp == child:
@@ -50,13 +44,3 @@ class AIncibpStackOp(PStackOp):
         if self._incibp == old_child:
             self.set_incibp(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
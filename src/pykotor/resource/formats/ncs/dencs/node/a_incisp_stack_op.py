@@ -21,7 +21,7 @@ class AIncispStackOp(PStackOp):
             self.set_incisp(incisp)
 
     def clone(self):
-        return AIncispStackOp(self.clone_node(self._incisp))
+        return AIncispStackOp(self.clone_maybe(self._incisp))
 
     def apply(self, sw: Analysis):
         sw.case_a_incisp_stack_op(self)
@@ -30,16 +30,10 @@ class AIncispStackOp(PStackOp):
         return self._incisp
 
     def set_incisp(self, node: TIncisp | None):
-        if self._incisp is not None:
-            self._incisp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._incisp = node
+        self._incisp = self._reparent(self._incisp, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._incisp)
+        return str(self._incisp) if self._incisp is not None else ""
 
     def remove_child(self, child: Node):
         if self._incisp == child:
@@ -50,13 +44,3 @@ class AIncispStackOp(PStackOp):
         if self._incisp == old_child:
             self.set_incisp(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AInclOrLogiiOp(PLogiiOp):
             self.set_incorii(incorii)
 
     def clone(self):
-        return AInclOrLogiiOp(self.clone_node(self._incorii))
+        return AInclOrLogiiOp(self.clone_maybe(self._incorii))
 
     def apply(self, sw: Analysis):
         sw.case_a_incl_or_logii_op(self)
@@ -30,16 +30,10 @@ class AInclOrLogiiOp(PLogiiOp):
         return self._incorii
 
     def set_incorii(self, node: TIncorii | None):
-        if self._incorii is not None:
-            self._incorii.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._incorii = node
+        self._incorii = self._reparent(self._incorii, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._incorii)
+        return str(self._incorii) if self._incorii is not None else ""
 
     def remove_child(self, child: Node):
         if self._incorii == child:
@@ -50,13 +44,3 @@ class AInclOrLogiiOp(PLogiiOp):
         if self._incorii == old_child:
             self.set_incorii(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -15,7 +15,7 @@ class AIntConstant(PConstant):
         self._integer_constant: TIntegerConstant | None = None
 
     def clone(self):
-        return AIntConstant(self.clone_node(self._integer_constant))
+        return AIntConstant(self.clone_maybe(self._integer_constant))
 
     def apply(self, sw: Analysis):
         sw.case_a_int_constant(self)
@@ -24,13 +24,7 @@ class AIntConstant(PConstant):
         return self._integer_constant
 
     def set_integer_constant(self, node: TIntegerConstant | None):
-        if self._integer_constant is not None:
-            self._integer_constant.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._integer_constant = node
+        self._integer_constant = self._reparent(self._integer_constant, node)
 
     def remove_child(self, child: Node):
         if self._integer_constant == child:
@@ -39,9 +33,3 @@ class AIntConstant(PConstant):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._integer_constant == old_child:
             self.set_integer_constant(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
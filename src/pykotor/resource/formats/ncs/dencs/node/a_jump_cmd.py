@@ -15,7 +15,7 @@ class AJumpCmd(PCmd):
         self._jump_command: PJumpCommand | None = None
 
     def clone(self):
-        return AJumpCmd(self.clone_node(self._jump_command))
+        return AJumpCmd(self.clone_maybe(self._jump_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_jump_cmd(self)
@@ -24,13 +24,7 @@ class AJumpCmd(PCmd):
         return self._jump_command
 
     def set_jump_command(self, node: PJumpCommand | None):
-        if self._jump_command is not None:
-            self._jump_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._jump_command = node
+        self._jump_command = self._reparent(self._jump_command, node)
 
     def remove_child(self, child: Node):
         if self._jump_command == child:
@@ -39,9 +33,3 @@ class AJumpCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._jump_command == old_child:
             self.set_jump_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -15,7 +15,7 @@ class AJumpSubCmd(PCmd):
         self._jump_to_subroutine: PJumpToSubroutine | None = None
 
     def clone(self):
-        return AJumpSubCmd(self.clone_node(self._jump_to_subroutine))
+        return AJumpSubCmd(self.clone_maybe(self._jump_to_subroutine))
 
     def apply(self, sw: Analysis):
         sw.case_a_jump_sub_cmd(self)
@@ -24,13 +24,7 @@ class AJumpSubCmd(PCmd):
         return self._jump_to_subroutine
 
     def set_jump_to_subroutine(self, node: PJumpToSubroutine | None):
-        if self._jump_to_subroutine is not None:
-            self._jump_to_subroutine.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._jump_to_subroutine = node
+        self._jump_to_subroutine = self._reparent(self._jump_to_subroutine, node)
 
     def remove_child(self, child: Node):
         if self._jump_to_subroutine == child:
@@ -39,9 +33,3 @@ class AJumpSubCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._jump_to_subroutine == old_child:
             self.set_jump_to_subroutine(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
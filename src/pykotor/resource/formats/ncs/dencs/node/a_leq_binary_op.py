@@ -21,7 +21,7 @@ class ALeqBinaryOp(PBinaryOp):
             self.set_leq(leq)
 
     def clone(self):
-        return ALeqBinaryOp(self.clone_node(self._leq))
+        return ALeqBinaryOp(self.clone_maybe(self._leq))
 
     def apply(self, sw: Analysis):
         sw.case_a_leq_binary_op(self)
@@ -30,16 +30,10 @@ class ALeqBinaryOp(PBinaryOp):
         return self._leq
 
     def set_leq(self, node: TLeq | None):
-        if self._leq is not None:
-            self._leq.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._leq = node
+        self._leq = self._reparent(self._leq, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._leq)
+        return str(self._leq) if self._leq is not None else ""
 
     def remove_child(self, child: Node):
         if self._leq == child:
@@ -50,13 +44,3 @@ class ALeqBinaryOp(PBinaryOp):
         if self._leq == old_child:
             self.set_leq(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -15,7 +15,7 @@ class ALogiiCmd(PCmd):
         self._logii_command: PLogiiCommand | None = None
 
     def clone(self):
-        return ALogiiCmd(self.clone_node(self._logii_command))
+        return ALogiiCmd(self.clone_maybe(self._logii_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_logii_cmd(self)
@@ -24,13 +24,7 @@ class ALogiiCmd(PCmd):
         return self._logii_command
 
     def set_logii_command(self, node: PLogiiCommand | None):
-        if self._logii_command is not None:
-            self._logii_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._logii_command = node
+        self._logii_command = self._reparent(self._logii_command, node)
 
     def remove_child(self, child: Node):
         if self._logii_command == child:
@@ -39,8 +33,3 @@ class ALogiiCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._logii_command == old_child:
             self.set_logii_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
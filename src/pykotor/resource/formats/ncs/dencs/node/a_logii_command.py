@@ -34,49 +34,25 @@ class ALogiiCommand(PLogiiCommand):
         return self._logii_op_
 
     def set_logii_op(self, node: PLogiiOp):
-        if self._logii_op_ is not None:
-            self._logii_op_.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._logii_op_ = node
+        self._logii_op_ = self._reparent(self._logii_op_, node)
 
     def get_pos(self) -> TIntegerConstant:
         return self._pos_
 
     def set_pos(self, node: TIntegerConstant):
-        if self._pos_ is not None:
-            self._pos_.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos_ = node
+        self._pos_ = self._reparent(self._pos_, node)
 
     def get_type(self) -> TIntegerConstant:
         return self._type_
 
     def set_type(self, node: TIntegerConstant):
-        if self._type_ is not None:
-            self._type_.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type_ = node
+        self._type_ = self._reparent(self._type_, node)
 
     def get_semi(self) -> TSemi:
         return self._semi_
 
     def set_semi(self, node: TSemi):
-        if self._semi_ is not None:
-            self._semi_.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi_ = node
+        self._semi_ = self._reparent(self._semi_, node)
 
     def __str__(self) -> str:
         result = []
@@ -21,7 +21,7 @@ class ALtBinaryOp(PBinaryOp):
             self.set_lt(lt)
 
     def clone(self):
-        return ALtBinaryOp(self.clone_node(self._lt))
+        return ALtBinaryOp(self.clone_maybe(self._lt))
 
     def apply(self, sw: Analysis):
         sw.case_a_lt_binary_op(self)
@@ -30,16 +30,10 @@ class ALtBinaryOp(PBinaryOp):
         return self._lt
 
     def set_lt(self, node: TLt | None):
-        if self._lt is not None:
-            self._lt.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._lt = node
+        self._lt = self._reparent(self._lt, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._lt)
+        return str(self._lt) if self._lt is not None else ""
 
     def remove_child(self, child: Node):
         if self._lt == child:
@@ -50,13 +44,3 @@ class ALtBinaryOp(PBinaryOp):
         if self._lt == old_child:
             self.set_lt(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
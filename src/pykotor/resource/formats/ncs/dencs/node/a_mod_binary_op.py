@@ -21,7 +21,7 @@ class AModBinaryOp(PBinaryOp):
             self.set_mod(mod)
 
     def clone(self):
-        return AModBinaryOp(self.clone_node(self._mod))
+        return AModBinaryOp(self.clone_maybe(self._mod))
 
     def apply(self, sw: Analysis):
         sw.case_a_mod_binary_op(self)
@@ -30,16 +30,10 @@ class AModBinaryOp(PBinaryOp):
         return self._mod
 
     def set_mod(self, node: TMod | None):
-        if self._mod is not None:
-            self._mod.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._mod = node
+        self._mod = self._reparent(self._mod, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._mod)
+        return str(self._mod) if self._mod is not None else ""
 
     def remove_child(self, child: Node):
         if self._mod == child:
@@ -50,13 +44,3 @@ class AModBinaryOp(PBinaryOp):
         if self._mod == old_child:
             self.set_mod(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
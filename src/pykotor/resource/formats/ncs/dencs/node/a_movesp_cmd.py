@@ -15,7 +15,7 @@ class AMovespCmd(PCmd):
         self._move_sp_command: PMoveSpCommand | None = None
 
     def clone(self):
-        return AMovespCmd(self.clone_node(self._move_sp_command))
+        return AMovespCmd(self.clone_maybe(self._move_sp_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_movesp_cmd(self)
@@ -24,13 +24,7 @@ class AMovespCmd(PCmd):
         return self._move_sp_command
 
     def set_move_sp_command(self, node: PMoveSpCommand | None):
-        if self._move_sp_command is not None:
-            self._move_sp_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._move_sp_command = node
+        self._move_sp_command = self._reparent(self._move_sp_command, node)
 
     def remove_child(self, child: Node):
         if self._move_sp_command == child:
@@ -39,9 +33,3 @@ class AMovespCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._move_sp_command == old_child:
             self.set_move_sp_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -21,7 +21,7 @@ class AMulBinaryOp(PBinaryOp):
             self.set_mul(mul)
 
     def clone(self):
-        return AMulBinaryOp(self.clone_node(self._mul))
+        return AMulBinaryOp(self.clone_maybe(self._mul))
 
     def apply(self, sw: Analysis):
         sw.case_a_mul_binary_op(self)
@@ -30,16 +30,10 @@ class AMulBinaryOp(PBinaryOp):
         return self._mul
 
     def set_mul(self, node: TMul | None):
-        if self._mul is not None:
-            self._mul.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._mul = node
+        self._mul = self._reparent(self._mul, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._mul)
+        return str(self._mul) if self._mul is not None else ""
 
     def remove_child(self, child: Node):
         if self._mul == child:
@@ -50,13 +44,3 @@ class AMulBinaryOp(PBinaryOp):
         if self._mul == old_child:
             self.set_mul(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
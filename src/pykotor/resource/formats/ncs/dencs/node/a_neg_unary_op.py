@@ -21,7 +21,7 @@ class ANegUnaryOp(PUnaryOp):
             self.set_neg(neg)
 
     def clone(self):
-        return ANegUnaryOp(self.clone_node(self._neg))
+        return ANegUnaryOp(self.clone_maybe(self._neg))
 
     def apply(self, sw: Analysis):
         sw.case_a_neg_unary_op(self)
@@ -30,16 +30,10 @@ class ANegUnaryOp(PUnaryOp):
         return self._neg
 
     def set_neg(self, node: TNeg | None):
-        if self._neg is not None:
-            self._neg.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._neg = node
+        self._neg = self._reparent(self._neg, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._neg)
+        return str(self._neg) if self._neg is not None else ""
 
     def remove_child(self, child: Node):
         if self._neg == child:
@@ -50,13 +44,3 @@ class ANegUnaryOp(PUnaryOp):
         if self._neg == old_child:
             self.set_neg(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
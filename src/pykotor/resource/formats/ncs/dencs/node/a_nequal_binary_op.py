@@ -21,7 +21,7 @@ class ANequalBinaryOp(PBinaryOp):
             self.set_nequal(nequal)
 
     def clone(self):
-        return ANequalBinaryOp(self.clone_node(self._nequal))
+        return ANequalBinaryOp(self.clone_maybe(self._nequal))
 
     def apply(self, sw: Analysis):
         sw.case_a_nequal_binary_op(self)
@@ -30,16 +30,10 @@ class ANequalBinaryOp(PBinaryOp):
         return self._nequal
 
     def set_nequal(self, node: TNequal | None):
-        if self._nequal is not None:
-            self._nequal.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._nequal = node
+        self._nequal = self._reparent(self._nequal, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._nequal)
+        return str(self._nequal) if self._nequal is not None else ""
 
     def remove_child(self, child: Node):
         if self._nequal == child:
@@ -50,13 +44,3 @@ class ANequalBinaryOp(PBinaryOp):
         if self._nequal == old_child:
             self.set_nequal(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
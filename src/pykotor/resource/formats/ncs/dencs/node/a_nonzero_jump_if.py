@@ -15,7 +15,7 @@ class ANonzeroJumpIf(PJumpIf):
         self._jnz: TJnz | None = None
 
     def clone(self):
-        return ANonzeroJumpIf(self.clone_node(self._jnz))
+        return ANonzeroJumpIf(self.clone_maybe(self._jnz))
 
     def apply(self, sw: Analysis):
         sw.case_a_nonzero_jump_if(self)
@@ -24,13 +24,7 @@ class ANonzeroJumpIf(PJumpIf):
         return self._jnz
 
     def set_jnz(self, node: TJnz | None):
-        if self._jnz is not None:
-            self._jnz.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._jnz = node
+        self._jnz = self._reparent(self._jnz, node)
 
     def remove_child(self, child: Node):
         if self._jnz == child:
@@ -39,9 +33,3 @@ class ANonzeroJumpIf(PJumpIf):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._jnz == old_child:
             self.set_jnz(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -21,7 +21,7 @@ class ANotUnaryOp(PUnaryOp):
             self.set_not(not_token)
 
     def clone(self):
-        return ANotUnaryOp(self.clone_node(self._not))
+        return ANotUnaryOp(self.clone_maybe(self._not))
 
     def apply(self, sw: Analysis):
         sw.case_a_not_unary_op(self)
@@ -30,16 +30,10 @@ class ANotUnaryOp(PUnaryOp):
         return self._not
 
     def set_not(self, node: TNot | None):
-        if self._not is not None:
-            self._not.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._not = node
+        self._not = self._reparent(self._not, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._not)
+        return str(self._not) if self._not is not None else ""
 
     def remove_child(self, child: Node):
         if self._not == child:
@@ -50,13 +44,3 @@ class ANotUnaryOp(PUnaryOp):
         if self._not == old_child:
             self.set_not(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AOrLogiiOp(PLogiiOp):
             self.set_logorii(logorii)
 
     def clone(self):
-        return AOrLogiiOp(self.clone_node(self._logorii))
+        return AOrLogiiOp(self.clone_maybe(self._logorii))
 
     def apply(self, sw: Analysis):
         sw.case_a_or_logii_op(self)
@@ -30,16 +30,10 @@ class AOrLogiiOp(PLogiiOp):
         return self._logorii
 
     def set_logorii(self, node: TLogorii | None):
-        if self._logorii is not None:
-            self._logorii.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._logorii = node
+        self._logorii = self._reparent(self._logorii, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._logorii)
+        return str(self._logorii) if self._logorii is not None else ""
 
     def remove_child(self, child: Node):
         if self._logorii == child:
@@ -50,13 +44,3 @@ class AOrLogiiOp(PLogiiOp):
         if self._logorii == old_child:
             self.set_logorii(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -24,10 +24,10 @@ class AProgram(PProgram):
 
     def clone(self):
         return AProgram(
-            self.clone_node(self._size),
-            self.clone_node(self._conditional),
-            self.clone_node(self._jump_to_subroutine),
-            self.clone_node(self._return),
+            self.clone_maybe(self._size),
+            self.clone_maybe(self._conditional),
+            self.clone_maybe(self._jump_to_subroutine),
+            self.clone_maybe(self._return),
             self.clone_list(self._subroutine)
         )
 
@@ -38,49 +38,25 @@ class AProgram(PProgram):
         return self._size
 
     def set_size(self, node: PSize | None):
-        if self._size is not None:
-            self._size.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._size = node
+        self._size = self._reparent(self._size, node)
 
     def get_conditional(self) -> PRsaddCommand | None:
         return self._conditional
 
     def set_conditional(self, node: PRsaddCommand | None):
-        if self._conditional is not None:
-            self._conditional.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._conditional = node
+        self._conditional = self._reparent(self._conditional, node)
 
     def get_jump_to_subroutine(self) -> PJumpToSubroutine | None:
         return self._jump_to_subroutine
 
     def set_jump_to_subroutine(self, node: PJumpToSubroutine | None):
-        if self._jump_to_subroutine is not None:
-            self._jump_to_subroutine.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._jump_to_subroutine = node
+        self._jump_to_subroutine = self._reparent(self._jump_to_subroutine, node)
 
     def get_return(self) -> PReturn | None:
         return self._return
 
     def set_return(self, node: PReturn | None):
-        if self._return is not None:
-            self._return.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._return = node
+        self._return = self._reparent(self._return, node)
 
     def get_subroutine(self) -> list[PSubroutine]:
         return self._subroutine
@@ -128,11 +104,5 @@ class AProgram(PProgram):
                     new_child.parent().remove_child(new_child)
                 new_child.set_parent(self)
 
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
     def clone_list(self, lst: list) -> list:
         return [item.clone() for item in lst]
-
@@ -15,7 +15,7 @@ class ARestorebpBpOp(PBpOp):
         self._restorebp: TRestorebp | None = None
 
     def clone(self):
-        return ARestorebpBpOp(self.clone_node(self._restorebp))
+        return ARestorebpBpOp(self.clone_maybe(self._restorebp))
 
     def apply(self, sw: Analysis):
         sw.case_a_restorebp_bp_op(self)
@@ -24,13 +24,7 @@ class ARestorebpBpOp(PBpOp):
         return self._restorebp
 
     def set_restorebp(self, node: TRestorebp | None):
-        if self._restorebp is not None:
-            self._restorebp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._restorebp = node
+        self._restorebp = self._reparent(self._restorebp, node)
 
     def remove_child(self, child: Node):
         if self._restorebp == child:
@@ -39,8 +33,3 @@ class ARestorebpBpOp(PBpOp):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._restorebp == old_child:
             self.set_restorebp(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
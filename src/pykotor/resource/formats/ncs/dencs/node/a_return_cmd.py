@@ -15,7 +15,7 @@ class AReturnCmd(PCmd):
         self._return: PReturn | None = None
 
     def clone(self):
-        return AReturnCmd(self.clone_node(self._return))
+        return AReturnCmd(self.clone_maybe(self._return))
 
     def apply(self, sw: Analysis):
         sw.case_a_return_cmd(self)
@@ -24,13 +24,7 @@ class AReturnCmd(PCmd):
         return self._return
 
     def set_return(self, node: PReturn | None):
-        if self._return is not None:
-            self._return.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._return = node
+        self._return = self._reparent(self._return, node)
 
     def remove_child(self, child: Node):
         if self._return == child:
@@ -39,9 +33,3 @@ class AReturnCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._return == old_child:
             self.set_return(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
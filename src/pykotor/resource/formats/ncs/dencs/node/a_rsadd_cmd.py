@@ -15,7 +15,7 @@ class ARsaddCmd(PCmd):
         self._rsadd_command: PRsaddCommand | None = None
 
     def clone(self):
-        return ARsaddCmd(self.clone_node(self._rsadd_command))
+        return ARsaddCmd(self.clone_maybe(self._rsadd_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_rsadd_cmd(self)
@@ -24,13 +24,7 @@ class ARsaddCmd(PCmd):
         return self._rsadd_command
 
     def set_rsadd_command(self, node: PRsaddCommand | None):
-        if self._rsadd_command is not None:
-            self._rsadd_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._rsadd_command = node
+        self._rsadd_command = self._reparent(self._rsadd_command, node)
 
     def remove_child(self, child: Node):
         if self._rsadd_command == child:
@@ -39,9 +33,3 @@ class ARsaddCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._rsadd_command == old_child:
             self.set_rsadd_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -21,10 +21,10 @@ class ARsaddCommand(PRsaddCommand):
 
     def clone(self):
         return ARsaddCommand(
-            self.clone_node(self._rsadd),
-            self.clone_node(self._pos),
-            self.clone_node(self._type),
-            self.clone_node(self._semi)
+            self.clone_maybe(self._rsadd),
+            self.clone_maybe(self._pos),
+            self.clone_maybe(self._type),
+            self.clone_maybe(self._semi)
         )
 
     def apply(self, sw: Analysis):
@@ -34,49 +34,25 @@ class ARsaddCommand(PRsaddCommand):
         return self._rsadd
 
     def set_rsadd(self, node: TRsadd | None):
-        if self._rsadd is not None:
-            self._rsadd.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._rsadd = node
+        self._rsadd = self._reparent(self._rsadd, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._rsadd == child:
@@ -103,9 +79,3 @@ class ARsaddCommand(PRsaddCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
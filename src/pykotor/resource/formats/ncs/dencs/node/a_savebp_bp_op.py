@@ -15,7 +15,7 @@ class ASavebpBpOp(PBpOp):
         self._savebp: TSavebp | None = None
 
     def clone(self):
-        return ASavebpBpOp(self.clone_node(self._savebp))
+        return ASavebpBpOp(self.clone_maybe(self._savebp))
 
     def apply(self, sw: Analysis):
         sw.case_a_savebp_bp_op(self)
@@ -24,13 +24,7 @@ class ASavebpBpOp(PBpOp):
         return self._savebp
 
     def set_savebp(self, node: TSavebp | None):
-        if self._savebp is not None:
-            self._savebp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._savebp = node
+        self._savebp = self._reparent(self._savebp, node)
 
     def remove_child(self, child: Node):
         if self._savebp == child:
@@ -39,8 +33,3 @@ class ASavebpBpOp(PBpOp):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._savebp == old_child:
             self.set_savebp(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
@@ -21,7 +21,7 @@ class AShleftBinaryOp(PBinaryOp):
             self.set_shleft(shleft)
 
     def clone(self):
-        return AShleftBinaryOp(self.clone_node(self._shleft))
+        return AShleftBinaryOp(self.clone_maybe(self._shleft))
 
     def apply(self, sw: Analysis):
         sw.case_a_shleft_binary_op(self)
@@ -30,16 +30,10 @@ class AShleftBinaryOp(PBinaryOp):
         return self._shleft
 
     def set_shleft(self, node: TShleft | None):
-        if self._shleft is not None:
-            self._shleft.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._shleft = node
+        self._shleft = self._reparent(self._shleft, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._shleft)
+        return str(self._shleft) if self._shleft is not None else ""
 
     def remove_child(self, child: Node):
         if self._shleft == child:
@@ -50,13 +44,3 @@ class AShleftBinaryOp(PBinaryOp):
         if self._shleft == old_child:
             self.set_shleft(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -21,7 +21,7 @@ class AShrightBinaryOp(PBinaryOp):
             self.set_shright(shright)
 
     def clone(self):
-        return AShrightBinaryOp(self.clone_node(self._shright))
+        return AShrightBinaryOp(self.clone_maybe(self._shright))
 
     def apply(self, sw: Analysis):
         sw.case_a_shright_binary_op(self)
@@ -30,16 +30,10 @@ class AShrightBinaryOp(PBinaryOp):
         return self._shright
 
     def set_shright(self, node: TShright | None):
-        if self._shright is not None:
-            self._shright.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._shright = node
+        self._shright = self._reparent(self._shright, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._shright)
+        return str(self._shright) if self._shright is not None else ""
 
     def remove_child(self, child: Node):
         if self._shright == child:
@@ -50,13 +44,3 @@ class AShrightBinaryOp(PBinaryOp):
         if self._shright == old_child:
             self.set_shright(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -33,7 +33,7 @@ class ASize(PSize):
             self.set_semi(semi)
 
     def clone(self):
-        return ASize(self.clone_node(self._t), self.clone_node(self._pos), self.clone_node(self._integerConstant), self.clone_node(self._semi))
+        return ASize(self.clone_maybe(self._t), self.clone_maybe(self._pos), self.clone_maybe(self._integerConstant), self.clone_maybe(self._semi))
 
     def apply(self, sw: Analysis):
         sw.case_a_size(self)
@@ -42,49 +42,25 @@ class ASize(PSize):
         return self._t
 
     def set_t(self, node: TT | None):
-        if self._t is not None:
-            self._t.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._t = node
+        self._t = self._reparent(self._t, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_integerConstant(self) -> TIntegerConstant | None:
         return self._integerConstant
 
     def set_integerConstant(self, node: TIntegerConstant | None):
-        if self._integerConstant is not None:
-            self._integerConstant.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._integerConstant = node
+        self._integerConstant = self._reparent(self._integerConstant, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def __str__(self) -> str:
         return self.to_string(self._t) + self.to_string(self._pos) + self.to_string(self._integerConstant) + self.to_string(self._semi)
@@ -117,11 +93,6 @@ class ASize(PSize):
             self.set_semi(new_child)  # type: ignore
             return
 
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
     def to_string(self, node):
         if node is not None:
             return str(node)
@@ -43,11 +43,11 @@ class AStackCommand(PStackCommand):
 
     def clone(self):
         return AStackCommand(
-            self.clone_node(self._stack_op),
-            self.clone_node(self._pos),
-            self.clone_node(self._type),
-            self.clone_node(self._offset),
-            self.clone_node(self._semi),
+            self.clone_maybe(self._stack_op),
+            self.clone_maybe(self._pos),
+            self.clone_maybe(self._type),
+            self.clone_maybe(self._offset),
+            self.clone_maybe(self._semi),
         )
 
     def apply(self, sw: Analysis):
@@ -57,61 +57,31 @@ class AStackCommand(PStackCommand):
         return self._stack_op
 
     def set_stack_op(self, node: PStackOp | None):
-        if self._stack_op is not None:
-            self._stack_op.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._stack_op = node
+        self._stack_op = self._reparent(self._stack_op, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_type(self) -> TIntegerConstant | None:
         return self._type
 
     def set_type(self, node: TIntegerConstant | None):
-        if self._type is not None:
-            self._type.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._type = node
+        self._type = self._reparent(self._type, node)
 
     def get_offset(self) -> TIntegerConstant | None:
         return self._offset
 
     def set_offset(self, node: TIntegerConstant | None):
-        if self._offset is not None:
-            self._offset.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._offset = node
+        self._offset = self._reparent(self._offset, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def __str__(self) -> str:
         return (
@@ -154,11 +124,6 @@ class AStackCommand(PStackCommand):
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
 
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
     def to_string(self, node):
         if node is not None:
             return str(node)
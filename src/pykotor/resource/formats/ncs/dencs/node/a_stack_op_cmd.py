@@ -21,7 +21,7 @@ class AStackOpCmd(PCmd):
             self.set_stackCommand(stackCommand)
 
     def clone(self):
-        return AStackOpCmd(self.clone_node(self._stackCommand))
+        return AStackOpCmd(self.clone_maybe(self._stackCommand))
 
     def apply(self, sw: Analysis):
         sw.case_a_stack_op_cmd(self)
@@ -30,16 +30,10 @@ class AStackOpCmd(PCmd):
         return self._stackCommand
 
     def set_stackCommand(self, node: PStackCommand | None):
-        if self._stackCommand is not None:
-            self._stackCommand.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._stackCommand = node
+        self._stackCommand = self._reparent(self._stackCommand, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._stackCommand)
+        return str(self._stackCommand) if self._stackCommand is not None else ""
 
     def remove_child(self, child: Node):
         if self._stackCommand == child:
@@ -50,13 +44,3 @@ class AStackOpCmd(PCmd):
         if self._stackCommand == old_child:
             self.set_stackCommand(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -15,7 +15,7 @@ class AStoreStateCmd(PCmd):
         self._store_state_command: PStoreStateCommand | None = None
 
     def clone(self):
-        return AStoreStateCmd(self.clone_node(self._store_state_command))
+        return AStoreStateCmd(self.clone_maybe(self._store_state_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_store_state_cmd(self)
@@ -24,13 +24,7 @@ class AStoreStateCmd(PCmd):
         return self._store_state_command
 
     def set_store_state_command(self, node: PStoreStateCommand | None):
-        if self._store_state_command is not None:
-            self._store_state_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._store_state_command = node
+        self._store_state_command = self._reparent(self._store_state_command, node)
 
     def remove_child(self, child: Node):
         if self._store_state_command == child:
@@ -39,8 +33,3 @@ class AStoreStateCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._store_state_command == old_child:
             self.set_store_state_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
@@ -23,12 +23,12 @@ class AStoreStateCommand(PStoreStateCommand):
 
     def clone(self):
         return AStoreStateCommand(
-            self.clone_node(self._storestate),  # type: ignore
-            self.clone_node(self._pos),  # type: ignore
-            self.clone_node(self._offset),  # type: ignore
-            self.clone_node(self._size_bp),  # type: ignore
-            self.clone_node(self._size_sp),  # type: ignore
-            self.clone_node(self._semi)  # type: ignore
+            self.clone_maybe(self._storestate),  # type: ignore
+            self.clone_maybe(self._pos),  # type: ignore
+            self.clone_maybe(self._offset),  # type: ignore
+            self.clone_maybe(self._size_bp),  # type: ignore
+            self.clone_maybe(self._size_sp),  # type: ignore
+            self.clone_maybe(self._semi)  # type: ignore
         )
 
     def apply(self, sw: Analysis):
@@ -38,73 +38,37 @@ class AStoreStateCommand(PStoreStateCommand):
         return self._storestate
 
     def set_storestate(self, node: TStorestate | None):
-        if self._storestate is not None:
-            self._storestate.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._storestate = node
+        self._storestate = self._reparent(self._storestate, node)
 
     def get_pos(self) -> TIntegerConstant | None:
         return self._pos
 
     def set_pos(self, node: TIntegerConstant | None):
-        if self._pos is not None:
-            self._pos.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._pos = node
+        self._pos = self._reparent(self._pos, node)
 
     def get_offset(self) -> TIntegerConstant | None:
         return self._offset
 
     def set_offset(self, node: TIntegerConstant | None):
-        if self._offset is not None:
-            self._offset.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._offset = node
+        self._offset = self._reparent(self._offset, node)
 
     def get_size_bp(self) -> TIntegerConstant | None:
         return self._size_bp
 
     def set_size_bp(self, node: TIntegerConstant | None):
-        if self._size_bp is not None:
-            self._size_bp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._size_bp = node
+        self._size_bp = self._reparent(self._size_bp, node)
 
     def get_size_sp(self) -> TIntegerConstant | None:
         return self._size_sp
 
     def set_size_sp(self, node: TIntegerConstant | None):
-        if self._size_sp is not None:
-            self._size_sp.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._size_sp = node
+        self._size_sp = self._reparent(self._size_sp, node)
 
     def get_semi(self) -> TSemi | None:
         return self._semi
 
     def set_semi(self, node: TSemi | None):
-        if self._semi is not None:
-            self._semi.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._semi = node
+        self._semi = self._reparent(self._semi, node)
 
     def remove_child(self, child: Node):
         if self._storestate == child:
@@ -143,8 +107,3 @@ class AStoreStateCommand(PStoreStateCommand):
             return
         if self._semi == old_child:
             self.set_semi(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
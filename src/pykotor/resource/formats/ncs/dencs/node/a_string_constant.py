@@ -15,7 +15,7 @@ class AStringConstant(PConstant):
         self._string_literal: TStringLiteral | None = None
 
     def clone(self):
-        return AStringConstant(self.clone_node(self._string_literal))
+        return AStringConstant(self.clone_maybe(self._string_literal))
 
     def apply(self, sw: Analysis):
         sw.case_a_string_constant(self)
@@ -24,13 +24,7 @@ class AStringConstant(PConstant):
         return self._string_literal
 
     def set_string_literal(self, node: TStringLiteral | None):
-        if self._string_literal is not None:
-            self._string_literal.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._string_literal = node
+        self._string_literal = self._reparent(self._string_literal, node)
 
     def remove_child(self, child: Node):
         if self._string_literal == child:
@@ -39,9 +33,3 @@ class AStringConstant(PConstant):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._string_literal == old_child:
             self.set_string_literal(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
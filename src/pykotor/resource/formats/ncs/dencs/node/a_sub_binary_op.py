@@ -21,7 +21,7 @@ class ASubBinaryOp(PBinaryOp):
             self.set_sub(sub)
 
     def clone(self):
-        return ASubBinaryOp(self.clone_node(self._sub))
+        return ASubBinaryOp(self.clone_maybe(self._sub))
 
     def apply(self, sw: Analysis):
         sw.case_a_sub_binary_op(self)
@@ -30,16 +30,10 @@ class ASubBinaryOp(PBinaryOp):
         return self._sub
 
     def set_sub(self, node: TSub | None):
-        if self._sub is not None:
-            self._sub.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._sub = node
+        self._sub = self._reparent(self._sub, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._sub)
+        return str(self._sub) if self._sub is not None else ""
 
     def remove_child(self, child: Node):
         if self._sub == child:
@@ -50,13 +44,3 @@ class ASubBinaryOp(PBinaryOp):
         if self._sub == old_child:
             self.set_sub(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
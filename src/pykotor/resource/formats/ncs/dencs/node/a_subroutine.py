@@ -25,8 +25,8 @@ class ASubroutine(PSubroutine):
 
     def clone(self):
         return ASubroutine(
-            self.clone_node(self._command_block),
-            self.clone_node(self._return)
+            self.clone_maybe(self._command_block),
+            self.clone_maybe(self._return)
         )
 
     def apply(self, sw: Analysis):
@@ -36,25 +36,13 @@ class ASubroutine(PSubroutine):
         return self._command_block
 
     def set_command_block(self, node: PCommandBlock | None):
-        if self._command_block is not None:
-            self._command_block.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._command_block = node
+        self._command_block = self._reparent(self._command_block, node)
 
     def get_return(self) -> PReturn | None:
         return self._return
 
     def set_return(self, node: PReturn | None):
-        if self._return is not None:
-            self._return.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._return = node
+        self._return = self._reparent(self._return, node)
 
     def remove_child(self, child: Node):
         if self._command_block == child:
@@ -69,9 +57,3 @@ class ASubroutine(PSubroutine):
             return
         if self._return == old_child:
             self.set_return(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -15,7 +15,7 @@ class AUnaryCmd(PCmd):
         self._unary_command: PUnaryCommand | None = None
 
     def clone(self):
-        return AUnaryCmd(self.clone_node(self._unary_command))
+        return AUnaryCmd(self.clone_maybe(self._unary_command))
 
     def apply(self, sw: Analysis):
         sw.case_a_unary_cmd(self)
@@ -24,13 +24,7 @@ class AUnaryCmd(PCmd):
         return self._unary_command
 
     def set_unary_command(self, node: PUnaryCommand | None):
-        if self._unary_command is not None:
-            self._unary_command.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._unary_command = node
+        self._unary_command = self._reparent(self._unary_command, node)
 
     def remove_child(self, child: Node):
         if self._unary_command == child:
@@ -39,8 +33,3 @@ class AUnaryCmd(PCmd):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._unary_command == old_child:
             self.set_unary_command(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
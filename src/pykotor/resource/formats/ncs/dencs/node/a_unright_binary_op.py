@@ -21,7 +21,7 @@ class AUnrightBinaryOp(PBinaryOp):
             self.set_unright(unright)
 
     def clone(self):
-        return AUnrightBinaryOp(self.clone_node(self._unright))
+        return AUnrightBinaryOp(self.clone_maybe(self._unright))
 
     def apply(self, sw: Analysis):
         sw.case_a_unright_binary_op(self)
@@ -30,16 +30,10 @@ class AUnrightBinaryOp(PBinaryOp):
         return self._unright
 
     def set_unright(self, node: TUnright | None):
-        if self._unright is not None:
-            self._unright.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._unright = node
+        self._unright = self._reparent(self._unright, node)
 
     def __str__(self) -> str:
-        return self.to_string(self._unright)
+        return str(self._unright) if self._unright is not None else ""
 
     def remove_child(self, child: Node):
         if self._unright == child:
@@ -50,13 +44,3 @@ class AUnrightBinaryOp(PBinaryOp):
         if self._unright == old_child:
             self.set_unright(new_child)  # type: ignore
             return
-
-    def clone_node(self, node):
-        if node is not None:
-            return node.clone()
-        return None
-
-    def to_string(self, node):
-        if node is not None:
-            return str(node)
-        return ""
@@ -15,7 +15,7 @@ class AZeroJumpIf(PJumpIf):
         self._jz: TJz | None = None
 
     def clone(self):
-        return AZeroJumpIf(self.clone_node(self._jz))
+        return AZeroJumpIf(self.clone_maybe(self._jz))
 
     def apply(self, sw: Analysis):
         sw.case_a_zero_jump_if(self)
@@ -24,13 +24,7 @@ class AZeroJumpIf(PJumpIf):
         return self._jz
 
     def set_jz(self, node: TJz | None):
-        if self._jz is not None:
-            self._jz.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._jz = node
+        self._jz = self._reparent(self._jz, node)
 
     def remove_child(self, child: Node):
         if self._jz == child:
@@ -39,9 +33,3 @@ class AZeroJumpIf(PJumpIf):
     def replace_child(self, old_child: Node, new_child: Node):
         if self._jz == old_child:
             self.set_jz(new_child)  # type: ignore
-
-    def clone_node(self, node: Node | None) -> Node | None:
-        if node is not None:
-            return node.clone()
-        return None
-
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pykotor.resource.formats.ncs.dencs.node.node import has_case
 from pykotor.resource.formats.ncs.dencs.node.token import Token
 
 if TYPE_CHECKING:
@@ -17,7 +18,7 @@ class EOF(Token):
         return EOF(self.get_line(), self.get_pos())
 
     def apply(self, sw: Analysis):
-        if hasattr(sw, 'case_eof'):
+        if has_case(sw, "case_eof"):
             sw.case_eof(self)
         else:
             sw.default_case(self)
@@ -5,6 +5,18 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.analysis.analysis_adapter import Analysis  # pyright: ignore[reportMissingImports]
 
+_HAS_CASE: dict[tuple[type, str], bool] = {}
+
+
+def has_case(sw: Analysis, name: str) -> bool:
+    # Visitors define their case_* handlers on the class, so the probe only needs doing once per visitor type.
+    key = (type(sw), name)
+    found = _HAS_CASE.get(key)
+    if found is None:
+        found = _HAS_CASE[key] = hasattr(type(sw), name)
+    return found
+
+
 class Node:
     def __init__(self):
         self._parent: Node | None = None
@@ -15,8 +27,20 @@ class Node:
     def set_parent(self, parent: Node | None):
         self._parent = parent
 
+    def _reparent(self, old: Node | None, node: Node | None) -> Node | None:
+        # Shared body of every child setter: detach the old child, unlink the new one from
+        # wherever it currently lives, adopt it, and hand it back for the caller to store.
+        if old is not None:
+            old._parent = None
+        if node is not None:
+            parent = node._parent
+            if parent is not None:
+                parent.remove_child(node)
+            node._parent = self
+        return node
+
     def apply(self, sw: Analysis):
-        if hasattr(sw, 'case_node'):
+        if has_case(sw, "case_node"):
             sw.case_node(self)
         else:
             sw.default_case(self)
@@ -37,3 +61,7 @@ class Node:
     def clone(self) -> Node:
         raise NotImplementedError("Subclasses must implement clone")
 
+    @staticmethod
+    def clone_maybe(node: Node | None) -> Node | None:
+        return None if node is None else node.clone()
+
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pykotor.resource.formats.ncs.dencs.node.node import Node
+from pykotor.resource.formats.ncs.dencs.node.eof import EOF  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.node import Node, has_case
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.analysis.analysis_adapter import Analysis  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.node.eof import EOF  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.node.p_program import PProgram  # pyright: ignore[reportMissingImports]
 
 class Start(Node):
@@ -14,13 +14,14 @@ class Start(Node):
         super().__init__()
         self._p_program: PProgram | None = None
         self._eof: EOF | None = None
+        # Children passed in here have never had a parent, so they are attached without _reparent
         if p_program is not None:
-            self.set_p_program(p_program)
-        if eof is not None:
-            self.set_eof(eof)
-        else:
-            from pykotor.resource.formats.ncs.dencs.node.eof import EOF  # pyright: ignore[reportMissingImports]
-            self.set_eof(EOF())
+            p_program._parent = self
+            self._p_program = p_program
+        if eof is None:
+            eof = EOF()
+        eof._parent = self
+        self._eof = eof
 
     def clone(self) -> Start:
         p_program_clone = None
@@ -32,7 +33,7 @@ class Start(Node):
         return Start(p_program_clone, eof_clone)
 
     def apply(self, sw: Analysis):
-        if hasattr(sw, 'case_start'):
+        if has_case(sw, "case_start"):
             sw.case_start(self)
         else:
             sw.default_case(self)
@@ -41,25 +42,13 @@ class Start(Node):
         return self._p_program
 
     def set_p_program(self, node: PProgram | None):
-        if self._p_program is not None:
-            self._p_program.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._p_program = node
+        self._p_program = self._reparent(self._p_program, node)
 
     def get_eof(self) -> EOF | None:
         return self._eof
 
     def set_eof(self, node: EOF | None):
-        if self._eof is not None:
-            self._eof.set_parent(None)
-        if node is not None:
-            if node.parent() is not None:
-                node.parent().remove_child(node)
-            node.set_parent(self)
-        self._eof = node
+        self._eof = self._reparent(self._eof, node)
 
     def remove_child(self, child: Node):
         if self._p_program == child:
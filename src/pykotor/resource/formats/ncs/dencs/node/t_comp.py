@@ -8,6 +8,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.analysis.analysis_adapter import Analysis
 
 class TComp(Token):
+    IMMUTABLE = True
+
     def __init__(self, line: int = 0, pos: int = 0):
         super().__init__("COMP")
         self.line = line
@@ -19,5 +21,5 @@ class TComp(Token):
     def apply(self, sw: Analysis):
         sw.case_t_comp(self)
 
-    def set_text(self, text: str):
-        raise RuntimeError("Cannot change TComp text.")
+    def __str__(self) -> str:
+        return "COMP "
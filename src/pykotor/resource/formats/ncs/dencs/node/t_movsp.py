@@ -8,6 +8,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.analysis.analysis_adapter import Analysis  # pyright: ignore[reportMissingImports]
 
 class TMovsp(Token):
+    IMMUTABLE = True
+
     def __init__(self, line: int = 0, pos: int = 0):
         super().__init__("MOVSP")
         self.line = line
@@ -19,6 +21,6 @@ class TMovsp(Token):
     def apply(self, sw: Analysis):
         sw.case_t_movsp(self)
 
-    def set_text(self, text: str):
-        raise RuntimeError("Cannot change TMovsp text.")
+    def __str__(self) -> str:
+        return "MOVSP "
 
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.analysis.analysis_adapter import Analysis  # pyright: ignore[reportMissingImports]
 
 class TRsadd(Token):
+    IMMUTABLE = True
+
     def __init__(self, line: int = 0, pos: int = 0):
         super().__init__("RSADD")
         self.line = line
@@ -19,6 +21,6 @@ class TRsadd(Token):
     def apply(self, sw: Analysis):
         sw.case_t_rsadd(self)
 
-    def set_text(self, text: str):
-        raise RuntimeError("Cannot change TRsadd text.")
+    def __str__(self) -> str:
+        return "RSADD "
 
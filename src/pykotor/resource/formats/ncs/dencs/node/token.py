@@ -1,9 +1,50 @@
 from __future__ import annotations
 
+from typing import ClassVar
+
 from pykotor.resource.formats.ncs.dencs.node.node import Node  # pyright: ignore[reportMissingImports]
 
 
 class Token(Node):
+    # Released tokens are kept per concrete class and handed back out by __new__;
+    # __init__ still runs on the recycled instance, so it comes back fully reset.
+    # Fixed-text tokens set this instead of overriding set_text.
+    IMMUTABLE: ClassVar[bool] = False
+    POOL_LIMIT: ClassVar[int] = 4096
+    _pool: ClassVar[list[Token]] = []
+    # Every class pool, so clear_pools() can empty them all
+    _pools: ClassVar[list[list[Token]]] = [_pool]
+    # True while the instance sits in its class pool, so a second release cannot pool it twice
+    _pooled: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+        Token._pools.append(cls._pool)
+
+    def __new__(cls, *args, **kwargs):
+        # pop() is atomic, so threads parsing at the same time never get the same token
+        try:
+            token = cls._pool.pop()
+        except IndexError:
+            return super().__new__(cls)
+        token._pooled = False
+        return token
+
+    def release(self):
+        if self._parent is not None or self._pooled:
+            return
+        pool = type(self)._pool
+        if len(pool) < self.POOL_LIMIT:
+            self._pooled = True
+            pool.append(self)
+
+    @staticmethod
+    def clear_pools():
+        """Drop every released token, so none outlives the decompile that released it."""
+        for pool in Token._pools:
+            pool.clear()
+
     def __init__(self, text: str = ""):
         super().__init__()
         self.text: str = text
@@ -14,6 +55,8 @@ class Token(Node):
         return self.text
 
     def set_text(self, text: str):
+        if self.IMMUTABLE:
+            raise RuntimeError(f"Cannot change {type(self).__name__} text.")
         self.text = text
 
     def get_line(self) -> int:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression
 from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AActionArgExp(ScriptRootNode, AExpression):
+    HAS_STACKENTRY: ClassVar[bool] = False
+
     def __init__(self, start: int = 0, end: int = 0):
         super().__init__(start, end)
         self.start = start
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AActionExp(ScriptNode, AExpression):
+    _close_fields = ("params", "_stackentry")
+
     def __init__(self, action: str, id_val: int, params: list[AExpression]):
         super().__init__()
         self._action: str = action
@@ -19,7 +21,7 @@ class AActionExp(ScriptNode, AExpression):
         self.id: int = id_val
 
     def add_param(self, param: AExpression):
-        param.parent(self)  # type: ignore
+        param.set_parent(self)
         self.params.append(param)
 
     def get_param(self, pos: int) -> AExpression:
@@ -29,14 +31,15 @@ class AActionExp(ScriptNode, AExpression):
         return self._action
 
     def __str__(self) -> str:
-        buff = []
-        buff.append(self._action + "(")
-        prefix = ""
-        for param in self.params:
-            buff.append(prefix + str(param))
-            prefix = ", "
-        buff.append(")")
-        return "".join(buff)
+        return self.render()
+
+    def write(self, out: list[str]):
+        out.append(f"{self._action}(")
+        for i, param in enumerate(self.params):
+            if i:
+                out.append(", ")
+            param.write(out)
+        out.append(")")
 
     def stackentry(self) -> StackEntry:
         return self._stackentry
@@ -47,13 +50,3 @@ class AActionExp(ScriptNode, AExpression):
     def get_id(self) -> int:
         return self.id
 
-    def close(self):
-        super().close()
-        if self.params is not None:
-            for param in self.params:
-                param.close()  # type: ignore
-        self.params = None
-        if self._stackentry is not None:
-            self._stackentry.close()
-        self._stackentry = None
-
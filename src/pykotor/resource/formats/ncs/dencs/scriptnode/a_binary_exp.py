@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class ABinaryExp(ScriptNode, AExpression):
+    __slots__ = ("_left", "_right", "op", "_stackentry")
+    _close_fields = ("_left", "_right", "_stackentry")
+
     def __init__(self, left: AExpression, right: AExpression, op: str):
         super().__init__()
         self.set_left(left)
@@ -18,20 +21,27 @@ class ABinaryExp(ScriptNode, AExpression):
 
     def set_left(self, left: AExpression):
         self._left = left
-        left.parent(self)  # type: ignore
+        left.set_parent(self)
 
     def left(self) -> AExpression:
         return self._left
 
     def set_right(self, right: AExpression):
         self._right = right
-        right.parent(self)  # type: ignore
+        right.set_parent(self)
 
     def right(self) -> AExpression:
         return self._right
 
     def __str__(self) -> str:
-        return "(" + str(self._left) + " " + self.op + " " + str(self._right) + ")"
+        return self.render()
+
+    def write(self, out: list[str]):
+        out.append("(")
+        self._left.write(out)
+        out.append(f" {self.op} ")
+        self._right.write(out)
+        out.append(")")
 
     def stackentry(self) -> StackEntry:
         return self._stackentry
@@ -39,15 +49,3 @@ class ABinaryExp(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         self._stackentry = stackentry
 
-    def close(self):
-        super().close()
-        if self._left is not None:
-            self._left.close()  # type: ignore
-            self._left = None
-        if self._right is not None:
-            self._right.close()  # type: ignore
-            self._right = None
-        if self._stackentry is not None:
-            self._stackentry.close()
-        self._stackentry = None
-
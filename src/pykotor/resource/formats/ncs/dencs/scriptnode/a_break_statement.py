@@ -8,5 +8,5 @@ class ABreakStatement(ScriptNode):
         super().__init__()
 
     def __str__(self) -> str:
-        return self.tabs + "break;" + self.newline
+        return f"{self.tabs}break;{self.newline}"
 
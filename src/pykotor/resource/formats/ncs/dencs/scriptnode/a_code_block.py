@@ -4,14 +4,17 @@ from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import Scrip
 
 
 class ACodeBlock(ScriptRootNode):
+    __slots__ = ()
+
     def __init__(self, start: int = 0, end: int = 0):
         super().__init__(start, end)
 
     def __str__(self) -> str:
-        buff = []
-        buff.append(self.tabs + "{" + self.newline)
-        for child in self.children:
-            buff.append(str(child))
-        buff.append(self.tabs + "}" + self.newline)
-        return "".join(buff)
+        return self.render()
 
+    def write(self, out: list[str]):
+        tabs, newline = self.tabs, self.newline
+        out.append(f"{tabs}{{{newline}")
+        for child in self.children:
+            child.write(out)
+        out.append(f"{tabs}}}{newline}")
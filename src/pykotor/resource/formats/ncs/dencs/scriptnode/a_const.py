@@ -23,7 +23,7 @@ class AConst(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         self.theconst = stackentry  # type: ignore
 
-    def close(self):
-        super().close()
+    def _release(self, stack: list):
+        super()._release(stack)
         self.theconst = None
 
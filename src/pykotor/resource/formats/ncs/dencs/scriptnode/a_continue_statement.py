@@ -8,5 +8,5 @@ class AContinueStatement(ScriptNode):
         super().__init__()
 
     def __str__(self) -> str:
-        return self.tabs + "continue;" + self.newline
+        return f"{self.tabs}continue;{self.newline}"
 
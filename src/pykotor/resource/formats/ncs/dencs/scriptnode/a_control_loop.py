@@ -8,6 +8,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
 
 class AControlLoop(ScriptRootNode):
+    _close_fields = ("condition",)
+
     def __init__(self, start: int = 0, end: int = 0):
         super().__init__(start, end)
         self.condition: AExpression | None = None
@@ -16,15 +18,9 @@ class AControlLoop(ScriptRootNode):
         self.end = end
 
     def condition(self, condition: AExpression):
-        condition.parent(self)  # type: ignore
+        condition.set_parent(self)
         self.condition = condition
 
     def condition(self) -> AExpression | None:
         return self.condition
 
-    def close(self):
-        super().close()
-        if self.condition is not None:
-            self.condition.close()  # type: ignore
-            self.condition = None
-
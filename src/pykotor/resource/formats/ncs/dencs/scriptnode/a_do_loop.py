@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 from pykotor.resource.formats.ncs.dencs.scriptnode.a_control_loop import AControlLoop  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_DO_LOOP, write_value  # pyright: ignore[reportMissingImports]
 
 
 class ADoLoop(AControlLoop):
+    KIND = KIND_DO_LOOP
+
     def __init__(self, start: int = 0, end: int = 0):
         super().__init__(start, end)
 
     def __str__(self) -> str:
-        buff = []
-        buff.append(self.tabs)
-        buff.append("do {" + self.newline)
+        return self.render()
+
+    def write(self, out: list[str]):
+        tabs, newline = self.tabs, self.newline
+        out.append(f"{tabs}do {{{newline}")
         for child in self.children:
-            buff.append(str(child))
-        buff.append(self.tabs + "} while (" + str(self.condition) + ");" + self.newline)
-        return "".join(buff)
+            child.write(out)
+        out.append(f"{tabs}}} while (")
+        write_value(out, self.condition)
+        out.append(f");{newline}")
 
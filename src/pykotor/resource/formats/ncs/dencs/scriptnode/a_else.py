@@ -8,10 +8,12 @@ class AElse(ScriptRootNode):
         super().__init__(start, end)
 
     def __str__(self) -> str:
-        buff = []
-        buff.append(self.tabs + "else {" + self.newline)
+        return self.render()
+
+    def write(self, out: list[str]):
+        tabs, newline = self.tabs, self.newline
+        out.append(f"{tabs}else {{{newline}")
         for child in self.children:
-            buff.append(str(child))
-        buff.append(self.tabs + "}" + self.newline)
-        return "".join(buff)
+            child.write(out)
+        out.append(f"{tabs}}}{newline}")
 
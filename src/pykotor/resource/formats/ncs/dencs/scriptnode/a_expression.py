@@ -1,12 +1,23 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AExpression(ABC):
+    __slots__ = ()
+
+    # False on expressions whose stackentry()/set_stackentry() are stubs, so callers can skip the call.
+    HAS_STACKENTRY: ClassVar[bool] = True
+    IS_EXPRESSION: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Expressions list ScriptNode first in their bases, so its False default would otherwise win.
+        cls.IS_EXPRESSION = True
+
     @abstractmethod
     def __str__(self) -> str:
         pass
@@ -2,30 +2,32 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_EXPRESSION_STATEMENT, ScriptNode  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
 
 class AExpressionStatement(ScriptNode):
+    KIND = KIND_EXPRESSION_STATEMENT
+    _close_fields = ("exp",)
+
     def __init__(self, exp: AExpression):
         super().__init__()
-        exp.parent(self)  # type: ignore
+        exp.set_parent(self)
         self.exp: AExpression = exp
 
     def exp(self) -> AExpression:
         return self.exp
 
     def __str__(self) -> str:
-        return self.tabs + str(self.exp) + ";" + self.newline
+        return self.render()
 
-    def parent(self, parent: ScriptNode | None):
-        super().parent(parent)
-        self.exp.parent(self)  # type: ignore
+    def write(self, out: list[str]):
+        out.append(self.tabs)
+        self.exp.write(out)
+        out.append(f";{self.newline}")
 
-    def close(self):
-        super().close()
-        if self.exp is not None:
-            self.exp.close()  # type: ignore
-        self.exp = None
+    def set_parent(self, parent: ScriptNode | None):
+        super().set_parent(parent)
+        self.exp.set_parent(self)  # type: ignore
 
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AFcnCallExp(ScriptNode, AExpression):
+    _close_fields = ("params", "_stackentry")
+
     def __init__(self, id_val: int, params: list[AExpression]):
         super().__init__()
         self.id: int = id_val
@@ -18,18 +20,19 @@ class AFcnCallExp(ScriptNode, AExpression):
         self._stackentry: StackEntry | None = None
 
     def add_param(self, param: AExpression):
-        param.parent(self)  # type: ignore
+        param.set_parent(self)
         self.params.append(param)
 
     def __str__(self) -> str:
-        buff = []
-        buff.append("sub" + str(self.id) + "(")
-        prefix = ""
-        for param in self.params:
-            buff.append(prefix + str(param))
-            prefix = ", "
-        buff.append(")")
-        return "".join(buff)
+        return self.render()
+
+    def write(self, out: list[str]):
+        out.append(f"sub{self.id}(")
+        for i, param in enumerate(self.params):
+            if i:
+                out.append(", ")
+            param.write(out)
+        out.append(")")
 
     def stackentry(self) -> StackEntry:
         return self._stackentry
@@ -37,13 +40,3 @@ class AFcnCallExp(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         self._stackentry = stackentry
 
-    def close(self):
-        super().close()
-        if self.params is not None:
-            for param in self.params:
-                param.close()  # type: ignore
-        self.params = None
-        if self._stackentry is not None:
-            self._stackentry.close()
-        self._stackentry = None
-
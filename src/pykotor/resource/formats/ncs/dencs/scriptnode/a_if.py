@@ -3,21 +3,28 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.scriptnode.a_control_loop import AControlLoop  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_IF, write_value  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
 
 class AIf(AControlLoop):
+    KIND = KIND_IF
+
     def __init__(self, start: int = 0, end: int = 0, condition: AExpression | None = None):
         super().__init__(start, end)
         if condition is not None:
             self.condition(condition)
 
     def __str__(self) -> str:
-        buff = []
-        buff.append(self.tabs + "if (" + str(self.condition) + ") {" + self.newline)
+        return self.render()
+
+    def write(self, out: list[str]):
+        tabs, newline = self.tabs, self.newline
+        out.append(f"{tabs}if (")
+        write_value(out, self.condition)
+        out.append(f") {{{newline}")
         for child in self.children:
-            buff.append(str(child))
-        buff.append(self.tabs + "}" + self.newline)
-        return "".join(buff)
+            child.write(out)
+        out.append(f"{tabs}}}{newline}")
 
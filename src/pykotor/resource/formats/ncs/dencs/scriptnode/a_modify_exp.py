@@ -3,13 +3,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression
-from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_MODIFY_EXP, ScriptNode
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AModifyExp(ScriptNode, AExpression):
+    KIND = KIND_MODIFY_EXP
+    _close_fields = ("_exp", "varref")
+
     def __init__(self, varref: AVarRef, exp: AExpression):
         super().__init__()
         self.set_var_ref(varref)
@@ -17,11 +20,11 @@ class AModifyExp(ScriptNode, AExpression):
 
     def set_var_ref(self, varref: AVarRef):
         self.varref = varref
-        varref.parent(self)  # type: ignore
+        varref.set_parent(self)
 
     def set_expression(self, exp: AExpression):
         self._exp = exp
-        exp.parent(self)  # type: ignore
+        exp.set_parent(self)
 
     def expression(self) -> AExpression:
         return self._exp
@@ -30,7 +33,12 @@ class AModifyExp(ScriptNode, AExpression):
         return self.varref
 
     def __str__(self) -> str:
-        return str(self.varref) + " = " + str(self._exp)
+        return self.render()
+
+    def write(self, out: list[str]):
+        self.varref.write(out)
+        out.append(" = ")
+        self._exp.write(out)
 
     def stackentry(self) -> StackEntry:
         return self.varref.var()
@@ -38,12 +46,3 @@ class AModifyExp(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         pass
 
-    def close(self):
-        super().close()
-        if self._exp is not None:
-            self._exp.close()  # type: ignore
-        self._exp = None
-        if self.varref is not None:
-            self.varref.close()
-        self.varref = None
-
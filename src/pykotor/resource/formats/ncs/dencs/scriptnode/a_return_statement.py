@@ -2,32 +2,34 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode, write_value  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
 
 class AReturnStatement(ScriptNode):
+    _close_fields = ("returnexp",)
+
     def __init__(self, returnexp: AExpression | None = None):
         super().__init__()
         if returnexp is not None:
             self.returnexp(returnexp)
 
     def returnexp(self, returnexp: AExpression):
-        returnexp.parent(self)  # type: ignore
+        returnexp.set_parent(self)
         self.returnexp: AExpression | None = returnexp
 
     def exp(self) -> AExpression | None:
         return self.returnexp
 
     def __str__(self) -> str:
+        return self.render()
+
+    def write(self, out: list[str]):
         if self.returnexp is None:
-            return self.tabs + "return;" + self.newline
-        return self.tabs + "return " + str(self.returnexp) + ";" + self.newline
-
-    def close(self):
-        super().close()
-        if self.returnexp is not None:
-            self.returnexp.close()  # type: ignore
-        self.returnexp = None
+            out.append(f"{self.tabs}return;{self.newline}")
+            return
+        out.append(f"{self.tabs}return ")
+        write_value(out, self.returnexp)
+        out.append(f";{self.newline}")
 
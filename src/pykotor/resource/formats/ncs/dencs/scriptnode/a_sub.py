@@ -3,17 +3,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class ASub(ScriptRootNode):
+    _close_fields = ("params", "_type")
+
     def __init__(self, type_val: Type | int, id_val: int | None = None, params: list[AVarRef] | None = None, start: int = 0, end: int = 0):
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         super().__init__(start, end)
+        self.ismain: bool = False
         if isinstance(type_val, int):
-            self._type: Type = Type(type_val)
+            self._type: Type = Type.get(type_val)
         else:
             self._type = type_val
         if id_val is not None:
@@ -25,36 +27,35 @@ class ASub(ScriptRootNode):
                     self.add_param(param)
             self._name: str = "sub" + str(id_val)
         else:
-            self._type = Type(0)
+            self._type = Type.get(0)
             self.params = None
             self.tabs = ""
+            self._name = ""
 
     def add_param(self, param: AVarRef):
-        param.parent(self)  # type: ignore
+        param.set_parent(self)
         if self.params is None:
             self.params = []
         self.params.append(param)
 
     def __str__(self) -> str:
-        return self.get_header() + " {" + self.newline + self.get_body() + "}" + self.newline
+        return self.render()
 
-    def get_body(self) -> str:
-        buff = []
+    def write(self, out: list[str]):
+        newline = self.newline
+        out.append(f"{self.get_header()} {{{newline}")
         for child in self.children:
-            buff.append(str(child))
-        return "".join(buff)
+            child.write(out)
+        out.append(f"}}{newline}")
+
+    def get_body(self) -> str:
+        return "".join(map(str, self.children))
 
     def get_header(self) -> str:
-        buff = []
-        buff.append(str(self._type) + " " + self._name + "(")
-        link = ""
+        params = ""
         if self.params is not None:
-            for param in self.params:
-                ptype = param.type()
-                buff.append(link + str(ptype) + " " + str(param))
-                link = ", "
-        buff.append(")")
-        return "".join(buff)
+            params = ", ".join([f"{param.type()} {param}" for param in self.params])
+        return f"{self._type} {self._name}({params})"
 
     def set_is_main(self, ismain: bool):
         self.ismain = ismain
@@ -65,7 +66,7 @@ class ASub(ScriptRootNode):
                 self._name = "main"
 
     def is_main(self) -> bool:
-        return getattr(self, 'ismain', False)
+        return self.ismain
 
     def type(self) -> Type:
         return self._type
@@ -74,7 +75,7 @@ class ASub(ScriptRootNode):
         self._name = name
 
     def name(self) -> str:
-        return getattr(self, '_name', '')
+        return self._name
 
     def get_param_vars(self) -> list:
         vars_list = []
@@ -83,13 +84,3 @@ class ASub(ScriptRootNode):
                 vars_list.append(param.var())
         return vars_list
 
-    def close(self):
-        super().close()
-        if self.params is not None:
-            for param in self.params:
-                param.close()
-        self.params = None
-        if self._type is not None:
-            self._type.close()
-        self._type = None
-
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_SWITCH, ScriptNode, write_value  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
 
 class ASwitch(ScriptNode):
+    KIND = KIND_SWITCH
+    _close_fields = ("cases", "defaultcase", "switchexp")
+
     def __init__(self, start: int, switchexp: AExpression):
         super().__init__()
         self.start: int = start
@@ -17,7 +22,7 @@ class ASwitch(ScriptNode):
         self.switch_exp(switchexp)
 
     def switch_exp(self, switchexp: AExpression):
-        switchexp.parent(self)  # type: ignore
+        switchexp.set_parent(self)
         self.switchexp: AExpression = switchexp
 
     def switch_exp(self) -> AExpression:
@@ -34,11 +39,11 @@ class ASwitch(ScriptNode):
         return getattr(self, 'end_val', -1)
 
     def add_case(self, acase: ASwitchCase):
-        acase.parent(self)  # type: ignore
+        acase.set_parent(self)
         self.cases.append(acase)
 
     def add_default_case(self, acase: ASwitchCase):
-        acase.parent(self)  # type: ignore
+        acase.set_parent(self)
         self.defaultcase = acase
 
     def get_last_case(self) -> ASwitchCase | None:
@@ -59,6 +64,12 @@ class ASwitch(ScriptNode):
             return self.cases[index]
         return self.defaultcase
 
+    def iter_cases(self) -> Iterator[ASwitchCase]:
+        """Yield the cases in order followed by the default case, same order as get_next_case()."""
+        yield from self.cases
+        if self.defaultcase is not None:
+            yield self.defaultcase
+
     def get_first_case(self) -> ASwitchCase | None:
         if len(self.cases) > 0:
             return self.cases[0]
@@ -72,25 +83,16 @@ class ASwitch(ScriptNode):
         return -1
 
     def __str__(self) -> str:
-        buff = []
-        buff.append(self.tabs + "switch (" + str(self.switchexp) + ") {" + self.newline)
-        for case in self.cases:
-            buff.append(str(case))
-        if self.defaultcase is not None:
-            buff.append(str(self.defaultcase))
-        buff.append(self.tabs + "}" + self.newline)
-        return "".join(buff)
-
-    def close(self):
-        super().close()
-        if self.cases is not None:
-            for case in self.cases:
-                case.close()
-        self.cases = None
+        return self.render()
+
+    def write(self, out: list[str]):
+        tabs, newline = self.tabs, self.newline
+        out.append(f"{tabs}switch (")
+        write_value(out, self.switchexp)
+        out.append(f") {{{newline}")
+        for acase in self.cases:
+            acase.write(out)
         if self.defaultcase is not None:
-            self.defaultcase.close()
-        self.defaultcase = None
-        if self.switchexp is not None:
-            self.switchexp.close()  # type: ignore
-        self.switchexp = None
+            self.defaultcase.write(out)
+        out.append(f"{tabs}}}{newline}")
 
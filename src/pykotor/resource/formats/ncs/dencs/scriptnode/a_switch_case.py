@@ -2,14 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_unk_loop_control import AUnkLoopControl  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_SWITCH_CASE, ScriptNode  # pyright: ignore[reportMissingImports]
 from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_const import AConst  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.scriptnode.a_unk_loop_control import AUnkLoopControl  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode  # pyright: ignore[reportMissingImports]
 
 class ASwitchCase(ScriptRootNode):
+    KIND = KIND_SWITCH_CASE
+    _close_fields = ("_val",)
+
     def __init__(self, start: int, val: AConst | None = None):
         super().__init__(start, -1)
         if val is not None:
@@ -19,11 +22,10 @@ class ASwitchCase(ScriptRootNode):
         self.end = end
 
     def val(self, val: AConst):
-        val.parent(self)  # type: ignore
+        val.set_parent(self)
         self._val: AConst = val
 
     def get_unknowns(self) -> list:
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_unk_loop_control import AUnkLoopControl  # pyright: ignore[reportMissingImports]
         unks = []
         for node in self.children:
             if isinstance(node, AUnkLoopControl):
@@ -31,24 +33,17 @@ class ASwitchCase(ScriptRootNode):
         return unks
 
     def replace_unknown(self, unk: AUnkLoopControl, newnode: ScriptNode):
-        newnode.parent(self)  # type: ignore
+        newnode.set_parent(self)
         index = self.children.index(unk)
         self.children[index] = newnode
-        unk.parent(None)  # type: ignore
+        unk.set_parent(None)
 
     def __str__(self) -> str:
-        buff = []
-        if self._val is None:
-            buff.append(self.tabs + "default:" + self.newline)
-        else:
-            buff.append(self.tabs + "case " + str(self._val) + ":" + self.newline)
+        return self.render()
+
+    def write(self, out: list[str]):
+        label = "default" if self._val is None else f"case {self._val}"
+        out.append(f"{self.tabs}{label}:{self.newline}")
         for child in self.children:
-            buff.append(str(child))
-        return "".join(buff)
-
-    def close(self):
-        super().close()
-        if self._val is not None:
-            self._val.close()
-        self._val = None
+            child.write(out)
 
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AUnaryExp(ScriptNode, AExpression):
+    _close_fields = ("_exp", "_stackentry")
+
     def __init__(self, exp: AExpression, op: str):
         super().__init__()
         self.set_exp(exp)
@@ -17,13 +19,18 @@ class AUnaryExp(ScriptNode, AExpression):
 
     def set_exp(self, exp: AExpression):
         self._exp = exp
-        exp.parent(self)  # type: ignore
+        exp.set_parent(self)
 
     def exp(self) -> AExpression:
         return self._exp
 
     def __str__(self) -> str:
-        return "(" + self.op + str(self._exp) + ")"
+        return self.render()
+
+    def write(self, out: list[str]):
+        out.append(f"({self.op}")
+        self._exp.write(out)
+        out.append(")")
 
     def stackentry(self) -> StackEntry:
         return self._stackentry
@@ -31,12 +38,3 @@ class AUnaryExp(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         self._stackentry = stackentry
 
-    def close(self):
-        super().close()
-        if self._exp is not None:
-            self._exp.close()  # type: ignore
-        self._exp = None
-        if self._stackentry is not None:
-            self._stackentry.close()
-        self._stackentry = None
-
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AUnaryModExp(ScriptNode, AExpression):
+    _close_fields = ("varref", "_stackentry")
+
     def __init__(self, varref: AVarRef, op: str, prefix: bool):
         super().__init__()
         self.set_var_ref(varref)
@@ -19,15 +21,23 @@ class AUnaryModExp(ScriptNode, AExpression):
 
     def set_var_ref(self, varref: AVarRef):
         self.varref = varref
-        varref.parent(self)  # type: ignore
+        varref.set_parent(self)
 
     def var_ref(self) -> AVarRef:
         return self.varref
 
     def __str__(self) -> str:
+        return self.render()
+
+    def write(self, out: list[str]):
         if self.prefix:
-            return "(" + self.op + str(self.varref) + ")"
-        return "(" + str(self.varref) + self.op + ")"
+            out.append(f"({self.op}")
+            self.varref.write(out)
+            out.append(")")
+        else:
+            out.append("(")
+            self.varref.write(out)
+            out.append(f"{self.op})")
 
     def stackentry(self) -> StackEntry:
         return self._stackentry
@@ -35,12 +45,3 @@ class AUnaryModExp(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         self._stackentry = stackentry
 
-    def close(self):
-        super().close()
-        if self.varref is not None:
-            self.varref.close()
-        self.varref = None
-        if self._stackentry is not None:
-            self._stackentry.close()
-        self._stackentry = None
-
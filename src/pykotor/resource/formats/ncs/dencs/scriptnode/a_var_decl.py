@@ -2,14 +2,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_VAR_DECL, ScriptNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class AVarDecl(ScriptNode):
+    __slots__ = ("_var", "_exp", "_is_fcn_return", "_str", "_str_name", "_str_tabs")
+    KIND = KIND_VAR_DECL
+    _close_fields = ("_exp", "_var")
+
     def __init__(self, var: Variable):
         super().__init__()
         self.set_var_var(var)
@@ -18,6 +22,7 @@ class AVarDecl(ScriptNode):
 
     def set_var_var(self, var: Variable):
         self._var = var
+        self._str = None
 
     def var_var(self) -> Variable:
         return self._var
@@ -32,13 +37,13 @@ class AVarDecl(ScriptNode):
         return self._var.type()
 
     def initialize_exp(self, exp: AExpression):
-        exp.parent(self)  # type: ignore
+        exp.set_parent(self)
         self._exp = exp
 
     def remove_exp(self) -> AExpression | None:
         aexp = self._exp
         if self._exp is not None:
-            self._exp.parent(None)  # type: ignore
+            self._exp.set_parent(None)
         self._exp = None
         return aexp
 
@@ -47,15 +52,24 @@ class AVarDecl(ScriptNode):
 
     def __str__(self) -> str:
         if self._exp is None:
-            return self.tabs + self._var.to_decl_string() + ";" + self.newline
-        return self.tabs + self._var.to_decl_string() + " = " + str(self._exp) + ";" + self.newline
+            var = self._var
+            if type(var) is not Variable:
+                return f"{self.tabs}{var.to_decl_string()};{self.newline}"
+            # A plain variable's type is fixed, so the bare declaration only changes with the name or indent.
+            name = var._name
+            tabs = self.tabs
+            if self._str is None or self._str_name is not name or self._str_tabs is not tabs:
+                self._str = f"{tabs}{var.to_decl_string()};{self.newline}"
+                self._str_name = name
+                self._str_tabs = tabs
+            return self._str
+        return self.render()
 
-    def close(self):
-        super().close()
-        if self._exp is not None:
-            self._exp.close()  # type: ignore
-        self._exp = None
-        if self._var is not None:
-            self._var.close()
-        self._var = None
+    def write(self, out: list[str]):
+        if self._exp is None:
+            out.append(str(self))
+            return
+        out.append(f"{self.tabs}{self._var.to_decl_string()} = ")
+        self._exp.write(out)
+        out.append(f";{self.newline}")
 
@@ -3,15 +3,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression
-from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_VAR_REF, ScriptNode
 from pykotor.resource.formats.ncs.dencs.stack.var_struct import VarStruct
+from pykotor.resource.formats.ncs.dencs.stack.variable import Variable
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class AVarRef(ScriptNode, AExpression):
+    KIND = KIND_VAR_REF
+    __slots__ = ("_var", "_str", "_str_name")
+    _close_fields = ("_var",)
+
     def __init__(self, var: Variable | VarStruct):
         super().__init__()
         self.set_var(var)
@@ -23,20 +27,26 @@ class AVarRef(ScriptNode, AExpression):
         return self._var
 
     def set_var(self, var: Variable | VarStruct):
-        if isinstance(var, VarStruct):
-            self._var = var
-        else:
-            self._var = var
+        self._var = var
+        self._str = None
 
     def choose_struct_element(self, var: Variable):
-        from pykotor.resource.formats.ncs.dencs.stack.var_struct import VarStruct  # pyright: ignore[reportMissingImports]
         if isinstance(self._var, VarStruct) and self._var.contains(var):
-            self._var = var
+            self.set_var(var)
             return
         raise RuntimeError("Attempted to select a struct element not in struct")
 
     def __str__(self) -> str:
-        return str(self._var)
+        var = self._var
+        # Struct members render through update_names(), so only plain variables are cached, and
+        # only while they keep the name the text was built from.
+        if type(var) is not Variable or var._varstruct is not None:
+            return str(var)
+        name = var._name
+        if self._str is None or self._str_name is not name:
+            self._str = str(var)
+            self._str_name = name
+        return self._str
 
     def stackentry(self) -> StackEntry:
         return self._var
@@ -44,9 +54,3 @@ class AVarRef(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         self.set_var(stackentry)  # type: ignore
 
-    def close(self):
-        super().close()
-        if self._var is not None:
-            self._var.close()
-        self._var = None
-
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression
 from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode
@@ -9,6 +9,11 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
 
 class AVectorConstExp(ScriptNode, AExpression):
+    __slots__ = ("_exp1", "_exp2", "_exp3")
+    _close_fields = ("_exp1", "_exp2", "_exp3")
+
+    HAS_STACKENTRY: ClassVar[bool] = False
+
     def __init__(self, exp1: AExpression, exp2: AExpression, exp3: AExpression):
         super().__init__()
         self.set_exp1(exp1)
@@ -17,15 +22,15 @@ class AVectorConstExp(ScriptNode, AExpression):
 
     def set_exp1(self, exp1: AExpression):
         self._exp1 = exp1
-        exp1.parent(self)  # type: ignore
+        exp1.set_parent(self)
 
     def set_exp2(self, exp2: AExpression):
         self._exp2 = exp2
-        exp2.parent(self)  # type: ignore
+        exp2.set_parent(self)
 
     def set_exp3(self, exp3: AExpression):
         self._exp3 = exp3
-        exp3.parent(self)  # type: ignore
+        exp3.set_parent(self)
 
     def exp1(self) -> AExpression:
         return self._exp1
@@ -37,7 +42,16 @@ class AVectorConstExp(ScriptNode, AExpression):
         return self._exp3
 
     def __str__(self) -> str:
-        return "[" + str(self._exp1) + "," + str(self._exp2) + "," + str(self._exp3) + "]"
+        return self.render()
+
+    def write(self, out: list[str]):
+        out.append("[")
+        self._exp1.write(out)
+        out.append(",")
+        self._exp2.write(out)
+        out.append(",")
+        self._exp3.write(out)
+        out.append("]")
 
     def stackentry(self) -> StackEntry | None:
         return None
@@ -45,15 +59,3 @@ class AVectorConstExp(ScriptNode, AExpression):
     def set_stackentry(self, stackentry: StackEntry):
         pass
 
-    def close(self):
-        super().close()
-        if self._exp1 is not None:
-            self._exp1.close()  # type: ignore
-        self._exp1 = None
-        if self._exp2 is not None:
-            self._exp2.close()  # type: ignore
-        self._exp2 = None
-        if self._exp3 is not None:
-            self._exp3.close()  # type: ignore
-        self._exp3 = None
-
@@ -2,22 +2,96 @@ from __future__ import annotations
 
 import os
 
+from typing import ClassVar
+
+# Node kind tags. Passes compare node.KIND against these for exact-class tests instead of calling isinstance.
+KIND_OTHER = 0
+KIND_VAR_DECL = 1
+KIND_EXPRESSION_STATEMENT = 2
+KIND_MODIFY_EXP = 3
+KIND_SWITCH = 4
+KIND_IF = 5
+KIND_DO_LOOP = 6
+KIND_WHILE_LOOP = 7
+KIND_SWITCH_CASE = 8
+KIND_VAR_REF = 9
+
+# Shared indent strings, one per nesting depth, so reparenting never builds a new tabs string.
+_INDENTS: tuple[str, ...] = tuple("\t" * i for i in range(128))
+
 
 class ScriptNode:
+    __slots__ = ("_parent", "_depth", "tabs")
+
+    KIND: ClassVar[int] = KIND_OTHER
+    # Set to True on every AExpression subclass by AExpression.__init_subclass__.
+    IS_EXPRESSION: ClassVar[bool] = False
+    # Attributes holding objects this node owns. close() closes each value (every element, for
+    # lists) and then nulls the attribute.
+    _close_fields: ClassVar[tuple[str, ...]] = ()
+    newline: str = os.linesep
+
     def __init__(self):
         self._parent: ScriptNode | None = None
-        self.tabs: str = ""
-        self.newline: str = os.linesep
+        self._depth: int = 0
+        self.tabs: str = _INDENTS[0]
 
     def parent(self, parent: ScriptNode | None = ...) -> ScriptNode | None:
-        """Get or set parent. Call without args to get, with arg to set."""
+        """Get or set parent. Call without args to get, with arg to set.
+
+        Kept for existing callers; prefer get_parent()/set_parent().
+        """
         if parent is ...:
             return self._parent
+        self.set_parent(parent)
+        return None
+
+    def write(self, out: list[str]):
+        """Append this node's text to out.
+
+        Nodes that hold other nodes override this so a whole tree renders into one buffer.
+        """
+        out.append(str(self))
+
+    def render(self) -> str:
+        out: list[str] = []
+        self.write(out)
+        return "".join(out)
+
+    def get_parent(self) -> ScriptNode | None:
+        return self._parent
+
+    def set_parent(self, parent: ScriptNode | None):
         self._parent = parent
         if parent is not None:
-            self.tabs = parent.tabs + "\t"
-        return None
+            depth = self._depth = parent._depth + 1
+            self.tabs = _INDENTS[depth] if depth < len(_INDENTS) else "\t" * depth
 
     def close(self):
+        # Owned nodes are released from an explicit stack so deep trees do not recurse.
+        stack: list = [self]
+        pop = stack.pop
+        while stack:
+            node = pop()
+            if isinstance(node, ScriptNode):
+                node._release(stack)
+            else:
+                node.close()
+
+    def _release(self, stack: list):
         self._parent = None
+        for name in self._close_fields:
+            value = getattr(self, name, None)
+            setattr(self, name, None)
+            if type(value) is list:
+                stack.extend(value)
+            elif value is not None:
+                stack.append(value)
+
 
+def write_value(out: list[str], value):
+    """Write a slot that may hold something other than a node (None, an unset condition) the way str() would."""
+    if isinstance(value, ScriptNode):
+        value.write(out)
+    else:
+        out.append(str(value))
@@ -1,35 +1,73 @@
 from __future__ import annotations
 
-from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import _INDENTS, ScriptNode  # pyright: ignore[reportMissingImports]
 
 
 class ScriptRootNode(ScriptNode):
+    __slots__ = ("children", "_child_index", "start", "end")
+
     def __init__(self, start: int = 0, end: int = 0):
         super().__init__()
         self.children: list[ScriptNode] = []
+        # id(child) -> position in children. Entries are verified on use and the map is rebuilt
+        # when stale, since removals shift positions and some passes edit children directly.
+        self._child_index: dict[int, int] = {}
         self.start: int = start
         self.end: int = end
 
+    def _locate(self, child: ScriptNode) -> int:
+        children = self.children
+        index = self._child_index
+        i = index.get(id(child))
+        if i is not None and i < len(children) and children[i] is child:
+            return i
+        # Every path that puts a node in children also parents it here, so a node parented
+        # elsewhere is a miss and there is no need to rebuild the map to find that out.
+        if i is None and child._parent is not self:
+            return -1
+        index.clear()
+        for j in range(len(children) - 1, -1, -1):
+            index[id(children[j])] = j
+        return index.get(id(child), -1)
+
     def add_child(self, child: ScriptNode):
-        child.parent(self)  # type: ignore
+        child.set_parent(self)
+        self._child_index.setdefault(id(child), len(self.children))
         self.children.append(child)
 
     def add_children(self, children: list[ScriptNode]):
+        # Every child lands at the same depth, so the indent is looked up once for the batch.
+        depth = self._depth + 1
+        tabs = _INDENTS[depth] if depth < len(_INDENTS) else "\t" * depth
+        index = self._child_index
+        mine = self.children
+        base_set_parent = ScriptNode.set_parent
         for child in children:
-            self.add_child(child)
+            if type(child).set_parent is base_set_parent:
+                child._parent = self
+                child._depth = depth
+                child.tabs = tabs
+            else:
+                child.set_parent(self)
+            index.setdefault(id(child), len(mine))
+            mine.append(child)
 
     def remove_child(self, child: ScriptNode):
-        if child in self.children:
-            self.children.remove(child)
-            child.parent(None)  # type: ignore
+        i = self._locate(child)
+        if i >= 0:
+            del self.children[i]
+            del self._child_index[id(child)]
+            child.set_parent(None)
 
     def replace_child(self, old_child: ScriptNode, new_child: ScriptNode):
         """Replace an old child with a new child, maintaining the same position."""
-        if old_child in self.children:
-            index = self.children.index(old_child)
-            old_child.parent(None)  # type: ignore
-            new_child.parent(self)  # type: ignore
+        index = self._locate(old_child)
+        if index >= 0:
+            old_child.set_parent(None)
+            new_child.set_parent(self)
             self.children[index] = new_child
+            del self._child_index[id(old_child)]
+            self._child_index[id(new_child)] = index
 
     def remove_children(self, first: int | None = None, last: int | None = None) -> list[ScriptNode]:
         """Remove children from the list.
@@ -45,8 +83,9 @@ class ScriptRootNode(ScriptNode):
             # Remove all children
             children = list(self.children)
             for child in children:
-                child.parent(None)  # type: ignore
+                child.set_parent(None)
             self.children.clear()
+            self._child_index.clear()
             return children
         elif first is not None and last is None:
             # Remove from first to end
@@ -55,20 +94,24 @@ class ScriptRootNode(ScriptNode):
         if first is None:
             first = 0
         
-        removed: list[ScriptNode] = []
-        # Remove from end to start to preserve indices
-        for i in range(last, first - 1, -1):
-            if 0 <= i < len(self.children):
-                child = self.children.pop(i)
-                child.parent(None)  # type: ignore
-                removed.insert(0, child)  # Insert at beginning to maintain order
+        # Clamp to the list so out-of-range bounds are ignored rather than wrapping around
+        lo = max(first, 0)
+        hi = min(last + 1, len(self.children))
+        if lo >= hi:
+            return []
+        removed = self.children[lo:hi]
+        del self.children[lo:hi]
+        for child in removed:
+            child.set_parent(None)
+        self._child_index.clear()
         return removed
 
     def remove_last_child(self) -> ScriptNode | None:
         if not self.children:
             return None
         child = self.children.pop()
-        child.parent(None)  # type: ignore
+        self._child_index.pop(id(child), None)
+        child.set_parent(None)
         return child
 
     def get_children(self) -> list[ScriptNode]:
@@ -93,15 +136,11 @@ class ScriptRootNode(ScriptNode):
 
     def get_child_location(self, child: ScriptNode) -> int:
         """Get the index of a child node, or -1 if not found."""
-        try:
-            return self.children.index(child)
-        except ValueError:
-            return -1
+        return self._locate(child)
 
-    def close(self):
-        super().close()
-        if self.children:
-            for child in self.children:
-                child.close()
+    def _release(self, stack: list):
+        super()._release(stack)
+        stack.extend(self.children)
         self.children.clear()
+        self._child_index.clear()
 
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_code_block import ACodeBlock  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression_statement import AExpressionStatement  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_EXPRESSION_STATEMENT, KIND_MODIFY_EXP, KIND_SWITCH, KIND_VAR_DECL  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
+
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_sub import ASub  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.scriptutils.sub_script_state import SubScriptState  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.node_analysis_data import NodeAnalysisData  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.subroutine_analysis_data import SubroutineAnalysisData  # pyright: ignore[reportMissingImports]
@@ -18,7 +23,10 @@ class CleanupPass:
 
     def apply(self):
         self._check_sub_code_block()
-        self._apply(self.root)
+        # Nested blocks and switch cases are queued instead of recursed into, so nesting depth costs no frames.
+        stack: list[ScriptRootNode] = [self.root]
+        while stack:
+            self._apply_one(stack.pop(), stack)
 
     def done(self):
         self.root = None
@@ -27,63 +35,71 @@ class CleanupPass:
         self.state = None
 
     def _check_sub_code_block(self):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_code_block import ACodeBlock  # pyright: ignore[reportMissingImports]
         if self.root.size() == 1 and isinstance(self.root.get_last_child(), ACodeBlock):
             block = self.root.remove_last_child()
             children = block.remove_children()
             self.root.add_children(children)
 
-    def _apply(self, rootnode: ScriptRootNode):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression_statement import AExpressionStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_modify_exp import AModifyExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
-        
+    def _apply_one(self, rootnode: ScriptRootNode, stack: list[ScriptRootNode]):
+        # Survivors are copied into a fresh list instead of popping merged nodes out of
+        # children in place, so the scan stays linear.
         children = rootnode.get_children()
-        for i, node1 in enumerate(children):
+        count = len(children)
+        out: list = []
+        append = out.append
+        nested: list[ScriptRootNode] = []
+        i = 0
+        while i < count:
+            node1 = children[i]
+            i += 1
             # Process struct var declarations
-            if isinstance(node1, AVarDecl):
+            if node1.KIND == KIND_VAR_DECL:
                 var = node1.var_var()
                 if var is not None and var.is_struct():
-                    struct = node1.var_var().varstruct()
-                    structdec = AVarDecl(struct)
-                    # Find and merge consecutive struct declarations
-                    j = i + 1
-                    while j < len(children) and isinstance(children[j], AVarDecl) and struct.equals(children[j].var_var().varstruct()):
-                        children.pop(j)
-                    if j < len(children):
-                        structdec.parent(children[j].parent())
-                    children[i] = structdec
-                    node1 = structdec
-            
+                    struct = var.varstruct()
+                    struct_id = struct._id
+                    # Skip past consecutive declarations of the same struct
+                    while i < count and children[i].KIND == KIND_VAR_DECL:
+                        other = children[i].var_var().varstruct()
+                        if other is None or other._id != struct_id:
+                            break
+                        i += 1
+                    if node1.exp() is None:
+                        # Nothing to drop, so the member declaration can become the struct declaration in place.
+                        # The state must then stop treating it as the member's declaration.
+                        vardecs = self.state.vardecs if self.state is not None else None
+                        if vardecs and vardecs.get(var) is node1:
+                            vardecs[var] = None
+                        node1.set_var_var(struct)
+                        node1.set_is_fcn_return(False)
+                    else:
+                        structdec = AVarDecl(struct)
+                        structdec.set_parent(rootnode)
+                        node1 = structdec
+
             # Combine var decl with immediate assignment
-            if isinstance(node1, AVarDecl) and i + 1 < len(children):
-                node2 = children[i + 1]
-                if isinstance(node2, AExpressionStatement) and isinstance(node2.exp(), AModifyExp):
+            if node1.KIND == KIND_VAR_DECL and i < count:
+                node2 = children[i]
+                if node2.KIND == KIND_EXPRESSION_STATEMENT and node2.exp().KIND == KIND_MODIFY_EXP:
                     modexp = node2.exp()
                     if node1.var_var() == modexp.var_ref().var():
-                        children.pop(i + 1)
+                        i += 1
                         node1.initialize_exp(modexp.expression())
-            
+
             # Wrap dangling expressions
-            if self._is_dangling_expression(node1):
+            if node1.IS_EXPRESSION:
                 expstm = AExpressionStatement(node1)
-                expstm.parent(rootnode)
-                children[i] = expstm
-            
+                expstm.set_parent(rootnode)
+                append(expstm)
+            else:
+                append(node1)
+
             # Recursively process nested structures
             if isinstance(node1, ScriptRootNode):
-                self._apply(node1)
-            if isinstance(node1, ASwitch):
-                acase = None
-                while True:
-                    acase = node1.get_next_case(acase)
-                    if acase is None:
-                        break
-                    self._apply(acase)
-
-    def _is_dangling_expression(self, node) -> bool:
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
-        return isinstance(node, AExpression)
+                nested.append(node1)
+            if node1.KIND == KIND_SWITCH:
+                nested.extend(node1.iter_cases())
+        children[:] = out
+        # Reversed so nested roots are still processed in source order
+        stack.extend(reversed(nested))
 
@@ -1,65 +1,133 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, ClassVar, Final
+
+from pykotor.resource.formats.ncs.dencs.node.a_action_command import AActionCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_copy_down_bp_command import ACopyDownBpCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_copy_down_sp_command import ACopyDownSpCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_copy_top_bp_command import ACopyTopBpCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_copy_top_sp_command import ACopyTopSpCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_destruct_command import ADestructCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_jump_command import AJumpCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_jump_to_subroutine import AJumpToSubroutine  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_move_sp_command import AMoveSpCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_return import AReturn  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_stack_command import AStackCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_action_arg_exp import AActionArgExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_action_exp import AActionExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_binary_exp import ABinaryExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_break_statement import ABreakStatement  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_code_block import ACodeBlock  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_conditional_exp import AConditionalExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_const import AConst  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_continue_statement import AContinueStatement  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_do_loop import ADoLoop  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_else import AElse  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression_statement import AExpressionStatement  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_fcn_call_exp import AFcnCallExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_modify_exp import AModifyExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_return_statement import AReturnStatement  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_sub import ASub  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_unary_exp import AUnaryExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_unary_mod_exp import AUnaryModExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_unk_loop_control import AUnkLoopControl  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_vector_const_exp import AVectorConstExp  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_while_loop import AWhileLoop  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import KIND_DO_LOOP, KIND_IF, KIND_SWITCH, KIND_SWITCH_CASE, KIND_VAR_DECL, KIND_VAR_REF  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.var_struct import VarStruct  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pykotor.resource.formats.ncs.dencs.actions_data import ActionsData  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.node.node import Node
     from pykotor.resource.formats.ncs.dencs.scriptnode.a_control_loop import AControlLoop
-    from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression
-    from pykotor.resource.formats.ncs.dencs.scriptnode.a_sub import ASub  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase
-    from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl
     from pykotor.resource.formats.ncs.dencs.scriptnode.script_node import ScriptNode
-    from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.stack.const import Const
     from pykotor.resource.formats.ncs.dencs.stack.local_var_stack import LocalVarStack  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry
-    from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.node_analysis_data import NodeAnalysisData  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.subroutine_analysis_data import SubroutineAnalysisData  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.subroutine_state import SubroutineState  # pyright: ignore[reportMissingImports]
 
+logger = logging.getLogger(__name__)
+
+# Parse states, kept at module level so the transforms compare against globals rather than class attributes.
+_S_DONE: Final = -1
+_S_NORMAL: Final = 0
+_S_INMOD: Final = 1
+_S_ACTIONARG: Final = 2
+_S_WHILECOND: Final = 3
+_S_SWITCHCASES: Final = 4
+_S_PREFIXSTACK: Final = 5
+
+# Type codes compared directly against Type.type instead of going through Type.equals().
+_T_VOID: Final = Type.VT_NONE
+_T_VECTOR: Final = Type.VT_VECTOR
+_T_STRUCT: Final = Type.VT_STRUCT
+
+# Script nodes that continue/break bind to while walking up from the current node.
+_LOOP_TYPES: Final = (ADoLoop, AWhileLoop)
+_BREAKABLE_TYPES: Final = (ADoLoop, AWhileLoop, ASwitchCase)
+
+# Most dropped nodes of one class a state holds on to for reuse.
+_FREE_LIMIT: Final = 64
+
+# Leaf node classes that directly carry a return value, keyed by exact type for get_return_exp().
+_RETURN_EXP_GETTERS: Final = {
+    AModifyExp: AModifyExp.expression,
+    AReturnStatement: AReturnStatement.exp,
+}
+
+
 class SubScriptState:
-    STATE_DONE = -1
-    STATE_NORMAL = 0
-    STATE_INMOD = 1
-    STATE_INACTIONARG = 2
-    STATE_WHILECOND = 3
-    STATE_SWITCHCASES = 4
-    STATE_INPREFIXSTACK = 5
+    __slots__ = ("nodedata", "subdata", "state", "stack", "varprefix", "vardecs", "varcounts", "varnames", "actions", "root", "current", "_prev_cmd_cache", "_loop_cache", "_free")
+
+    STATE_DONE = _S_DONE
+    STATE_NORMAL = _S_NORMAL
+    STATE_INMOD = _S_INMOD
+    STATE_INACTIONARG = _S_ACTIONARG
+    STATE_WHILECOND = _S_WHILECOND
+    STATE_SWITCHCASES = _S_SWITCHCASES
+    STATE_INPREFIXSTACK = _S_PREFIXSTACK
 
     def __init__(self, nodedata: NodeAnalysisData, subdata: SubroutineAnalysisData, stack: LocalVarStack, protostate: SubroutineState | None = None, actions: ActionsData | None = None):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_sub import ASub  # pyright: ignore[reportMissingImports]
-        
         self.nodedata = nodedata
         self.subdata = subdata
-        self.state = 0
+        self.state = _S_NORMAL
         self.stack = stack
         self.varprefix = ""
-        self.vardecs: dict[Variable, object] = {}
-        self.varcounts: dict[Variable, int] = {}
+        # A None value marks a variable whose declaration was taken over by its struct's declaration
+        self.vardecs: dict[Variable, AVarDecl | None] = {}
+        self.varcounts: dict[int, int] = {}
         self.varnames: dict[str, int] = {}
         self.actions = actions
-        
+        # id(node) -> (node, previous command); the parse tree is fixed while a subroutine is transformed
+        self._prev_cmd_cache: dict[int, tuple[Node, Node | None]] = {}
+        # id(script node) -> (node, enclosing loop). Loops are only ever added below the current
+        # node and never wrap existing ones, so a node's enclosing loop is fixed once it is known.
+        self._loop_cache: dict[int, tuple[ScriptNode, AControlLoop | None]] = {}
+        # Nodes this state dropped while transforming, by class; _new() hands them out again until close().
+        self._free: dict[type, deque[ScriptNode]] = {}
+
         if protostate is not None:
             self.root = ASub(protostate.type(), protostate.get_id(), self._get_params(protostate.get_param_count()), protostate.get_start(), protostate.get_end())
         else:
             self.root = ASub(0, 0)
         self.current: ScriptRootNode = self.root
 
-    def _get_params(self, paramcount: int) -> list:
-        # This method is implemented below in get_params - it's a duplicate name issue
-        # The actual implementation is in the get_params method defined later
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        params = []
-        for i in range(1, paramcount + 1):
-            var: Variable = self.stack.get(i)
-            var.set_name_with_hint("Param", i)
-            varref = AVarRef(var)
-            params.append(varref)
-        return params
-
     def set_var_prefix(self, prefix: str):
         self.varprefix = prefix
 
@@ -72,13 +140,15 @@ class SubScriptState:
         if self.stack is not None:
             self.stack.done_parse()
         self.stack = None
+        self._prev_cmd_cache = None
+        self._loop_cache = None
         if self.vardecs is not None:
-            for var in list(self.vardecs.keys()):
+            for var in self.vardecs:
                 var.done_parse()
 
     def close(self):
         if self.vardecs is not None:
-            for var in list(self.vardecs.keys()):
+            for var in self.vardecs:
                 var.close()
             self.vardecs = None
         self.varcounts = None
@@ -90,6 +160,9 @@ class SubScriptState:
         self.nodedata = None
         self.subdata = None
         self.actions = None
+        self._prev_cmd_cache = None
+        self._loop_cache = None
+        self._free = None
         if self.stack is not None:
             self.stack.close()
             self.stack = None
@@ -107,18 +180,16 @@ class SubScriptState:
         return self.root
 
     def get_name(self) -> str:
-        return self.root.name() if hasattr(self.root, 'name') else ""
+        return self.root.name()
 
     def set_name(self, name: str):
-        if hasattr(self.root, 'set_name'):
-            self.root.set_name(name)
+        self.root.set_name(name)
 
     def is_main(self, ismain: bool = None):
         if ismain is not None:
-            if hasattr(self.root, 'set_is_main'):
-                self.root.set_is_main(ismain)
+            self.root.set_is_main(ismain)
         else:
-            return self.root.is_main() if hasattr(self.root, 'is_main') else False
+            return self.root.is_main()
 
     def transform_placeholder_variable_removed(self, var: Variable):
         vardec: AVarDecl = self.vardecs.get(var)
@@ -130,12 +201,10 @@ class SubScriptState:
                     parent.replace_child(vardec, exp)
                 else:
                     parent.remove_child(vardec)
-            if var in self.vardecs:
-                del self.vardecs[var]
+            del self.vardecs[var]
+            self._discard(vardec)
 
     def transform_move_sp_variables_removed(self, vars_list, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_code_block import ACodeBlock  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         if self.at_last_command(node) and self.current_contains_vars(vars_list):
             return
         if len(vars_list) == 0:
@@ -151,63 +220,81 @@ class SubScriptState:
             vardec: AVarDecl = self.vardecs.get(var)
             earliestdec = self.get_earlier_dec(vardec, earliestdec)
         if earliestdec != -1:
-            prev: Node = NodeUtils.get_previous_command(node, self.nodedata)
-            block = ACodeBlock(-1, self.nodedata.get_pos(prev))
+            prev: Node = self._previous_command(node)
+            block = self._new(ACodeBlock, -1, self.nodedata.get_pos(prev))
             children = self.current.remove_children(earliestdec)
             self.current.add_child(block)
             block.add_children(children)
 
     def transform_end_do_loop(self):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_do_loop import ADoLoop  # pyright: ignore[reportMissingImports]
-        if isinstance(self.current, ADoLoop):
+        if type(self.current) is ADoLoop:
             self.current.condition(self.remove_last_exp(False))
 
     def transform_origin_found(self, destination, origin):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_while_loop import AWhileLoop  # pyright: ignore[reportMissingImports]
         loop: AControlLoop = self.get_loop(destination, origin)
         self.current.add_child(loop)
         self.current = loop
-        if isinstance(loop, AWhileLoop):
-            self.state = 3
+        if type(loop) is AWhileLoop:
+            self.state = _S_WHILECOND
 
     def transform_log_or_extra_jump(self, node):
         self.remove_last_exp(True)
 
     def assert_state(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_copy_top_sp_command import ACopyTopSpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.node.a_jump_command import AJumpCommand  # pyright: ignore[reportMissingImports]
-        if self.state == 0:
+        if self.state == _S_NORMAL:
             return
-        if self.state == 2 and not isinstance(node, AJumpCommand):
+        if self.state == _S_ACTIONARG and type(node) is not AJumpCommand:
             raise RuntimeError(f"In action arg, expected JUMP at node {node}")
-        if self.state == -1:
+        if self.state == _S_DONE:
             raise RuntimeError(f"In DONE state, no more nodes expected at node {node}")
-        if self.state == 5 and not isinstance(node, ACopyTopSpCommand):
+        if self.state == _S_PREFIXSTACK and type(node) is not ACopyTopSpCommand:
             raise RuntimeError(f"In prefix stack op state, expected CPTOPSP at node {node}")
 
     def check_start(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
+        self._check_start(node, self.nodedata.get_pos(node))
+
+    def _check_start(self, node, node_pos: int):
         self.assert_state(node)
-        if self.current.has_children():
-            last_node: ScriptNode = self.current.get_last_child()
-            if isinstance(last_node, ASwitch) and self.nodedata.get_pos(node) == last_node.get_first_case_start():
+        children = self.current.children
+        if children:
+            last_node: ScriptNode = children[-1]
+            if last_node.KIND == KIND_SWITCH and node_pos == last_node.get_first_case_start():
                 self.current = last_node.get_first_case()
 
     def check_end(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_do_loop import ADoLoop  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_else import AElse  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        while self.current is not None:
-            if self.nodedata.get_pos(node) != self.current.get_end():
+        if self.current is None:
+            self.state = _S_DONE
+            return
+        self._check_end(node, self.nodedata.get_pos(node))
+
+    def _check_end(self, node, node_pos: int):
+        cur = self.current
+        while cur is not None:
+            # Read the end position as a plain attribute; past this test it equals node_pos.
+            if node_pos != cur.end:
                 return
-            if isinstance(self.current, ASwitchCase):
-                parent = self.current.parent()
-                if isinstance(parent, ASwitch):
-                    next_case: ASwitchCase = parent.get_next_case(self.current)
+            # None of the branches below reparent the current node, so its parent is fetched and classified once
+            parent = cur.get_parent()
+            parent_is_root = isinstance(parent, ScriptRootNode)
+            # The node classes here are leaves, so the tests are exclusive. Ifs close most often, then
+            # cases, then do-loops; any other root just steps up to its parent.
+            kind = cur.KIND
+            if kind == KIND_IF:
+                nodedata = self.nodedata
+                dest: Node = nodedata.get_destination(node)
+                if dest is None:
+                    return
+                else_start = node_pos + 6
+                if nodedata.get_pos(dest) != else_start:
+                    aelse = AElse(else_start, nodedata.get_pos(self._previous_command(dest)))
+                    if parent_is_root:
+                        cur = parent
+                    cur.add_child(aelse)
+                    self.current = aelse
+                    return
+            elif kind == KIND_SWITCH_CASE:
+                if type(parent) is ASwitch:
+                    next_case: ASwitchCase = parent.get_next_case(cur)
                     if next_case is not None:
                         self.current = next_case
                     else:
@@ -215,60 +302,49 @@ class SubScriptState:
                         if isinstance(grandparent, ScriptRootNode):
                             self.current = grandparent
                 return
-            if isinstance(self.current, AIf):
-                dest: Node = self.nodedata.get_destination(node)
-                if dest is None:
-                    return
-                if self.nodedata.get_pos(dest) != self.current.get_end() + 6:
-                    aelse = AElse(self.current.get_end() + 6, self.nodedata.get_pos(NodeUtils.get_previous_command(dest, self.nodedata)))
-                    parent = self.current.parent()
-                    if isinstance(parent, ScriptRootNode):
-                        self.current = parent
-                    self.current.add_child(aelse)
-                    self.current = aelse
-                    return
-            if isinstance(self.current, ADoLoop):
+            elif kind == KIND_DO_LOOP:
                 self.transform_end_do_loop()
-            parent = self.current.parent()
-            if isinstance(parent, ScriptRootNode):
-                self.current = parent
-        self.state = -1
+            if parent_is_root:
+                self.current = cur = parent
+        self.state = _S_DONE
 
     def in_action_arg(self) -> bool:
-        return self.state == 2
+        return self.state == _S_ACTIONARG
 
     def transform_dead_code(self, node):
         self.check_end(node)
 
     def transform_bp(self, node):
-        self.check_start(node)
-        self.check_end(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
+        self._check_end(node, node_pos)
 
-    def transform_store_state(self, node):
-        self.check_start(node)
-        self.state = 2
-        self.check_end(node)
+    # Returns carry no payload of their own, so they share the bare start/end bookkeeping.
+    transform_return = transform_bp
 
-    def transform_return(self, node):
-        self.check_start(node)
-        self.check_end(node)
+    def transform_store_state(self, node):
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
+        self.state = _S_ACTIONARG
+        self._check_end(node, node_pos)
 
     def transform_const(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_const import AConst  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         theconst: Const = self.stack.get(1)
         constdec = AConst(theconst)
         self.current.add_child(constdec)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_move_sp(self, node):
-        self.check_start(node)
-        self.check_switch_end(node)
-        self.check_end(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
+        self._check_switch_end(node, node_pos)
+        self._check_end(node, node_pos)
 
     def transform_copy_down_sp(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_return_statement import AReturnStatement  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         exp = self.remove_last_exp(False)
         if self.is_return(node):
             ret = AReturnStatement(exp)
@@ -277,57 +353,59 @@ class SubScriptState:
             varref = self.get_var_to_assign_to(node)
             self.update_name(varref, exp)
             self.current.add_child(varref)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_rs_add(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         var: Variable = self.stack.get(1)
         self.update_var_count(var)
-        vardec = AVarDecl(var)
+        vardec = self._new(AVarDecl, var)
         self.current.add_child(vardec)
         self.vardecs[var] = vardec
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_copy_top_sp(self, node):
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         exp = self.get_var_to_copy(node)
         self.current.add_child(exp)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_copy_top_bp(self, node):
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         exp = self.get_var_to_copy_bp(node)
         self.current.add_child(exp)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_copy_down_bp(self, node):
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         varref = self.get_var_to_assign_to_bp(node)
         exp = self.remove_last_exp(False)
         self.update_name(varref, exp)
         self.current.add_child(varref)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_destruct(self, node):
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         self.update_struct_var(node)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_action(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_action_exp import AActionExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         params = self.remove_action_params(node)
         act = AActionExp(NodeUtils.get_action_name(node, self.actions), NodeUtils.get_action_id(node), params)
         type_val = NodeUtils.get_return_type(node, self.actions)
-        if not type_val.equals(0):
+        if type_val.type != _T_VOID:
             var: Variable = self.stack.get(1)
-            if type_val.equals(-16):
+            if type_val.type == _T_VECTOR:
                 var = var.varstruct()
             act.set_stackentry(var)
-            vardec = AVarDecl(var)
+            vardec = self._new(AVarDecl, var)
             vardec.set_is_fcn_return(True)
             vardec.initialize_exp(act)
             self.update_var_count(var)
@@ -335,234 +413,248 @@ class SubScriptState:
             self.vardecs[var] = vardec
         else:
             self.current.add_child(act)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_binary(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_binary_exp import ABinaryExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_conditional_exp import AConditionalExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         right = self.remove_last_exp(False)
-        left = self.remove_last_exp(self.state == 4)
+        left = self.remove_last_exp(self.state == _S_SWITCHCASES)
         if NodeUtils.is_arithmetic_op(node):
-            exp = ABinaryExp(left, right, NodeUtils.get_op(node))
+            exp = self._new(ABinaryExp, left, right, NodeUtils.get_op(node))
         else:
             if not NodeUtils.is_conditional_op(node):
-                raise RuntimeError(f"Unknown binary op at {self.nodedata.get_pos(node)}")
-            exp = AConditionalExp(left, right, NodeUtils.get_op(node))
+                raise RuntimeError(f"Unknown binary op at {node_pos}")
+            exp = self._new(AConditionalExp, left, right, NodeUtils.get_op(node))
         exp.set_stackentry(self.stack.get(1))
         self.current.add_child(exp)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_unary(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_unary_exp import AUnaryExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         exp = self.remove_last_exp(False)
         unexp = AUnaryExp(exp, NodeUtils.get_op(node))
         unexp.set_stackentry(self.stack.get(1))
         self.current.add_child(unexp)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_logii(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_conditional_exp import AConditionalExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_while_loop import AWhileLoop  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
-        if not self.current.has_children() and isinstance(self.current, AIf) and isinstance(self.current.parent(), AIf):
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
+        op = NodeUtils.get_op(node)
+        if not self.current.has_children() and type(self.current) is AIf and type(self.current.parent()) is AIf:
             right = self.current
             left = self.current.parent()
-            conexp = AConditionalExp(left.condition(), right.condition(), NodeUtils.get_op(node))
+            conexp = self._new(AConditionalExp, left.condition(), right.condition(), op)
             conexp.set_stackentry(self.stack.get(1))
             self.current = self.current.parent()
             self.current.condition(conexp)
             self.current.remove_last_child()
         else:
             right2 = self.remove_last_exp(False)
-            if not self.current.has_children() and isinstance(self.current, AIf):
+            if not self.current.has_children() and type(self.current) is AIf:
                 left2 = self.current.condition()
-                conexp = AConditionalExp(left2, right2, NodeUtils.get_op(node))
+                conexp = self._new(AConditionalExp, left2, right2, op)
                 conexp.set_stackentry(self.stack.get(1))
                 self.current.condition(conexp)
-            elif not self.current.has_children() and isinstance(self.current, AWhileLoop):
+            elif not self.current.has_children() and type(self.current) is AWhileLoop:
                 left2 = self.current.condition()
-                conexp = AConditionalExp(left2, right2, NodeUtils.get_op(node))
+                conexp = self._new(AConditionalExp, left2, right2, op)
                 conexp.set_stackentry(self.stack.get(1))
                 self.current.condition(conexp)
             else:
                 left2 = self.remove_last_exp(False)
-                conexp = AConditionalExp(left2, right2, NodeUtils.get_op(node))
+                conexp = self._new(AConditionalExp, left2, right2, op)
                 conexp.set_stackentry(self.stack.get(1))
                 self.current.add_child(conexp)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_stack(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_unary_mod_exp import AUnaryModExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         last = self.current.get_last_child()
         varref = self.get_var_to_assign_to_stack(node)
-        if isinstance(last, AVarRef) and last.var() == varref.var():
+        if type(last) is AVarRef and last.var() == varref.var():
             self.remove_last_exp(True)
+            self._discard(last)
             prefix = False
         else:
-            self.state = 5
+            self.state = _S_PREFIXSTACK
             prefix = True
         unexp = AUnaryModExp(varref, NodeUtils.get_op(node), prefix)
         unexp.set_stackentry(self.stack.get(1))
         self.current.add_child(unexp)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_jsr(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_fcn_call_exp import AFcnCallExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
+        node_pos = self.nodedata.get_pos(node)
+        self._check_start(node, node_pos)
         jsr = AFcnCallExp(self.get_fcn_id(node), self.remove_fcn_params(node))
-        if not self.get_fcn_type(node).equals(0):
+        if self.get_fcn_type(node).type != _T_VOID:
             last_child = self.current.get_last_child()
-            if isinstance(last_child, AVarDecl):
+            if type(last_child) is AVarDecl:
                 last_child.set_is_fcn_return(True)
                 last_child.initialize_exp(jsr)
                 jsr.set_stackentry(self.stack.get(1))
         else:
             self.current.add_child(jsr)
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     def transform_jump(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_action_arg_exp import AActionArgExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_break_statement import ABreakStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_continue_statement import AContinueStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_return_statement import AReturnStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_unk_loop_control import AUnkLoopControl  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
-        dest: Node = self.nodedata.get_destination(node)
-        if self.state == 2:
-            self.state = 0
-            aarg = AActionArgExp(self.get_next_command(node), self.get_prior_to_dest_command(node))
-            self.current.add_child(aarg)
-            self.current = aarg
+        nodedata = self.nodedata
+        node_pos = nodedata.get_pos(node)
+        self._check_start(node, node_pos)
+        dest: Node = nodedata.get_destination(node)
+        handler = self._JUMP_HANDLERS.get(self.state, SubScriptState._jump_statement)
+        handler(self, node, dest, node_pos)
+        self._check_end(node, node_pos)
+
+    def _jump_action_arg(self, node, dest: Node, node_pos: int):
+        self.state = _S_NORMAL
+        aarg = AActionArgExp(self.get_next_command(node), self.get_prior_to_dest_command(node))
+        self.current.add_child(aarg)
+        self.current = aarg
+
+    def _jump_switch_cases(self, node, dest: Node, node_pos: int):
+        if type(self.current) is AIf and node_pos == self.current.get_end():
+            return
+        get_pos = self.nodedata.get_pos
+        aswitch = self.current.get_last_child()
+        if type(aswitch) is ASwitch:
+            aprevcase = aswitch.get_last_case()
+            if aprevcase is not None:
+                aprevcase.end(get_pos(self._previous_command(dest)))
+            if type(dest) is AMoveSpCommand:
+                aswitch.end(get_pos(dest))
+            else:
+                adefault = ASwitchCase(get_pos(dest))
+                aswitch.add_default_case(adefault)
+        self.state = _S_NORMAL
+
+    def _jump_statement(self, node, dest: Node, node_pos: int):
+        if type(self.current) is AIf and node_pos == self.current.get_end():
+            return
+        if self.is_return_jump(node):
+            if self.root.type().type != _T_VOID:
+                areturn = AReturnStatement(self.get_return_exp())
+            else:
+                areturn = AReturnStatement()
+            self.current.add_child(areturn)
         else:
-            from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
-            if not isinstance(self.current, AIf) or self.nodedata.get_pos(node) != self.current.get_end():
-                if self.state == 4:
-                    from pykotor.resource.formats.ncs.dencs.node.a_move_sp_command import AMoveSpCommand  # pyright: ignore[reportMissingImports]
-                    from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
-                    from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
-                    aswitch = self.current.get_last_child()
-                    if isinstance(aswitch, ASwitch):
-                        aprevcase = aswitch.get_last_case()
-                        if aprevcase is not None:
-                            aprevcase.end(self.nodedata.get_pos(NodeUtils.get_previous_command(dest, self.nodedata)))
-                        if isinstance(dest, AMoveSpCommand):
-                            aswitch.end(self.nodedata.get_pos(self.nodedata.get_destination(node)))
-                        else:
-                            adefault = ASwitchCase(self.nodedata.get_pos(dest))
-                            aswitch.add_default_case(adefault)
-                    self.state = 0
-                elif self.is_return_jump(node):
-                    if not self.root.type().equals(0):
-                        areturn = AReturnStatement(self.get_return_exp())
-                    else:
-                        areturn = AReturnStatement()
-                    self.current.add_child(areturn)
-                elif self.nodedata.get_pos(dest) >= self.nodedata.get_pos(node):
-                    loop = self.get_breakable()
-                    if isinstance(loop, ASwitchCase):
-                        loop = self.get_enclosing_loop(loop)
-                        if loop is None:
-                            abreak = ABreakStatement()
-                            self.current.add_child(abreak)
-                        else:
-                            aunk = AUnkLoopControl(self.nodedata.get_pos(dest))
-                            self.current.add_child(aunk)
-                    elif loop is not None and self.nodedata.get_pos(dest) > loop.get_end():
+            dest_pos = self.nodedata.get_pos(dest)
+            if dest_pos >= node_pos:
+                loop = self.get_breakable()
+                if type(loop) is ASwitchCase:
+                    loop = self.get_enclosing_loop(loop)
+                    if loop is None:
                         abreak = ABreakStatement()
                         self.current.add_child(abreak)
                     else:
-                        loop = self.get_loop_helper()
-                        if loop is not None and self.nodedata.get_pos(dest) <= loop.get_end():
-                            acont = AContinueStatement()
-                            self.current.add_child(acont)
-        self.check_end(node)
+                        aunk = AUnkLoopControl(dest_pos)
+                        self.current.add_child(aunk)
+                elif loop is not None and dest_pos > loop.get_end():
+                    abreak = ABreakStatement()
+                    self.current.add_child(abreak)
+                else:
+                    loop = self.get_loop_helper()
+                    if loop is not None and dest_pos <= loop.get_end():
+                        acont = AContinueStatement()
+                        self.current.add_child(acont)
+
+    # Parse states with their own jump handling; any other state goes to _jump_statement.
+    _JUMP_HANDLERS: ClassVar[dict[int, Callable]] = {
+        _S_ACTIONARG: _jump_action_arg,
+        _S_SWITCHCASES: _jump_switch_cases,
+    }
 
     def transform_conditional_jump(self, node):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_conditional_exp import AConditionalExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_const import AConst  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_while_loop import AWhileLoop  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        self.check_start(node)
-        if self.state == 3:
-            if isinstance(self.current, AWhileLoop):
-                self.current.condition(self.remove_last_exp(False))
-                self.state = 0
+        nodedata = self.nodedata
+        get_pos = nodedata.get_pos
+        node_pos = get_pos(node)
+        self._check_start(node, node_pos)
+        # remove_last_exp() can step out of an if, so current is re-read after each call to it
+        current = self.current
+        if self.state == _S_WHILECOND:
+            if type(current) is AWhileLoop:
+                current.condition(self.remove_last_exp(False))
+                self.state = _S_NORMAL
         elif not NodeUtils.is_jz(node):
-            if self.state != 4:
+            if self.state != _S_SWITCHCASES:
                 cond = self.remove_last_exp(True)
-                if isinstance(cond, AConditionalExp):
-                    if isinstance(cond.right(), AConst):
-                        acase = ASwitchCase(self.nodedata.get_pos(self.nodedata.get_destination(node)), cond.right())
+                if type(cond) is AConditionalExp:
+                    left, right = cond.left(), cond.right()
+                    if type(right) is AConst:
+                        acase = ASwitchCase(get_pos(nodedata.get_destination(node)), right)
                     else:
-                        raise RuntimeError(f"Expected AConst in switch case but got {type(cond.right())}")
+                        raise RuntimeError(f"Expected AConst in switch case but got {type(right)}")
                     aswitch = None
-                    if self.current.has_children():
-                        last = self.current.get_last_child()
-                        if isinstance(last, AVarRef) and isinstance(cond.left(), AVarRef) and last.var().equals(cond.left().var()):
-                            varref = self.remove_last_exp(False)
-                            aswitch = ASwitch(self.nodedata.get_pos(node), varref)
+                    current = self.current
+                    last = current.get_last_child()
+                    if type(last) is AVarRef and type(left) is AVarRef and last.var().equals(left.var()):
+                        varref = self.remove_last_exp(False)
+                        aswitch = ASwitch(node_pos, varref)
+                        current = self.current
                     if aswitch is None:
-                        aswitch = ASwitch(self.nodedata.get_pos(node), cond.left())
-                    self.current.add_child(aswitch)
+                        aswitch = ASwitch(node_pos, left)
+                    current.add_child(aswitch)
                     aswitch.add_case(acase)
-                    self.state = 4
+                    self.state = _S_SWITCHCASES
             else:
                 cond = self.remove_last_exp(True)
-                if isinstance(cond, AConditionalExp):
+                if type(cond) is AConditionalExp:
                     aswitch = self.current.get_last_child()
-                    if isinstance(aswitch, ASwitch):
+                    if type(aswitch) is ASwitch:
+                        dest = nodedata.get_destination(node)
                         aprevcase = aswitch.get_last_case()
                         if aprevcase is not None:
-                            aprevcase.end(self.nodedata.get_pos(NodeUtils.get_previous_command(self.nodedata.get_destination(node), self.nodedata)))
-                        if isinstance(cond.right(), AConst):
-                            acase2 = ASwitchCase(self.nodedata.get_pos(self.nodedata.get_destination(node)), cond.right())
+                            aprevcase.end(get_pos(self._previous_command(dest)))
+                        right = cond.right()
+                        if type(right) is AConst:
+                            acase2 = ASwitchCase(get_pos(dest), right)
                         else:
-                            raise RuntimeError(f"Expected AConst in switch case but got {type(cond.right())}")
+                            raise RuntimeError(f"Expected AConst in switch case but got {type(right)}")
                         aswitch.add_case(acase2)
-        elif isinstance(self.current, AIf) and self.is_modify_conditional():
-            self.current.end(self.nodedata.get_pos(self.nodedata.get_destination(node)) - 6)
-            if self.current.has_children():
-                self.current.remove_last_child()
-        elif isinstance(self.current, AWhileLoop) and self.is_modify_conditional():
-            self.current.end(self.nodedata.get_pos(self.nodedata.get_destination(node)) - 6)
-            if self.current.has_children():
-                self.current.remove_last_child()
+        elif isinstance(current, (AIf, AWhileLoop)) and self.is_modify_conditional():
+            current.end(get_pos(nodedata.get_destination(node)) - 6)
+            if current.has_children():
+                self._discard(current.remove_last_child())
         else:
-            aif = AIf(self.nodedata.get_pos(node), self.nodedata.get_pos(self.nodedata.get_destination(node)) - 6, self.remove_last_exp(False))
+            aif = AIf(node_pos, get_pos(nodedata.get_destination(node)) - 6, self.remove_last_exp(False))
             self.current.add_child(aif)
             self.current = aif
-        self.check_end(node)
+        self._check_end(node, node_pos)
 
     # Helper methods
+    def _new(self, cls: type, *args):
+        free = self._free.get(cls)
+        if free:
+            node = free.pop()
+            node.__init__(*args)
+            return node
+        return cls(*args)
+
+    def _discard(self, node: ScriptNode):
+        # Only for nodes that were just taken out of the tree and are referenced nowhere else
+        free = self._free.get(type(node))
+        if free is None:
+            free = self._free[type(node)] = deque(maxlen=_FREE_LIMIT)
+        free.append(node)
+        if self._loop_cache is not None:
+            # A reused node keeps its id, so it must not find this node's cached loop
+            self._loop_cache.pop(id(node), None)
+
     def _get_params(self, paramcount: int) -> list:
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
         params = []
         for i in range(1, paramcount + 1):
             var: Variable = self.stack.get(i)
             var.set_name_with_hint("Param", i)
-            varref = AVarRef(var)
+            varref = self._new(AVarRef, var)
             params.append(varref)
         return params
 
     def remove_if_as_exp(self):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.script_root_node import ScriptRootNode  # pyright: ignore[reportMissingImports]
-        if isinstance(self.current, AIf):
+        if type(self.current) is AIf:
             exp = self.current.condition()
             parent = self.current.parent()
             if isinstance(parent, ScriptRootNode):
@@ -574,43 +666,35 @@ class SubScriptState:
             return exp
 
     def remove_last_exp(self, force_one_only: bool):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        if not self.current.has_children() and isinstance(self.current, AIf):
+        current = self.current
+        if not current.children and current.KIND == KIND_IF:
             return self.remove_if_as_exp()
-        anode: ScriptNode = self.current.remove_last_child()
-        if isinstance(anode, AExpression):
-            if not force_one_only and isinstance(anode, AVarRef) and not anode.var().is_assigned and not anode.var().is_param and self.current.has_children():
-                last = self.current.get_last_child()
+        anode: ScriptNode = current.remove_last_child()
+        # IS_EXPRESSION is a class constant, which is cheaper than an isinstance check against the AExpression ABC
+        if anode is not None and anode.IS_EXPRESSION:
+            if not force_one_only and anode.KIND == KIND_VAR_REF and not anode.var().is_assigned and not anode.var().is_param and current.children:
+                last = current.children[-1]
                 # Use identity comparison (is) instead of equals() - standard Python approach
-                if isinstance(last, AExpression) and anode.var() is last.stackentry():
+                if last.IS_EXPRESSION and last.HAS_STACKENTRY and anode.var() is last.stackentry():
+                    self._discard(anode)
                     return self.remove_last_exp(False)
-                if isinstance(last, AVarDecl) and anode.var() is last.var_var() and last.exp() is not None:
+                if last.KIND == KIND_VAR_DECL and anode.var() is last.var_var() and last.exp() is not None:
                     return self.remove_last_exp(False)
             return anode
-        if not force_one_only and isinstance(anode, AVarDecl) and anode.exp() is not None:
+        if not force_one_only and anode is not None and anode.KIND == KIND_VAR_DECL and anode.exp() is not None:
             return anode.remove_exp()
-        print(anode)
-        raise RuntimeError(f"Last child not an expression: {type(anode)}")
+        raise RuntimeError(f"Last child not an expression: {type(anode).__name__}")
 
     def get_last_exp(self):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
         anode: ScriptNode = self.current.get_last_child()
-        if isinstance(anode, AExpression):
+        if anode is not None and anode.IS_EXPRESSION:
             return anode
-        if isinstance(anode, AVarDecl) and anode.is_fcn_return():
+        if anode is not None and anode.KIND == KIND_VAR_DECL and anode.is_fcn_return():
             return anode.exp()
-        print(anode)
-        raise RuntimeError(f"Last child not an expression {anode}")
+        raise RuntimeError(f"Last child not an expression: {type(anode).__name__}")
 
     def get_loop(self, destination, origin):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_do_loop import ADoLoop  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_while_loop import AWhileLoop  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        before_jump: Node = NodeUtils.get_previous_command(origin, self.nodedata)
+        before_jump: Node = self._previous_command(origin)
         if NodeUtils.is_jz_past_one(before_jump):
             doloop = ADoLoop(self.nodedata.get_pos(destination), self.nodedata.get_pos(origin))
             return doloop
@@ -618,155 +702,125 @@ class SubScriptState:
         return whileloop
 
     def get_enclosing_loop(self, start):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_do_loop import ADoLoop  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_while_loop import AWhileLoop  # pyright: ignore[reportMissingImports]
+        cache = self._loop_cache
+        visited = []
+        loop = None
         node: ScriptNode = start
         while node is not None:
-            if isinstance(node, ADoLoop) or isinstance(node, AWhileLoop):
-                return node
-            node = node.parent()
-        return None
+            entry = cache.get(id(node))
+            if entry is not None and entry[0] is node:
+                loop = entry[1]
+                break
+            if isinstance(node, _LOOP_TYPES):
+                loop = node
+                break
+            visited.append(node)
+            node = node.get_parent()
+        for node in visited:
+            cache[id(node)] = (node, loop)
+        return loop
 
     def get_breakable(self):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_do_loop import ADoLoop  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_while_loop import AWhileLoop  # pyright: ignore[reportMissingImports]
         node: ScriptNode = self.current
         while node is not None:
-            if isinstance(node, ADoLoop) or isinstance(node, AWhileLoop) or isinstance(node, ASwitchCase):
+            if isinstance(node, _BREAKABLE_TYPES):
                 return node
-            node = node.parent()
+            node = node.get_parent()
         return None
 
     def get_loop_helper(self):
         return self.get_enclosing_loop(self.current)
 
     def is_modify_conditional(self) -> bool:
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        if not self.current.has_children():
+        children = self.current.children
+        if not children:
             return True
-        if self.current.size() == 1:
-            last: ScriptNode = self.current.get_last_child()
-            if isinstance(last, AVarRef) and not last.var().is_assigned() and not last.var().is_param():
+        if len(children) == 1:
+            last: ScriptNode = children[0]
+            if type(last) is AVarRef and not last.var().is_assigned() and not last.var().is_param():
                 return True
         return False
 
     def is_return(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_copy_down_sp_command import ACopyDownSpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if isinstance(node, ACopyDownSpCommand):
-            return not self.root.type().equals(0) and self.stack.size() == NodeUtils.stack_offset_to_pos(node.get_offset())
+        if type(node) is ACopyDownSpCommand:
+            return self.root.type().type != _T_VOID and self.stack.size() == NodeUtils.stack_offset_to_pos(node.get_offset())
 
     def is_return_jump(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_move_sp_command import AMoveSpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         dest: Node = NodeUtils.get_command_child(self.nodedata.get_destination(node))
         if NodeUtils.is_return(dest):
             return True
-        if isinstance(dest, AMoveSpCommand):
+        if type(dest) is AMoveSpCommand:
             after_dest: Node = NodeUtils.get_next_command(dest, self.nodedata)
             return after_dest is None
         return False
 
     def get_return_exp(self):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression_statement import AExpressionStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_modify_exp import AModifyExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_return_statement import AReturnStatement  # pyright: ignore[reportMissingImports]
         last: ScriptNode = self.current.remove_last_child()
-        if isinstance(last, AModifyExp):
-            return last.expression()
-        if isinstance(last, AExpressionStatement) and isinstance(last.exp(), AModifyExp):
+        getter = _RETURN_EXP_GETTERS.get(type(last))
+        if getter is not None:
+            return getter(last)
+        if type(last) is AExpressionStatement and type(last.exp()) is AModifyExp:
             return last.exp().expression()
-        if isinstance(last, AReturnStatement):
-            return last.exp()
-        print(last)
-        raise RuntimeError(f"Trying to get return expression, unexpected scriptnode class {type(last)}")
+        raise RuntimeError(f"Trying to get return expression, unexpected scriptnode class {type(last).__name__}")
 
     def check_switch_end(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_move_sp_command import AMoveSpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
-        if isinstance(self.current, ASwitchCase) and isinstance(node, AMoveSpCommand):
+        self._check_switch_end(node, self.nodedata.get_pos(node))
+
+    def _check_switch_end(self, node, node_pos: int):
+        if type(self.current) is ASwitchCase and type(node) is AMoveSpCommand:
             entry: StackEntry = self.stack.get(1)
             parent = self.current.parent()
-            if isinstance(parent, ASwitch) and isinstance(entry, Variable) and parent.switch_exp().stackentry().equals(entry):
-                parent.end(self.nodedata.get_pos(node))
+            if type(parent) is ASwitch and isinstance(entry, Variable) and parent.switch_exp().stackentry().equals(entry):
+                parent.end(node_pos)
                 self.update_switch_unknowns(parent)
 
     def update_switch_unknowns(self, aswitch):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_break_statement import ABreakStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_continue_statement import AContinueStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_unk_loop_control import AUnkLoopControl  # pyright: ignore[reportMissingImports]
-        acase: ASwitchCase = None
-        while True:
-            acase = aswitch.get_next_case(acase)
-            if acase is None:
-                break
-            for unk in acase.get_unknowns():
-                if isinstance(unk, AUnkLoopControl):
-                    if unk.get_destination() > aswitch.end():
-                        acase.replace_unknown(unk, AContinueStatement())
-                    else:
-                        acase.replace_unknown(unk, ABreakStatement())
+        end = aswitch.end()
+        for acase in aswitch.iter_cases():
+            # replace_child finds each unknown through the case's child index instead of an index() search
+            for unk in [child for child in acase.children if type(child) is AUnkLoopControl]:
+                newnode = AContinueStatement() if unk.get_destination() > end else ABreakStatement()
+                acase.replace_child(unk, newnode)
 
     def update_var_count(self, var):
-        count = 1
-        key = var.type()
-        curcount = self.varcounts.get(key, 0)
-        if curcount != 0:
-            count += curcount
+        # Counts are keyed by the int type code so lookups skip Type.__hash__/__eq__.
+        key = var.type().type
+        count = self.varcounts.get(key, 0) + 1
         var.set_name_with_hint(self.varprefix, count)
         self.varcounts[key] = count
 
     def set_var_struct_name(self, varstruct):
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         if varstruct.name() is None:
-            count = 1
-            key = Type(-15)
-            curcount = self.varcounts.get(key, 0)
-            if curcount != 0:
-                count += curcount
+            count = self.varcounts.get(_T_STRUCT, 0) + 1
             varstruct.set_name(self.varprefix, count)
-            self.varcounts[key] = count
+            self.varcounts[_T_STRUCT] = count
 
     def get_variables(self):
-        vars_list = list(self.vardecs.keys())
+        vars_list = []
         varstructs = []
-        for var in vars_list[:]:
+        for var in self.vardecs:
             if var.is_struct():
                 varstructs.append(var.varstruct())
-                vars_list.remove(var)
+            else:
+                vars_list.append(var)
         vars_list.extend(varstructs)
         vars_list.extend(self.root.get_param_vars())
         return vars_list
 
+    def _get_copied_var(self, node, stack, assign: bool, state):
+        return self.get_var(NodeUtils.stack_size_to_pos(node.get_size()), NodeUtils.stack_offset_to_pos(node.get_offset()), stack, assign, state)
+
+    # get_var raises on a non-variable when assigning, so the assign lookups always come back as an AVarRef.
     def get_var_to_assign_to(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_copy_down_sp_command import ACopyDownSpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if isinstance(node, ACopyDownSpCommand):
-            result = self.get_var(NodeUtils.stack_size_to_pos(node.get_size()), NodeUtils.stack_offset_to_pos(node.get_offset()), self.stack, True, self)
-            if isinstance(result, AVarRef):
-                return result
-            raise RuntimeError(f"Expected AVarRef but got {type(result)}")
+        if type(node) is ACopyDownSpCommand:
+            return self._get_copied_var(node, self.stack, True, self)
 
     def get_var_to_assign_to_bp(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_copy_down_bp_command import ACopyDownBpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if isinstance(node, ACopyDownBpCommand):
-            result = self.get_var(NodeUtils.stack_size_to_pos(node.get_size()), NodeUtils.stack_offset_to_pos(node.get_offset()), self.subdata.get_global_stack(), True, self.subdata.global_state())
-            if isinstance(result, AVarRef):
-                return result
-            raise RuntimeError(f"Expected AVarRef but got {type(result)}")
+        if type(node) is ACopyDownBpCommand:
+            return self._get_copied_var(node, self.subdata.get_global_stack(), True, self.subdata.global_state())
 
     def get_var_to_assign_to_stack(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_stack_command import AStackCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if isinstance(node, AStackCommand):
+        if type(node) is AStackCommand:
             loc = NodeUtils.stack_offset_to_pos(node.get_offset())
             if NodeUtils.is_global_stack_op(node):
                 loc -= 1
@@ -776,30 +830,20 @@ class SubScriptState:
             else:
                 entry = self.stack.get(loc)
                 if not isinstance(entry, Variable):
-                    print(f"not a variable at loc {loc}")
-                    print(self.stack)
+                    logger.debug("not a variable at loc %d: %s", loc, type(entry).__name__)
                 var = entry
             var.assign()
-            return AVarRef(var)
+            return self._new(AVarRef, var)
 
     def get_var_to_copy(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_copy_top_sp_command import ACopyTopSpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if isinstance(node, ACopyTopSpCommand):
-            return self.get_var(NodeUtils.stack_size_to_pos(node.get_size()), NodeUtils.stack_offset_to_pos(node.get_offset()), self.stack, False, self)
+        if type(node) is ACopyTopSpCommand:
+            return self._get_copied_var(node, self.stack, False, self)
 
     def get_var_to_copy_bp(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_copy_top_bp_command import ACopyTopBpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if isinstance(node, ACopyTopBpCommand):
-            return self.get_var(NodeUtils.stack_size_to_pos(node.get_size()), NodeUtils.stack_offset_to_pos(node.get_offset()), self.subdata.get_global_stack(), False, self.subdata.global_state())
+        if type(node) is ACopyTopBpCommand:
+            return self._get_copied_var(node, self.subdata.get_global_stack(), False, self.subdata.global_state())
 
     def get_var(self, copy: int, loc: int, stack, assign: bool, state):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_const import AConst  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.stack.var_struct import VarStruct  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
         isstruct = copy > 1
         entry: StackEntry = stack.get(loc)
         if not isinstance(entry, Variable) and assign:
@@ -810,87 +854,78 @@ class SubScriptState:
         if not isstruct:
             if assign:
                 var.assign()
-            return AVarRef(var)
+            return self._new(AVarRef, var)
         if var.is_struct():
             if assign:
                 var.varstruct().assign()
             state.set_var_struct_name(var.varstruct())
-            return AVarRef(var.varstruct())
+            return self._new(AVarRef, var.varstruct())
         newstruct = VarStruct()
-        newstruct.add_var(var)
-        for i in range(loc - 1, loc - copy, -1):
-            var = stack.get(i)
-            newstruct.add_var(var)
+        get = stack.get
+        newstruct.add_vars([var, *[get(i) for i in range(loc - 1, loc - copy, -1)]])
         if assign:
             newstruct.assign()
         self.subdata.add_struct(newstruct)
         state.set_var_struct_name(newstruct)
-        return AVarRef(newstruct)
+        return self._new(AVarRef, newstruct)
 
     def remove_fcn_params(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_jump_to_subroutine import AJumpToSubroutine  # pyright: ignore[reportMissingImports]
         params = []
-        if isinstance(node, AJumpToSubroutine):
+        if type(node) is AJumpToSubroutine:
             paramcount = self.subdata.get_state(self.nodedata.get_destination(node)).get_param_count()
+            remove_last_exp = self.remove_last_exp
             i = 0
             while i < paramcount:
-                exp = self.remove_last_exp(False)
-                i += self.get_exp_size(exp)
+                exp = remove_last_exp(False)
+                # A variable reference covers as many params as the variable has slots
+                i += exp.var().size() if exp.KIND == KIND_VAR_REF else 1
                 params.append(exp)
         return params
 
-    def get_exp_size(self, exp):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_const import AConst  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        if isinstance(exp, AVarRef):
-            return exp.var().size()
-        if isinstance(exp, AConst):
-            return 1
-        return 1
-
     def remove_action_params(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_action_command import AActionCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_vector_const_exp import AVectorConstExp  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
         params = []
-        if isinstance(node, AActionCommand):
+        if type(node) is AActionCommand:
             paramtypes = NodeUtils.get_action_param_types(node, self.actions)
             paramcount = NodeUtils.get_action_param_count(node)
+            remove_last_exp = self.remove_last_exp
             for i in range(paramcount):
-                paramtype = paramtypes[i]
-                if paramtype.equals(-16):
+                if paramtypes[i].type == _T_VECTOR:
                     exp = self.get_last_exp()
-                    if exp.stackentry().type().equals(-16) or exp.stackentry().type().equals(-15):
-                        exp = self.remove_last_exp(False)
+                    if exp.stackentry().type().type in (_T_VECTOR, _T_STRUCT):
+                        exp = remove_last_exp(False)
                     else:
-                        exp = AVectorConstExp(self.remove_last_exp(False), self.remove_last_exp(False), self.remove_last_exp(False))
+                        exp = self._new(AVectorConstExp, remove_last_exp(False), remove_last_exp(False), remove_last_exp(False))
                 else:
-                    exp = self.remove_last_exp(False)
+                    exp = remove_last_exp(False)
                 params.append(exp)
         return params
 
     def get_fcn_id(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_jump_to_subroutine import AJumpToSubroutine  # pyright: ignore[reportMissingImports]
-        if isinstance(node, AJumpToSubroutine):
+        if type(node) is AJumpToSubroutine:
             return self.subdata.get_state(self.nodedata.get_destination(node)).get_id()
         return 0
 
+    def _previous_command(self, node):
+        cache = self._prev_cmd_cache
+        entry = cache.get(id(node))
+        # The node is kept in the entry so a reused id is never taken for a hit.
+        if entry is None or entry[0] is not node:
+            entry = (node, NodeUtils.get_previous_command(node, self.nodedata))
+            cache[id(node)] = entry
+        return entry[1]
+
     def get_fcn_type(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_jump_to_subroutine import AJumpToSubroutine  # pyright: ignore[reportMissingImports]
-        if isinstance(node, AJumpToSubroutine):
+        if type(node) is AJumpToSubroutine:
             return self.subdata.get_state(self.nodedata.get_destination(node)).type()
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
-        return Type(0)
+        return Type.get(0)
 
     def get_next_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_jump_command import AJumpCommand  # pyright: ignore[reportMissingImports]
-        if isinstance(node, AJumpCommand):
+        if type(node) is AJumpCommand:
             return self.nodedata.get_pos(node) + 6
         return 0
 
     def get_prior_to_dest_command(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_jump_command import AJumpCommand  # pyright: ignore[reportMissingImports]
-        if isinstance(node, AJumpCommand):
+        if type(node) is AJumpCommand:
             return self.nodedata.get_pos(self.nodedata.get_destination(node)) - 2
         return 0
 
@@ -904,83 +939,72 @@ class SubScriptState:
         pass
 
     def update_struct_var(self, node):
-        from pykotor.resource.formats.ncs.dencs.node.a_destruct_command import ADestructCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.stack.var_struct import VarStruct  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if isinstance(node, ADestructCommand):
+        if type(node) is ADestructCommand:
             varref = self.get_last_exp()
-            if isinstance(varref, AVarRef):
+            if type(varref) is AVarRef:
                 removesize = NodeUtils.stack_size_to_pos(node.get_size_rem())
                 savestart = NodeUtils.stack_size_to_pos(node.get_offset())
                 savesize = NodeUtils.stack_size_to_pos(node.get_size_save())
                 if savesize > 1:
                     raise RuntimeError("Ah-ha!  A nested struct!  Now I have to code for that.  *sob*")
-                if isinstance(varref.var(), VarStruct):
+                if type(varref.var()) is VarStruct:
                     self.set_var_struct_name(varref.var())
                 var: Variable = self.stack.get(removesize - savestart)
                 varref.choose_struct_element(var)
 
     def at_last_command(self, node) -> bool:
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_else import AElse  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_if import AIf  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_sub import ASub  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch_case import ASwitchCase  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if self.nodedata.get_pos(node) == self.current.get_end():
+        node_pos = self.nodedata.get_pos(node)
+        if node_pos == self.current.get_end():
             return True
-        if isinstance(self.current, ASwitchCase):
+        kind = self.current.KIND
+        if kind == KIND_SWITCH_CASE:
             parent = self.current.parent()
-            if isinstance(parent, ASwitch) and parent.end() == self.nodedata.get_pos(node):
+            if type(parent) is ASwitch and parent.end() == node_pos:
                 return True
-        if isinstance(self.current, ASub):
+        if type(self.current) is ASub:
             next_node: Node = NodeUtils.get_next_command(node, self.nodedata)
             if next_node is None:
                 return True
-        if isinstance(self.current, AIf) or isinstance(self.current, AElse):
+        if kind == KIND_IF or type(self.current) is AElse:
             next_node: Node = NodeUtils.get_next_command(node, self.nodedata)
             if next_node is not None and self.nodedata.get_pos(next_node) == self.current.get_end():
                 return True
         return False
 
     def is_middle_of_return(self, node) -> bool:
-        from pykotor.resource.formats.ncs.dencs.node.a_jump_command import AJumpCommand  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.node.a_return import AReturn  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_return_statement import AReturnStatement  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.utils.node_utils import NodeUtils  # pyright: ignore[reportMissingImports]
-        if not self.root.type().equals(0) and self.current.has_children() and isinstance(self.current.get_last_child(), AReturnStatement):
+        if self.root.type().type != _T_VOID and type(self.current.get_last_child()) is AReturnStatement:
             return True
-        if self.root.type().equals(0):
+        if self.root.type().type == _T_VOID:
             next_node: Node = NodeUtils.get_next_command(node, self.nodedata)
-            if next_node is not None and isinstance(next_node, AJumpCommand) and isinstance(self.nodedata.get_destination(next_node), AReturn):
+            if next_node is not None and type(next_node) is AJumpCommand and type(self.nodedata.get_destination(next_node)) is AReturn:
                 return True
         return False
 
     def current_contains_vars(self, vars_list) -> bool:
+        current = self.current
+        # Nodes already shown to sit under current, so later walks can stop as soon as they reach one.
+        inside: set[int] = set()
         for var in vars_list:
             if var.is_param():
                 continue
             vardec: AVarDecl = self.vardecs.get(var)
             if vardec is None:
                 continue
-            parent: ScriptNode = vardec.parent()
-            found = False
-            while parent is not None and not found:
-                if parent == self.current:
-                    found = True
-                else:
-                    parent = parent.parent()
-            if not found:
+            walked = []
+            parent: ScriptNode = vardec.get_parent()
+            while parent is not None and parent is not current and id(parent) not in inside:
+                walked.append(id(parent))
+                parent = parent.get_parent()
+            if parent is None:
                 return False
+            inside.update(walked)
         return True
 
     def removing_switch_var(self, vars_list, node) -> bool:
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_switch import ASwitch  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
-        if len(vars_list) == 1 and self.current.has_children() and isinstance(self.current.get_last_child(), ASwitch):
-            exp: AExpression = self.current.get_last_child().switch_exp()
-            if isinstance(exp, AVarRef) and exp.var().equals(vars_list[0]):
+        last = self.current.get_last_child()
+        if len(vars_list) == 1 and type(last) is ASwitch:
+            exp: AExpression = last.switch_exp()
+            if type(exp) is AVarRef and exp.var().equals(vars_list[0]):
                 return True
         return False
 
@@ -997,13 +1021,11 @@ class SubScriptState:
         return earliestdec
 
     def get_previous_exp(self, pos: int):
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_expression import AExpression  # pyright: ignore[reportMissingImports]
-        from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
         node: ScriptNode = self.current.get_previous_child(pos)
         if node is None:
             return None
-        if isinstance(node, AVarDecl) and node.is_fcn_return():
+        if type(node) is AVarDecl and node.is_fcn_return():
             return node.exp()
-        if not isinstance(node, AExpression):
+        if not node.IS_EXPRESSION:
             return None
         return node
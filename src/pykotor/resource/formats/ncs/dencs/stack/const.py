@@ -10,6 +10,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class Const(StackEntry):
+    __slots__ = ()
+
     @staticmethod
     def new_const(type: Type, value: object) -> Const:
         if type.byte_value() == 3:
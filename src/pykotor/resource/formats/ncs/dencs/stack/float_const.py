@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
+
+_TYPE = Type.get(4)
 
 
 class FloatConst(Const):
+    __slots__ = ("_value",)
+
     def __init__(self, value: object):
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         super().__init__()
-        self._type = Type(4)
+        self._type = _TYPE
         self._value: float = float(value) if isinstance(value, (int, float, str)) else 0.0
         self._size = 1
 
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
+
+# Const types are never modified, so all int constants can share one Type instance
+_TYPE = Type.get(3)
+
+# -1 as an unsigned 32-bit value, which is written back out in hex
+_FFFFFFFF = 0xFFFFFFFF
 
 
 class IntConst(Const):
+    __slots__ = ("_value",)
+
     def __init__(self, value: object):
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         super().__init__()
-        self._type = Type(3)
+        self._type = _TYPE
         self._value: int = int(value) if isinstance(value, (int, str)) else 0
         self._size = 1
 
@@ -15,7 +23,7 @@ class IntConst(Const):
         return self._value
 
     def __str__(self) -> str:
-        if self._value == int("FFFFFFFF", 16):
+        if self._value == _FFFFFFFF:
             return "0xFFFFFFFF"
         return str(self._value)
 
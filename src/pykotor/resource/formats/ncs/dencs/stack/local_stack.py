@@ -2,6 +2,10 @@ from __future__ import annotations
 
 
 class LocalStack:
+    """Base for the decompiler's stacks. The top entry is the end of the list, so pushes and pops never shift the others."""
+
+    __slots__ = ("stack",)
+
     def __init__(self):
         self.stack: list = []
 
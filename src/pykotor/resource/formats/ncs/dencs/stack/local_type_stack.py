@@ -1,71 +1,92 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.stack.local_stack import LocalStack  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.utils.subroutine_state import SubroutineState  # pyright: ignore[reportMissingImports]
-    from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class LocalTypeStack(LocalStack):
+    __slots__ = ("_below",)
+
     def __init__(self):
         super().__init__()
+        # _below[i] is the total size of the entries under stack[i]; the last item is the full stack size.
+        self._below: list[int] = [0]
+
+    def _resync(self, lo: int):
+        below = self._below
+        del below[lo + 1:]
+        total = below[-1]
+        for type_val in self.stack[lo:]:
+            total += type_val.size()
+            below.append(total)
 
     def push(self, type: Type):
-        self.stack.insert(0, type)
+        self.stack.append(type)
+        below = self._below
+        below.append(below[-1] + type.size())
 
     def get(self, offset: int, state: SubroutineState | None = None) -> Type:
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
-        pos = 0
-        for type_val in self.stack:
-            pos += type_val.size()
-            if pos > offset:
-                return type_val.get_element(pos - offset + 1)
-            if pos == offset:
-                return type_val.get_element(1)
+        below = self._below
+        total = below[-1]
+        # The entry holding the slot is the highest one with no more than (total - offset) beneath it.
+        i = bisect_right(below, total - offset, 0, len(self.stack)) - 1
+        if i >= 0:
+            return self.stack[i].get_element(total - below[i] - offset + 1)
         if state is not None and state.is_prototyped():
-            type_val = state.get_param_type(offset - pos)
+            type_val = state.get_param_type(offset - total)
             if not type_val.equals(0):
                 return type_val
-        return Type(-1)
+        return Type.get(-1)
 
     def remove(self, count: int = 1, start: int = -1):
-        if start >= 0:
-            # Remove from specific start position
-            loc = start - 1
-            for _ in range(count):
-                if loc < len(self.stack):
-                    self.stack.pop(loc)
-        else:
-            # Remove from front (count items)
-            for _ in range(count):
-                if self.stack:
-                    self.stack.pop(0)
+        stack = self.stack
+        if start == 0:
+            # A start of 0 has always meant the bottom of the stack
+            if count > len(stack):
+                # Running out of entries here means the type stack is out of step with the code
+                stack.clear()
+                self._resync(0)
+                raise IndexError(f"cannot remove {count} entries from the bottom of the type stack")
+            if count > 0:
+                del stack[:count]
+                self._resync(0)
+            return
+        # Positions count down from the top, so the block ends (start - 1) entries before the tail.
+        hi = len(stack) - (start - 1 if start > 0 else 0)
+        if hi > 0:
+            lo = max(hi - count, 0)
+            del stack[lo:hi]
+            self._resync(lo)
 
     def remove_params(self, count: int, state: SubroutineState):
-        params = []
-        for _ in range(count):
-            if self.stack:
-                type_val = self.stack.pop(0)
-                params.insert(0, type_val)
+        stack = self.stack
+        cut = max(len(stack) - count, 0)
+        params = stack[cut:]
+        del stack[cut:]
+        del self._below[cut + 1:]
         state.update_params(params)
 
     def remove_prototyping(self, count: int) -> int:
         params = 0
         i = 0
+        stack = self.stack
         while i < count:
-            if not self.stack:
+            if not stack:
                 params += 1
                 i += 1
             else:
-                type_val = self.stack.pop(0)
+                type_val = stack.pop()
                 i += type_val.size()
+        del self._below[len(stack) + 1:]
         return params
 
     def clone(self):
-        from pykotor.resource.formats.ncs.dencs.stack.local_type_stack import LocalTypeStack  # pyright: ignore[reportMissingImports]
         new_stack = LocalTypeStack()
         new_stack.stack = list(self.stack)
+        new_stack._below = list(self._below)
         return new_stack
-
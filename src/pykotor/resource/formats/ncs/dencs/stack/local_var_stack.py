@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.stack.local_stack import LocalStack  # pyright: ignore[reportMissingImports]
@@ -11,10 +12,20 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class LocalVarStack(LocalStack):
+    __slots__ = ("_below",)
+
     def __init__(self):
         super().__init__()
-        # Use list like LocalStack, but we'll use insert(0, ...) and pop(0) for addFirst/removeFirst semantics
-        self.stack = []
+        # _below[i] is the total size of the entries under stack[i]; the last item is the full stack size.
+        self._below: list[int] = [0]
+
+    def _resync(self, lo: int):
+        below = self._below
+        del below[lo + 1:]
+        total = below[-1]
+        for entry in self.stack[lo:]:
+            total += entry._size
+            below.append(total)
 
     def close(self):
         if self.stack is not None:
@@ -35,24 +46,23 @@ class LocalVarStack(LocalStack):
             self.stack = None
 
     def size(self) -> int:
-        size = 0
-        for entry in self.stack:
-            size += entry.size()
-        return size
+        return self._below[-1]
 
     def push(self, entry: StackEntry):
-        self.stack.insert(0, entry)
+        self.stack.append(entry)
+        below = self._below
+        # Entries keep their size in _size and never override size(), so it is read directly in the stack walks.
+        below.append(below[-1] + entry._size)
         entry.added_to_stack(self)
 
     def get(self, offset: int) -> StackEntry:
-        pos = 0
-        for entry in self.stack:
-            pos += entry.size()
-            if pos > offset:
-                return entry.get_element(pos - offset + 1)
-            if pos == offset:
-                return entry.get_element(1)
-        raise RuntimeError(f"offset {offset} was greater than stack size {pos}")
+        below = self._below
+        total = below[-1]
+        # The entry holding the slot is the highest one with no more than (total - offset) beneath it.
+        i = bisect_right(below, total - offset, 0, len(self.stack)) - 1
+        if i < 0:
+            raise RuntimeError(f"offset {offset} was greater than stack size {total}")
+        return self.stack[i].get_element(total - below[i] - offset + 1)
 
     def get_type(self, offset: int) -> Type:
         return self.get(offset).type()
@@ -60,50 +70,63 @@ class LocalVarStack(LocalStack):
     def remove(self) -> StackEntry:
         if not self.stack:
             raise RuntimeError("Cannot remove from empty stack")
-        entry = self.stack.pop(0)
+        entry = self.stack.pop()
+        del self._below[-1]
         entry.removed_from_stack(self)
         return entry
 
+    def drop(self) -> StackEntry:
+        """Pop the top entry without telling it that it left the stack."""
+        del self._below[-1]
+        return self.stack.pop()
+
     def destruct(self, removesize: int, savestart: int, savesize: int, subdata: SubroutineAnalysisData):
+        savefirst = removesize - (savestart + savesize) + 1
         self.structify(1, removesize, subdata)
         if savesize > 1:
-            self.structify(removesize - (savestart + savesize) + 1, savesize, subdata)
-        struct = self.stack[0]
-        element = struct.get_element(removesize - (savestart + savesize) + 1)
-        self.stack[0] = element
+            self.structify(savefirst, savesize, subdata)
+        stack = self.stack
+        stack[-1] = stack[-1].get_element(savefirst)
+        self._resync(len(self.stack) - 1)
 
     def structify(self, firstelement: int, count: int, subdata: SubroutineAnalysisData) -> VarStruct | None:
-        pos = 0
-        stack_list = list(self.stack)
-        for i, entry in enumerate(stack_list):
-            pos += entry.size()
-            if pos == firstelement:
-                varstruct = VarStruct()
-                varstruct.add_var_stack_order(entry)  # type: ignore
-                stack_list[i] = varstruct
-                j = i + 1
-                while j < len(stack_list) and pos <= firstelement + count - 1:
-                    entry = stack_list[j]
-                    pos += entry.size()
-                    if pos <= firstelement + count - 1:
-                        varstruct.add_var_stack_order(entry)  # type: ignore
-                        stack_list.pop(j)
-                    else:
-                        break
-                self.stack = stack_list
-                subdata.add_struct(varstruct)
-                return varstruct
-            if pos == firstelement + count - 1:
-                return entry  # type: ignore
-            if pos > firstelement + count - 1:
-                return entry.structify(firstelement - (pos - entry.size()), count, subdata)  # type: ignore
-        return None
+        stack = self.stack
+        below = self._below
+        total = below[-1]
+        last = firstelement + count - 1
+        # Slots are counted from the top, so stack[i] ends at slot (total - below[i]).
+        i = bisect_right(below, total - firstelement, 0, len(stack)) - 1
+        if i < 0:
+            return None
+        pos = total - below[i]
+        if pos == firstelement:
+            # Every entry below this one that still ends within the struct becomes a member
+            j = bisect_left(below, total - last, 0, i)
+            varstruct = VarStruct()
+            varstruct.add_var_stack_order(stack[i])  # type: ignore
+            for member in reversed(stack[j:i]):
+                varstruct.add_var_stack_order(member)  # type: ignore
+            stack[i] = varstruct
+            del stack[j:i]
+            self._resync(j)
+            subdata.add_struct(varstruct)
+            return varstruct
+        if pos < last:
+            i = bisect_right(below, total - last, 0, i) - 1
+            if i < 0:
+                return None
+            pos = total - below[i]
+        entry = stack[i]
+        if pos == last:
+            return entry  # type: ignore
+        return entry.structify(firstelement - (pos - entry._size), count, subdata)  # type: ignore
 
     def clone(self):
         from pykotor.resource.formats.ncs.dencs.stack.local_var_stack import LocalVarStack  # pyright: ignore[reportMissingImports]
         from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
         new_stack = LocalVarStack()
         new_stack.stack = list(self.stack)
+        new_stack._below = list(self._below)
         for entry in self.stack:
             if isinstance(entry, Variable):
                 entry.stack_was_cloned(self, new_stack)
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
+
+_TYPE = Type.get(6)
+
+# Names of the object constants the engine predefines, indexed by value
+_OBJECT_NAMES = ("OBJECT_SELF", "OBJECT_INVALID")
 
 
 class ObjectConst(Const):
+    __slots__ = ("_value",)
+
     def __init__(self, value: object):
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         super().__init__()
-        self._type = Type(6)
+        self._type = _TYPE
         self._value: int = int(value) if isinstance(value, (int, str)) else 0
         self._size = 1
 
@@ -15,9 +22,8 @@ class ObjectConst(Const):
         return self._value
 
     def __str__(self) -> str:
-        if self._value == 0:
-            return "OBJECT_SELF"
-        if self._value == 1:
-            return "OBJECT_INVALID"
-        return str(self._value)
+        value = self._value
+        if 0 <= value < len(_OBJECT_NAMES):
+            return _OBJECT_NAMES[value]
+        return str(value)
 
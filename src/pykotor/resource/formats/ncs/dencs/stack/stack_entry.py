@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class StackEntry(ABC):
+    __slots__ = ("_type", "_size")
+
     def __init__(self):
         self._type: Type | None = None
         self._size: int = 0
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 from pykotor.resource.formats.ncs.dencs.stack.const import Const  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
+
+_TYPE = Type.get(5)
 
 
 class StringConst(Const):
+    __slots__ = ("_value",)
+
     def __init__(self, value: object):
-        from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         super().__init__()
-        self._type = Type(5)
+        self._type = _TYPE
         if isinstance(value, str):
-            if value.startswith('"') and value.endswith('"'):
-                self._value: str = value[1:-1]
-            else:
-                self._value = value
+            # Slicing keeps the empty-string case safe without separate startswith/endswith calls
+            self._value: str = value[1:-1] if value[:1] == '"' == value[-1:] else value
         else:
             self._value = str(value)
         self._size = 1
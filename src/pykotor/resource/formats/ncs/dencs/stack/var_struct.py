@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from itertools import count
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
@@ -9,14 +11,24 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.utils.struct_type import StructType  # pyright: ignore[reportMissingImports]
     from pykotor.resource.formats.ncs.dencs.utils.subroutine_analysis_data import SubroutineAnalysisData  # pyright: ignore[reportMissingImports]
 
+# Struct identities are plain ints so merge checks compare numbers instead of calling methods.
+_struct_ids = count()
+
+
 class VarStruct(Variable):
+    __slots__ = ("vars", "structtype", "_id", "_names_dirty", "_names_revision")
+
     def __init__(self, structtype: StructType | None = None):
         from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
         from pykotor.resource.formats.ncs.dencs.utils.struct_type import StructType  # pyright: ignore[reportMissingImports]
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
-        super().__init__(Type(-15))
+        super().__init__(Type.get(-15))
         self.vars: list[Variable] = []
         self._size = 0
+        self._id: int = next(_struct_ids)
+        # Member names come from the struct type, so they only need redoing after the members change
+        self._names_dirty: bool = True
+        self._names_revision: int = -1
         if structtype is None:
             self.structtype = StructType()
         else:
@@ -29,34 +41,54 @@ class VarStruct(Variable):
 
     def close(self):
         super().close()
-        if self.vars is not None:
-            for var in self.vars:
-                var.close()
-        self.vars = None
+        for var in self.vars or ():
+            var.close()
         if self.structtype is not None:
             self.structtype.close()
-        self.structtype = None
+        self.vars = self.structtype = None
 
     def add_var(self, var: Variable):
         self.vars.insert(0, var)
+        self._names_dirty = True
         var.set_varstruct(self)
         self.structtype.add_type(var.type())
         self._size += var.size()
 
+    def add_vars(self, vars: list[Variable]):
+        """Equivalent to add_var on each var in turn."""
+        structtype = self.structtype
+        for var in vars:
+            var.set_varstruct(self)
+            structtype.add_type(var.type())
+            self._size += var.size()
+        self.vars[:0] = vars[::-1]
+        self._names_dirty = True
+
     def add_var_stack_order(self, var: Variable):
         self.vars.append(var)
+        self._names_dirty = True
         var.set_varstruct(self)
         self.structtype.add_type_stack_order(var.type())
         self._size += var.size()
 
+    def add_vars_stack_order(self, vars: list[Variable]):
+        """Equivalent to add_var_stack_order on each var in turn."""
+        for var in vars:
+            var.set_varstruct(self)
+        self.structtype.add_types_stack_order([var.type() for var in vars])
+        self._size += sum([var._size for var in vars])
+        self.vars.extend(vars)
+        self._names_dirty = True
+
     def set_name(self, prefix: str, count: int):
-        self._name = prefix + "struct" + str(count)
+        self._name = sys.intern(prefix + "struct" + str(count))
 
     def name(self) -> str:
         return self._name
 
     def set_struct_type(self, structtype: StructType):
         self.structtype = structtype
+        self._names_dirty = True
 
     def __str__(self) -> str:
         return str(self._name) if self._name is not None else ""
@@ -68,13 +100,21 @@ class VarStruct(Variable):
         return str(self.structtype.to_decl_string()) + " " + str(self._name)
 
     def update_names(self):
-        if self.structtype.is_vector():
+        structtype = self.structtype
+        # do_types fills in member types on the struct type itself, which this struct never hears about
+        if not self._names_dirty and self._names_revision == structtype.revision:
+            return
+        if structtype.is_vector():
             self.vars[0].set_name("z")
             self.vars[1].set_name("y")
             self.vars[2].set_name("x")
         else:
-            for i in range(len(self.vars)):
-                self.vars[i].set_name(self.structtype.element_name(len(self.vars) - i - 1))
+            top = len(self.vars) - 1
+            element_name = structtype.element_name
+            for i, var in enumerate(self.vars):
+                var.set_name(element_name(top - i))
+        self._names_dirty = False
+        self._names_revision = structtype.revision
 
     def assign(self):
         for var in self.vars:
@@ -85,7 +125,9 @@ class VarStruct(Variable):
             var.added_to_stack(stack)
 
     def contains(self, var: Variable) -> bool:
-        return var in self.vars
+        # Members point back at the struct holding them, so only nested structs (which are never
+        # given a parent) need the list scan.
+        return getattr(var, "_varstruct", None) is self or var in self.vars
 
     def struct_type(self) -> StructType:
         return self.structtype
@@ -94,7 +136,7 @@ class VarStruct(Variable):
         pos = 0
         for i in range(len(self.vars) - 1, -1, -1):
             entry = self.vars[i]
-            pos += entry.size()
+            pos += entry._size
             if pos == stackpos:
                 return entry.get_element(1)
             if pos > stackpos:
@@ -102,23 +144,30 @@ class VarStruct(Variable):
         raise RuntimeError("Stackpos was greater than stack size")
 
     def structify(self, firstelement: int, count: int, subdata: SubroutineAnalysisData) -> VarStruct:
+        vars = self.vars
+        last = firstelement + count - 1
         pos = 0
-        for i, entry in enumerate(self.vars):
-            pos += entry.size()
+        for i, entry in enumerate(vars):
+            pos += entry._size
             if pos == firstelement:
+                # Find where the absorbed run ends first, then move it over as one slice
+                j = i + 1
+                n = len(vars)
+                while j < n and pos <= last:
+                    pos += vars[j]._size
+                    j += 1
+                absorbed = vars[i + 1:j]
+                del vars[i + 1:j]
                 varstruct = VarStruct()
                 varstruct.add_var_stack_order(entry)
-                self.vars[i] = varstruct
-                j = i + 1
-                while j < len(self.vars) and pos <= firstelement + count - 1:
-                    entry = self.vars.pop(j)
-                    pos += entry.size()
-                    varstruct.add_var_stack_order(entry)
+                varstruct.add_vars_stack_order(absorbed)
+                vars[i] = varstruct
+                self._names_dirty = True
                 subdata.add_struct(varstruct)
                 return varstruct
-            if pos == firstelement + count - 1:
+            if pos == last:
                 return entry
-            if pos > firstelement + count - 1:
-                return entry.structify(firstelement - (pos - entry.size()), count, subdata)
+            if pos > last:
+                return entry.structify(firstelement - (pos - entry._size), count, subdata)
         return None
 
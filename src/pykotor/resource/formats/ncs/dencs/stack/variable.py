@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 from pykotor.resource.formats.ncs.dencs.stack.stack_entry import StackEntry  # pyright: ignore[reportMissingImports]
@@ -11,6 +12,8 @@ if TYPE_CHECKING:
     from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
 
 class Variable(StackEntry):
+    __slots__ = ("_varstruct", "_assigned", "function", "_stack0", "_count0", "stackcounts", "_name")
+
     FCN_NORMAL = 0
     FCN_RETURN = 1
     FCN_PARAM = 2
@@ -19,27 +22,51 @@ class Variable(StackEntry):
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         super().__init__()
         if isinstance(var_type, int):
-            self._type = Type(var_type)
+            self._type = Type.get(var_type)
         else:
             self._type = var_type
         self._varstruct: VarStruct | None = None
         self._assigned: bool = False
         self._size = 1
         self.function: int = 0
-        self.stackcounts: dict[LocalStack, int] = {}
+        # A variable usually sits on one stack at a time, so the first stack it lands on is counted in
+        # these two slots and only any further stacks go into the (lazily created) stackcounts dict.
+        self._stack0: LocalStack | None = None
+        self._count0: int = 0
+        self.stackcounts: dict[LocalStack, int] | None = None
         self._name: str | None = None
 
     def close(self):
         super().close()
-        self.stackcounts = None
-        self._varstruct = None
+        self.stackcounts = self._stack0 = self._varstruct = None
 
     def done_parse(self):
-        self.stackcounts = None
+        self.stackcounts = self._stack0 = None
 
     def done_with_stack(self, stack: LocalVarStack):
-        if stack in self.stackcounts:
-            del self.stackcounts[stack]
+        if stack is self._stack0:
+            self._stack0 = None
+            self._count0 = 0
+        elif self.stackcounts:
+            self.stackcounts.pop(stack, None)
+
+    def _get_count(self, stack: LocalStack) -> int:
+        if stack is self._stack0:
+            return self._count0
+        stackcounts = self.stackcounts
+        return stackcounts.get(stack, 0) if stackcounts else 0
+
+    def _set_count(self, stack: LocalStack, count: int):
+        stackcounts = self.stackcounts
+        if stack is self._stack0:
+            self._count0 = count
+        elif self._stack0 is None and not (stackcounts and stack in stackcounts):
+            self._stack0 = stack
+            self._count0 = count
+        elif stackcounts is None:
+            self.stackcounts = {stack: count}
+        else:
+            stackcounts[stack] = count
 
     def set_return(self, isreturn: bool):
         if isreturn:
@@ -75,30 +102,41 @@ class Variable(StackEntry):
         return self._varstruct
 
     def added_to_stack(self, stack: LocalStack):
-        count = self.stackcounts.get(stack, 0)
-        self.stackcounts[stack] = count + 1
+        if stack is self._stack0:
+            self._count0 += 1
+        else:
+            self._set_count(stack, self._get_count(stack) + 1)
 
     def removed_from_stack(self, stack: LocalStack):
-        count = self.stackcounts.get(stack, 0)
-        if count == 0:
-            if stack in self.stackcounts:
-                del self.stackcounts[stack]
-        else:
-            self.stackcounts[stack] = count - 1
+        # A count of zero reads the same as no entry, so it is left in place rather than deleted.
+        if stack is self._stack0:
+            if self._count0 > 0:
+                self._count0 -= 1
+            return
+        stackcounts = self.stackcounts
+        if stackcounts:
+            count = stackcounts.get(stack, 0)
+            if count == 0:
+                stackcounts.pop(stack, None)
+            else:
+                stackcounts[stack] = count - 1
 
     def is_placeholder(self, stack: LocalStack) -> bool:
-        count = self.stackcounts.get(stack, 0)
-        return count == 0 and not self._assigned
+        return self._get_count(stack) == 0 and not self._assigned
 
     def is_on_stack(self, stack: LocalStack) -> bool:
-        count = self.stackcounts.get(stack, 0)
-        return count > 0
+        return self._get_count(stack) > 0
 
     def set_name(self, name: str):
         self._name = name
+        if self._varstruct is not None:
+            # The struct puts its own member names back the next time the member is printed
+            self._varstruct._names_dirty = True
 
     def set_name_with_hint(self, prefix: str, hint: int):
-        self._name = prefix + str(self._type) + str(hint)
+        self._name = sys.intern(prefix + str(self._type) + str(hint))
+        if self._varstruct is not None:
+            self._varstruct._names_dirty = True
 
     def name(self) -> str | None:
         return self._name
@@ -121,7 +159,7 @@ class Variable(StackEntry):
         return str(self._type) + " " + str(self._name)
 
     def stack_was_cloned(self, oldstack: LocalStack, newstack: LocalStack):
-        count = self.stackcounts.get(oldstack, 0)
+        count = self._get_count(oldstack)
         if count > 0:
-            self.stackcounts[newstack] = count
+            self._set_count(newstack, count)
 
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import unittest
+
+from pykotor.resource.formats.ncs.dencs.node.a_return import AReturn  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.a_rsadd_command import ARsaddCommand  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.t_semi import TSemi  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.token import Token  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_const import AConst  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_sub import ASub  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_decl import AVarDecl  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptnode.a_var_ref import AVarRef  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptutils.cleanup_pass import CleanupPass  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.scriptutils.sub_script_state import SubScriptState  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.int_const import IntConst  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.local_type_stack import LocalTypeStack  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.local_var_stack import LocalVarStack  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.var_struct import VarStruct  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.stack.variable import Variable  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.node_analysis_data import NodeAnalysisData  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
+
+
+class TestTokenPool(unittest.TestCase):
+    def tearDown(self):
+        Token.clear_pools()
+
+    def test_attached_token_is_not_pooled(self):
+        ret = AReturn()
+        semi = TSemi()
+        ret.set_semi(semi)
+        semi.release()
+        self.assertIsNot(TSemi(), semi)
+        self.assertIs(ret.get_semi(), semi)
+
+    def test_cleared_pool_hands_out_nothing(self):
+        semi = TSemi()
+        semi.release()
+        Token.clear_pools()
+        fresh = TSemi()
+        self.assertIsNot(fresh, semi)
+        fresh.release()
+        self.assertIs(TSemi(3, 4), fresh)
+        self.assertEqual((fresh.get_line(), fresh.get_pos()), (3, 4))
+
+
+class TestLocalTypeStack(unittest.TestCase):
+    def _stack(self, *type_vals: int) -> LocalTypeStack:
+        stack = LocalTypeStack()
+        for type_val in type_vals:
+            stack.push(Type.get(type_val))
+        return stack
+
+    def test_remove_from_bottom(self):
+        stack = self._stack(3, 4, 5)
+        stack.remove(2, 0)
+        self.assertEqual([type_val.type for type_val in stack.stack], [5])
+        self.assertEqual(stack.size(), 1)
+
+    def test_remove_past_bottom_raises(self):
+        stack = self._stack(3, 4)
+        with self.assertRaises(IndexError):
+            stack.remove(3, 0)
+        self.assertEqual(stack.stack, [])
+        self.assertEqual(stack.size(), 0)
+
+    def test_remove_from_position_stops_at_bottom(self):
+        stack = self._stack(3, 4, 5)
+        stack.remove(5, 2)
+        self.assertEqual([type_val.type for type_val in stack.stack], [5])
+
+
+class TestVarStruct(unittest.TestCase):
+    def test_contains_members(self):
+        struct = VarStruct()
+        member = Variable(3)
+        struct.add_var(member)
+        self.assertTrue(struct.contains(member))
+        self.assertFalse(struct.contains(Variable(3)))
+
+    def test_contains_const(self):
+        struct = VarStruct()
+        struct.add_var(Variable(3))
+        self.assertFalse(struct.contains(IntConst(1)))
+
+    def test_choose_const_element(self):
+        struct = VarStruct()
+        struct.add_var(Variable(3))
+        with self.assertRaises(RuntimeError):
+            AVarRef(struct).choose_struct_element(IntConst(1))
+
+    def test_member_names_survive_renames(self):
+        struct = VarStruct()
+        members = [Variable(3), Variable(4)]
+        for member in members:
+            struct.add_var(member)
+        struct.set_name("", 1)
+        names = [str(member) for member in members]
+        members[0].set_name("renamed")
+        self.assertEqual([str(member) for member in members], names)
+        struct.structtype.update_type(0, Type.get(5))
+        members[1].set_name("renamed")
+        self.assertEqual(str(members[1]), names[1])
+
+
+class TestSubScriptStateGlobals(unittest.TestCase):
+    def setUp(self):
+        # A global declared by the globals state, then read inside a subroutine
+        self.nodedata = NodeAnalysisData()
+        node = ARsaddCommand()
+        self.nodedata.set_pos(node, 4)
+        globalstack = LocalVarStack()
+        self.glob = Variable(3)
+        globalstack.push(self.glob)
+        self.globals = SubScriptState(self.nodedata, None, globalstack)
+        self.globals.transform_rs_add(node)
+        self.globaldec = self.globals.root.get_last_child()
+        self.sub = SubScriptState(self.nodedata, None, LocalVarStack())
+
+    def test_global_does_not_limit_block_scope(self):
+        self.assertTrue(self.sub.current_contains_vars([self.glob]))
+
+    def test_placeholder_removal_leaves_global_declaration(self):
+        self.globaldec.set_is_fcn_return(True)
+        self.sub.transform_placeholder_variable_removed(self.glob)
+        self.assertIs(self.globaldec.get_parent(), self.globals.root)
+        self.assertIs(self.globals.vardecs[self.glob], self.globaldec)
+
+
+class TestSubScriptStateNodeReuse(unittest.TestCase):
+    def _state(self) -> SubScriptState:
+        nodedata = NodeAnalysisData()
+        self.node = ARsaddCommand()
+        nodedata.set_pos(self.node, 4)
+        return SubScriptState(nodedata, None, LocalVarStack())
+
+    def _declare(self, state: SubScriptState) -> AVarDecl:
+        var = Variable(3)
+        state.stack.push(var)
+        state.transform_rs_add(self.node)
+        return state.vardecs[var]
+
+    def _drop(self, state: SubScriptState, vardec: AVarDecl):
+        vardec.set_is_fcn_return(True)
+        state.transform_placeholder_variable_removed(vardec.var_var())
+
+    def test_dropped_declaration_is_reused(self):
+        state = self._state()
+        vardec = self._declare(state)
+        self._drop(state, vardec)
+        newdec = self._declare(state)
+        self.assertIs(newdec, vardec)
+        self.assertIs(newdec.get_parent(), state.root)
+        self.assertFalse(newdec.is_fcn_return())
+
+    def test_closed_state_hands_out_nothing(self):
+        # Two subroutines decompiled one after the other in the same process
+        first = self._state()
+        vardec = self._declare(first)
+        kept = self._declare(first)
+        self._drop(first, vardec)
+        first.close()
+        second = self._state()
+        newdec = self._declare(second)
+        self.assertIsNot(newdec, vardec)
+        self.assertIsNot(newdec, kept)
+        self.assertIs(newdec.get_parent(), second.root)
+
+
+class TestCleanupStructDeclarations(unittest.TestCase):
+    def _collapse(self, initialized: bool):
+        # A three-member struct declared member by member as the last statements of a sub
+        state = SubScriptState(None, None, LocalVarStack())
+        root = state.root
+        struct = VarStruct()
+        members = [Variable(4) for _ in range(3)]
+        for member in members:
+            struct.add_var(member)
+        struct.set_name("", 1)
+        root.add_child(AVarDecl(Variable(3)))
+        for member in members:
+            vardec = AVarDecl(member)
+            root.add_child(vardec)
+            state.vardecs[member] = vardec
+        if initialized:
+            state.vardecs[members[0]].initialize_exp(AConst(IntConst(1)))
+        CleanupPass(root, None, None, state).apply()
+        return state, root, members
+
+    def test_merged_declaration(self):
+        for initialized in (False, True):
+            with self.subTest(initialized=initialized):
+                state, root, members = self._collapse(initialized)
+                self.assertEqual(root.size(), 2)
+                structdec = root.get_last_child()
+                self.assertIs(structdec.var_var(), members[0].varstruct())
+                self.assertIs(structdec.get_parent(), root)
+                self.assertEqual(structdec.tabs, "\t")
+                for member in members:
+                    self.assertIsNot(state.vardecs[member], structdec)
+
+
+if __name__ == "__main__":
+    try:
+        import pytest
+    except ImportError: # pragma: no cover
+        unittest.main()
+    else:
+        pytest.main(["-v", __file__])
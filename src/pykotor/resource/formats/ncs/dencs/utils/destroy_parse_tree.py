@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 from pykotor.resource.formats.ncs.dencs.analysis.analysis_adapter import AnalysisAdapter  # pyright: ignore[reportMissingImports]
+from pykotor.resource.formats.ncs.dencs.node.token import Token  # pyright: ignore[reportMissingImports]
 
 
 class DestroyParseTree(AnalysisAdapter):
     def __init__(self):
         super().__init__()
 
+    def _child_tokens(self, node) -> list[Token]:
+        tokens: list[Token] = []
+        for value in vars(node).values():
+            if isinstance(value, Token):
+                tokens.append(value)
+            elif isinstance(value, list):
+                tokens.extend(child for child in value if isinstance(child, Token))
+        return tokens
+
+    def _release(self, tokens: list[Token]):
+        for token in tokens:
+            token.release()
+
     def case_start(self, node):
         node.get_p_program().apply(self)
         node.set_p_program(None)
@@ -20,9 +34,8 @@ class DestroyParseTree(AnalysisAdapter):
             node.get_jump_to_subroutine().apply(self)
         if node.get_return() is not None:
             node.get_return().apply(self)
-        temp = list(node.get_subroutine())
-        for i in range(len(temp)):
-            temp[i].apply(self)
+        for child in node.get_subroutine():
+            child.apply(self)
         node.set_size(None)
         node.set_conditional(None)
         node.set_jump_to_subroutine(None)
@@ -39,9 +52,8 @@ class DestroyParseTree(AnalysisAdapter):
         node.set_return(None)
 
     def case_a_command_block(self, node):
-        temp = list(node.get_cmd())
-        for i in range(len(temp)):
-            temp[i].apply(self)
+        for child in node.get_cmd():
+            child.apply(self)
         from pykotor.resource.formats.ncs.dencs.node.vector import Vector  # pyright: ignore[reportMissingImports]
         node.set_cmd(Vector(1))
 
@@ -155,119 +167,152 @@ class DestroyParseTree(AnalysisAdapter):
         node.set_store_state_command(None)
 
     def case_a_conditional_jump_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_jump_if(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_jump_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_jmp(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_jump_to_subroutine(self, node):
+        tokens = self._child_tokens(node)
         node.set_jsr(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_return(self, node):
+        tokens = self._child_tokens(node)
         node.set_retn(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_copy_down_sp_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_cpdownsp(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_size(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_copy_top_sp_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_cptopsp(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_size(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_copy_down_bp_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_cpdownbp(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_size(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_copy_top_bp_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_cptopbp(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_size(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_move_sp_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_movsp(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_rsadd_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_rsadd(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_const_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_const(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_constant(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_action_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_action(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_id(None)
         node.set_arg_count(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_logii_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_logii_op(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_binary_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_binary_op(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_size(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_unary_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_unary_op(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_stack_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_stack_op(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_offset(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_destruct_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_destruct(None)
         node.set_pos(None)
         node.set_type(None)
@@ -275,18 +320,23 @@ class DestroyParseTree(AnalysisAdapter):
         node.set_offset(None)
         node.set_size_save(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_bp_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_bp_op(None)
         node.set_pos(None)
         node.set_type(None)
         node.set_semi(None)
+        self._release(tokens)
 
     def case_a_store_state_command(self, node):
+        tokens = self._child_tokens(node)
         node.set_storestate(None)
         node.set_pos(None)
         node.set_offset(None)
         node.set_size_bp(None)
         node.set_size_sp(None)
         node.set_semi(None)
+        self._release(tokens)
 
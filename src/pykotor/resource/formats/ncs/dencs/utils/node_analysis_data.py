@@ -55,11 +55,11 @@ class NodeAnalysisData:
 
     def get_pos(self, node: Node) -> int:
         """Get position for a node. Uses id(node) as hash key."""
-        node_id = id(node)
-        data = self.nodedatahash.get(node_id)
-        if data is None:
-            raise RuntimeError("Attempted to read position on a node not in the hashtable.")
-        return data.pos
+        # Called for nearly every command in every pass, so a hit costs a single subscript.
+        try:
+            return self.nodedatahash[id(node)].pos
+        except KeyError:
+            raise RuntimeError("Attempted to read position on a node not in the hashtable.") from None
 
     def set_destination(self, jump: Node, destination: int):
         """Set jump destination for a node. Uses id(node) as hash key."""
@@ -78,11 +78,10 @@ class NodeAnalysisData:
 
     def get_destination(self, node: Node) -> int:
         """Get jump destination for a node. Uses id(node) as hash key."""
-        node_id = id(node)
-        data = self.nodedatahash.get(node_id)
-        if data is None:
-            raise RuntimeError("Attempted to read destination on a node not in the hashtable.")
-        return data.jump_destination
+        try:
+            return self.nodedatahash[id(node)].jump_destination
+        except KeyError:
+            raise RuntimeError("Attempted to read destination on a node not in the hashtable.") from None
 
     def set_code_state(self, node: Node, state: int):
         """Set code state for a node. Uses id(node) as hash key."""
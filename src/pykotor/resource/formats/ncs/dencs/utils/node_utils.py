@@ -296,21 +296,21 @@ class NodeUtils:
     @staticmethod
     def get_param1_size(node) -> int:
         type_val = NodeUtils.get_type(node)
-        if type_val.equals(59) or type_val.equals(58):
+        if type_val.type in (59, 58):
             return 3
         return 1
 
     @staticmethod
     def get_param2_size(node) -> int:
         type_val = NodeUtils.get_type(node)
-        if type_val.equals(60) or type_val.equals(58):
+        if type_val.type in (60, 58):
             return 3
         return 1
 
     @staticmethod
     def get_result_size(node) -> int:
         type_val = NodeUtils.get_type(node)
-        if type_val.equals(60) or type_val.equals(59) or type_val.equals(58):
+        if type_val.type in (60, 59, 58):
             return 3
         return 1
 
@@ -379,6 +379,9 @@ class NodeUtils:
 
     @staticmethod
     def stack_size_to_pos(offset) -> int:
+        # Plain ints are checked first so they skip the failed attribute lookup hasattr() would raise and swallow.
+        if type(offset) is int:
+            return offset // 4
         if hasattr(offset, 'get_text'):
             return int(offset.get_text()) // 4
         return offset // 4
@@ -581,7 +584,7 @@ class NodeUtils:
                 type_val = 5
             else:
                 raise RuntimeError("Unexpected type " + str(nodetype))
-            return Type(type_val)
+            return Type.get(type_val)
         raise RuntimeError("No return type for this node type: " + str(node))
 
     @staticmethod
@@ -11,6 +11,8 @@ class StructType(Type):
         self.size: int = 0
         self.typename: str | None = None
         self.elements: list[str] | None = None
+        # Bumped whenever the member types change, so structs built on this type can tell their member names may be stale
+        self.revision: int = 0
 
     def close(self):
         if self.types is not None:
@@ -31,23 +33,38 @@ class StructType(Type):
     def add_type(self, type_val: Type):
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         self.types.append(type_val)
-        if type_val.equals(Type(-1)):
+        self.revision += 1
+        if type_val.equals(Type.get(-1)):
             self.alltyped = False
         self.size += type_val.size()
 
     def add_type_stack_order(self, type_val: Type):
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         self.types.insert(0, type_val)
-        if type_val.equals(Type(-1)):
+        self.revision += 1
+        if type_val.equals(Type.get(-1)):
             self.alltyped = False
         self.size += type_val.size()
 
+    def add_types_stack_order(self, type_vals: list[Type]):
+        """Equivalent to add_type_stack_order on each type in turn.
+
+        The batched adders here and on VarStruct grow each list with one splice instead of an insert(0) per item.
+        """
+        invalid = Type.get(-1)
+        for type_val in type_vals:
+            if type_val.equals(invalid):
+                self.alltyped = False
+            self.size += type_val.size()
+        self.types[:0] = type_vals[::-1]
+        self.revision += 1
+
     def is_vector(self) -> bool:
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         if self.size != 3:
             return False
         for i in range(3):
-            if not self.types[i].equals(Type(4)):
+            if not self.types[i].equals(Type.get(4)):
                 return False
         return True
 
@@ -56,6 +73,7 @@ class StructType(Type):
 
     def update_type(self, pos: int, type_val: Type):
         self.types[pos] = type_val
+        self.revision += 1
         self.update_typed()
 
     def types(self) -> list[Type]:
@@ -184,7 +184,7 @@ class SubroutineAnalysisData:
         self.mainsub = sub
         if conditional:
             from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
-            self.add_sub_state(self.mainsub, 0, Type(3))
+            self.add_sub_state(self.mainsub, 0, Type.get(3))
         else:
             self.add_sub_state(self.mainsub, 0)
 
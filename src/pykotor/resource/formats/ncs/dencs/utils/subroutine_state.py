@@ -46,7 +46,7 @@ class SubroutineState:
         self.paramstyped: bool = True
         self.paramsize: int = 0
         self.status: int = 0
-        self._type: Type = Type(0)
+        self._type: Type = Type.get(0)
         self.root: Node = root
         self.id: int = id_val
         self.returndepth: int = 0
@@ -152,7 +152,7 @@ class SubroutineState:
             self.paramstyped = False
             if self.returndepth <= params:
                 from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
-                self._type = Type(0)
+                self._type = Type.get(0)
 
     def get_param_count(self) -> int:
         return self.paramsize
@@ -184,7 +184,7 @@ class SubroutineState:
     def get_param_type(self, pos: int) -> Type:
         from pykotor.resource.formats.ncs.dencs.utils.type import Type  # pyright: ignore[reportMissingImports]
         if len(self._params) < pos:
-            return Type(0)
+            return Type.get(0)
         return self._params[pos - 1]
 
     def init_stack(self, stack: LocalTypeStack):
@@ -203,7 +203,7 @@ class SubroutineState:
                     stack.push(self._params[j])
             else:
                 for j in range(self.paramsize):
-                    stack.push(Type(-1))
+                    stack.push(Type.get(-1))
 
     def init_var_stack(self, stack: LocalVarStack):
         from pykotor.resource.formats.ncs.dencs.stack.var_struct import VarStruct  # pyright: ignore[reportMissingImports]
@@ -47,6 +47,18 @@ class Type:
     def parse_type(type_str: str):
         return Type(type_str)
 
+    @staticmethod
+    def get(type_val: int) -> Type:
+        """Return the shared Type for an int type code.
+
+        Plain Types are never modified after construction, so callers that would build a fresh
+        Type(int) can reuse one instance per code instead.
+        """
+        type_obj = _TYPE_CACHE.get(type_val)
+        if type_obj is None:
+            type_obj = _TYPE_CACHE[type_val] = Type(type_val)
+        return type_obj
+
     def close(self):
         pass
 
@@ -207,3 +219,5 @@ class Type:
     def __hash__(self):
         return self.type
 
+
+_TYPE_CACHE: dict[int, Type] = {}